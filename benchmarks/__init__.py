@@ -0,0 +1 @@
+"""Throughput and memory benchmarks for FluxBT (not shipped with the package)."""
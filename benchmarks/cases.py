@@ -0,0 +1,124 @@
+"""Benchmark cases.
+
+Each case is a setup function taking the number of bars and a scratch directory and
+returning a zero-argument callable. Only the callable is timed and traced, so setup
+cost (building frames, writing CSVs) is excluded from bars/sec and the tracemalloc
+peak. Peak RSS is the high-water mark of the whole worker process and includes setup.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+
+import pandas as pd
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.lookback import RollingBarContext
+from fluxbt.core.metrics import compute_metrics
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.loader import CSVLoader
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.strategies.base import BaseStrategy
+from fluxbt.strategies.mean_reversion import MeanReversion
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+Setup = Callable[[int, str], Callable[[], object]]
+
+
+def make_ohlcv(n_bars: int) -> pd.DataFrame:
+    return SyntheticLoader(n_bars=n_bars, freq="1min", seed=0).load()
+
+
+def _engine(strategy: BaseStrategy, block_size: int | None = None) -> Setup:
+    def setup(n_bars: int, workdir: str) -> Callable[[], object]:
+        feed = DataFeed(make_ohlcv(n_bars))
+
+        def run() -> object:
+            engine = BacktestEngine(
+                feed=feed,
+                broker=Broker(slippage_bps=1.0, commission_bps=0.0),
+                strategy=strategy,
+                block_size=block_size,
+            )
+            return engine.run()
+
+        return run
+
+    return setup
+
+
+def _strategy_on_bar(strategy: BaseStrategy) -> Setup:
+    def setup(n_bars: int, workdir: str) -> Callable[[], object]:
+        bars = list(DataFeed(make_ohlcv(n_bars)).iter_bars())
+
+        def run() -> object:
+            strategy.reset()
+            ctx = RollingBarContext(strategy.lookback or 1)
+            strategy.bind(ctx)
+            n_orders = 0
+            for ts, bar in bars:
+                ctx.append(bar)
+                n_orders += len(strategy.on_bar(ts, bar))
+            return n_orders
+
+        return run
+
+    return setup
+
+
+def _feed_iter_bars(n_bars: int, workdir: str) -> Callable[[], object]:
+    feed = DataFeed(make_ohlcv(n_bars))
+
+    def run() -> object:
+        count = 0
+        for _ts, _bar in feed.iter_bars():
+            count += 1
+        return count
+
+    return run
+
+
+def _csv_load(n_bars: int, workdir: str) -> Callable[[], object]:
+    path = os.path.join(workdir, f"ohlcv_{n_bars}.csv")
+    make_ohlcv(n_bars).to_csv(path, index_label="datetime")
+
+    def run() -> object:
+        return CSVLoader(path).load()
+
+    return run
+
+
+def _compute_metrics(n_bars: int, workdir: str) -> Callable[[], object]:
+    equity = make_ohlcv(n_bars)["close"] * 1_000.0
+
+    def run() -> object:
+        return compute_metrics(equity, freq="MIN")
+
+    return run
+
+
+def _plot_equity(n_bars: int, workdir: str) -> Callable[[], object]:
+    from fluxbt.reports.plotting import plot_equity_curve
+
+    equity = make_ohlcv(n_bars)["close"] * 1_000.0
+    path = os.path.join(workdir, "equity.png")
+
+    def run() -> object:
+        return plot_equity_curve(equity, savepath=path)
+
+    return run
+
+
+CASES: dict[str, Setup] = {
+    "engine_sma": _engine(SMACrossover(fast=20, slow=50)),
+    "engine_sma_blocks": _engine(SMACrossover(fast=20, slow=50), block_size=10_000),
+    "engine_meanrev": _engine(MeanReversion(window=20)),
+    "feed_iter_bars": _feed_iter_bars,
+    "csv_load": _csv_load,
+    "compute_metrics": _compute_metrics,
+    "strategy_sma": _strategy_on_bar(SMACrossover(fast=20, slow=50)),
+    "strategy_meanrev": _strategy_on_bar(MeanReversion(window=20)),
+    "plot_equity": _plot_equity,
+}
@@ -0,0 +1,208 @@
+"""Run the benchmark suite, save results as JSON and compare against a baseline.
+
+Usage::
+
+    python -m benchmarks.runner --sizes 10000 100000 1000000 --out bench.json \\
+        --baseline benchmarks/baseline.json --threshold 0.15
+
+Every (case, size) pair runs in a fresh spawned process so that peak RSS is not
+polluted by earlier cases. The process exits non-zero when any pair regresses by
+more than ``--threshold`` relative to the baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from multiprocessing.connection import Connection
+from typing import Any
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+# metric -> True when larger is better
+TRACKED_METRICS: dict[str, bool] = {
+    "bars_per_sec": True,
+    "peak_rss_bytes": False,
+    "alloc_peak_bytes": False,
+}
+
+
+@dataclass
+class BenchResult:
+    case: str
+    size: int
+    status: str  # "ok", "timeout" or "error"
+    seconds: float | None = None
+    bars_per_sec: float | None = None
+    peak_rss_bytes: int | None = None
+    alloc_peak_bytes: int | None = None
+    error: str | None = None
+
+
+def _peak_rss_bytes() -> int | None:
+    """High-water RSS of this process so far, case setup included."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def _measure(case: str, size: int, repeat: int, track_allocs: bool, conn: Connection) -> None:
+    from .cases import CASES
+
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            fn = CASES[case](size, workdir)
+            best = float("inf")
+            for _ in range(max(repeat, 1)):
+                t0 = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - t0)
+            alloc_peak: int | None = None
+            if track_allocs:
+                tracemalloc.start()
+                fn()
+                _, alloc_peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+        result = BenchResult(
+            case=case,
+            size=size,
+            status="ok",
+            seconds=best,
+            bars_per_sec=size / best if best > 0 else float("inf"),
+            peak_rss_bytes=_peak_rss_bytes(),
+            alloc_peak_bytes=alloc_peak,
+        )
+    except Exception as exc:  # noqa: BLE001 - reported back to the parent
+        result = BenchResult(case=case, size=size, status="error", error=repr(exc))
+    conn.send(asdict(result))
+    conn.close()
+
+
+def run_case(
+    case: str, size: int, repeat: int = 1, track_allocs: bool = True, timeout_s: float = 600.0
+) -> BenchResult:
+    ctx = mp.get_context("spawn")
+    recv, send = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_measure, args=(case, size, repeat, track_allocs, send))
+    proc.start()
+    send.close()
+    if not recv.poll(timeout_s):
+        proc.terminate()
+        proc.join()
+        return BenchResult(case=case, size=size, status="timeout")
+    try:
+        payload = recv.recv()
+    except EOFError:  # the child died (crash, OOM kill) before sending a result
+        proc.join()
+        error = f"worker exited with code {proc.exitcode} without a result"
+        return BenchResult(case=case, size=size, status="error", error=error)
+    proc.join()
+    return BenchResult(**payload)
+
+
+def compare(
+    current: list[dict[str, Any]], baseline: list[dict[str, Any]], threshold: float
+) -> list[str]:
+    """Return human-readable regressions of ``current`` relative to ``baseline``."""
+    base_by_key = {(r["case"], r["size"]): r for r in baseline if r.get("status") == "ok"}
+    regressions: list[str] = []
+    for row in current:
+        base = base_by_key.get((row["case"], row["size"]))
+        if base is None:
+            continue
+        if row.get("status") != "ok":
+            regressions.append(f"{row['case']}[{row['size']}]: status {row.get('status')}")
+            continue
+        for metric, higher_is_better in TRACKED_METRICS.items():
+            old, new = base.get(metric), row.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            if worse > threshold:
+                regressions.append(
+                    f"{row['case']}[{row['size']}]: {metric} {old:.4g} -> {new:.4g} "
+                    f"({change:+.1%})"
+                )
+    return regressions
+
+
+def _metadata() -> dict[str, str]:
+    try:
+        from importlib.metadata import version
+
+        fluxbt_version = version("fluxbt")
+    except Exception:  # noqa: BLE001 - not installed in editable mode
+        fluxbt_version = "unknown"
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "fluxbt": fluxbt_version,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    from .cases import CASES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="*", default=sorted(CASES), choices=sorted(CASES))
+    parser.add_argument("--sizes", nargs="*", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=1, help="Timed repetitions (best kept)")
+    parser.add_argument("--no-allocs", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Per-case timeout (s)")
+    parser.add_argument("--out", default="bench_results.json", help="Where to save results")
+    parser.add_argument("--baseline", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed regression")
+    args = parser.parse_args(argv)
+
+    results: list[dict[str, Any]] = []
+    for case in args.cases:
+        for size in args.sizes:
+            res = run_case(case, size, args.repeat, not args.no_allocs, args.timeout)
+            results.append(asdict(res))
+            if res.status == "ok":
+                rss = f"{res.peak_rss_bytes / 2**20:.1f} MiB" if res.peak_rss_bytes else "n/a"
+                alloc = (
+                    f"{res.alloc_peak_bytes / 2**20:.1f} MiB"
+                    if res.alloc_peak_bytes is not None
+                    else "n/a"
+                )
+                print(
+                    f"{case:<18} {size:>10,d} bars  {res.bars_per_sec:>14,.0f} bars/s  "
+                    f"rss {rss:>10}  alloc {alloc:>10}"
+                )
+            else:
+                print(f"{case:<18} {size:>10,d} bars  {res.status} {res.error or ''}")
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump({"meta": _metadata(), "results": results}, f, indent=2)
+    print(f"Results saved to: {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
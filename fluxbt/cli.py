@@ -1,23 +1,90 @@
 from __future__ import annotations
 
 import os
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import typer
 
-from .data.loader import CSVLoader, YFinanceLoader
-from .data.feed import DataFeed
-from .core.broker import Broker
-from .core.engine import BacktestEngine
-from .core.metrics import compute_metrics
-from .reports.plotting import plot_drawdown, plot_equity_curve
-from .strategies.base import Strategy
-from .strategies.sma_crossover import SMACrossover
-from .strategies.mean_reversion import MeanReversion
-from .strategies import load_github_strategy, StrategyLoadError
+# Heavy modules (pandas, matplotlib, httpx, yfinance, jinja2) are imported inside the
+# commands that need them so that `--help` and argument errors return quickly.
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .core.memprofile import MemoryProfiler
+    from .core.orders import Fill
+    from .strategies.base import Strategy
 
 
 app = typer.Typer(help="fluxbt CLI")
+runs_app = typer.Typer(help="Query the catalog of past runs")
+app.add_typer(runs_app, name="runs")
+
+
+def _stage(profiler: MemoryProfiler | None, name: str) -> AbstractContextManager[None]:
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+def _load_frame(
+    source: str,
+    csv_path: str | None,
+    ticker: str | None,
+    interval: str,
+    start: str | None,
+    end: str | None,
+) -> pd.DataFrame:
+    from .data.loader import CSVLoader, YFinanceLoader
+
+    if source == "csv":
+        if not csv_path:
+            raise typer.BadParameter("csv_path required for --source csv")
+        return CSVLoader(csv_path).load()
+    if source == "yfinance":
+        if not ticker:
+            raise typer.BadParameter("ticker required for --source yfinance")
+        return YFinanceLoader(ticker=ticker, interval=interval, start=start, end=end).load()
+    raise typer.BadParameter("source must be 'csv' or 'yfinance'")
+
+
+def _save_artifacts(
+    ts_dir: str,
+    hist: pd.DataFrame,
+    fills: list[Fill],
+    metrics: dict[str, float],
+    artifact_format: str,
+    csv: bool,
+) -> None:
+    from .reports.artifacts import export_csv, get_artifact_writer
+
+    try:
+        writer = get_artifact_writer(artifact_format)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    writer.write(ts_dir, hist, fills, metrics)
+    if csv:
+        export_csv(ts_dir, hist, fills)
+
+
+def _register_run(
+    catalog_path: str | None,
+    strategy_name: str,
+    params: dict[str, object],
+    df: pd.DataFrame,
+    metrics: dict[str, float],
+    ts_dir: str,
+) -> None:
+    from .reports.catalog import RunCatalog, RunRecord, frame_fingerprint
+
+    record = RunRecord(
+        strategy=strategy_name,
+        params=params,
+        metrics=metrics,
+        data_fingerprint=frame_fingerprint(df),
+        run_dir=os.path.abspath(ts_dir),
+    )
+    with RunCatalog(catalog_path) as catalog:
+        catalog.register(record)
 
 
 @app.command()
@@ -44,23 +111,63 @@ def run(
     cash: float = 100000.0,
     slippage_bps: float = 1.0,
     commission_bps: float = 0.0,
+    block_size: int | None = typer.Option(
+        None, help="Bars per block for strategies with a block (on_bars) implementation"
+    ),
+    dtypes: str = typer.Option(
+        "float64",
+        help="Storage dtypes: 'float64' or 'compact' (float32 prices/volumes, int32 positions)",
+    ),
     out: str | None = typer.Option(None, help="Output directory"),
+    artifact_format: str = typer.Option(
+        "npy", help="Run artifact format: 'npy' (memory-mappable), 'npz' or 'parquet'"
+    ),
+    csv: bool = typer.Option(False, "--csv/--no-csv", help="Also export history/fills as CSV"),
     html_report: bool = typer.Option(
         False, "--html-report/--no-html-report", help="Generate HTML report"
     ),
+    register: bool = typer.Option(
+        True, "--register/--no-register", help="Record the run in the run catalog"
+    ),
+    catalog: str | None = typer.Option(
+        None, help="Run catalog path (default $FLUXBT_CATALOG or runs/catalog.db)"
+    ),
+    memo: bool = typer.Option(
+        False, "--memo/--no-memo", help="Reuse the stored result of an identical earlier run"
+    ),
+    memo_dir: str | None = typer.Option(
+        None, help="Run memo directory (default $FLUXBT_MEMO_DIR or runs/memo)"
+    ),
+    refresh_memo: bool = typer.Option(
+        False, "--refresh-memo", help="Recompute and overwrite the memoized result"
+    ),
+    profile_memory: bool = typer.Option(
+        False,
+        "--profile-memory",
+        help="Record peak memory and top allocation sites per stage (slower)",
+    ),
+    profile_frames: int = typer.Option(
+        4, help="Stack frames kept per allocation site with --profile-memory"
+    ),
 ) -> None:
-    if source == "csv":
-        if not csv_path:
-            raise typer.BadParameter("csv_path required for --source csv")
-        df = CSVLoader(csv_path).load()
-    elif source == "yfinance":
-        if not ticker:
-            raise typer.BadParameter("ticker required for --source yfinance")
-        df = YFinanceLoader(ticker=ticker, interval=interval, start=start, end=end).load()
-    else:
-        raise typer.BadParameter("source must be 'csv' or 'yfinance'")
+    from .core.broker import Broker
+    from .core.engine import BacktestEngine
+    from .core.memprofile import MemoryProfiler
+    from .core.metrics import compute_metrics
+    from .data.feed import DataFeed
+    from .dtypes import DtypePolicy
+    from .reports.plotting import plot_drawdown, plot_equity_curve
+    from .strategies.mean_reversion import MeanReversion
+    from .strategies.sma_crossover import SMACrossover
 
-    feed = DataFeed(df)
+    try:
+        policy = DtypePolicy.from_name(dtypes)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    profiler = MemoryProfiler(frames=profile_frames) if profile_memory else None
+    with _stage(profiler, "load"):
+        df = _load_frame(source, csv_path, ticker, interval, start, end)
+        feed = DataFeed(df, dtypes=policy)
     broker = Broker(slippage_bps=slippage_bps, commission_bps=commission_bps)
 
     strat: Strategy
@@ -80,18 +187,38 @@ def run(
     else:
         raise typer.BadParameter("strategy must be 'sma' or 'meanrev'")
 
-    engine = BacktestEngine(feed=feed, broker=broker, strategy=strat, initial_cash=cash)
-    hist = engine.run()
-    equity = hist["equity"]
-    drawdown = (equity / equity.cummax() - 1.0).fillna(0.0)
-    metrics = compute_metrics(equity, freq="D")
+    engine = BacktestEngine(
+        feed=feed,
+        broker=broker,
+        strategy=strat,
+        initial_cash=cash,
+        block_size=block_size,
+        profiler=profiler,
+    )
+    fills: list[Fill]
+    if memo or refresh_memo:
+        from .reports.memo import RunMemo
+
+        memoized = (RunMemo(memo_dir) if memo_dir else RunMemo()).run(engine, refresh=refresh_memo)
+        hist, fills = memoized.history, memoized.fills
+        if memoized.hit:
+            typer.echo(f"Reusing memoized run {memoized.key[:12]}")
+    else:
+        hist, fills = engine.run(), engine.fills
+    with _stage(profiler, "metrics"):
+        equity = hist["equity"]
+        drawdown = (equity / equity.cummax() - 1.0).fillna(0.0)
+        metrics = compute_metrics(equity, freq="D")
 
     ts_dir = out or os.path.join("runs", datetime.utcnow().strftime("%Y%m%d_%H%M%S"))
     os.makedirs(ts_dir, exist_ok=True)
-    hist.to_csv(os.path.join(ts_dir, "history.csv"))
+    with _stage(profiler, "report"):
+        _save_artifacts(ts_dir, hist, fills, metrics, artifact_format, csv)
+        if register:
+            _register_run(catalog, strat.name, dict(strat.params), df, metrics, ts_dir)
 
-    plot_equity_curve(equity, savepath=os.path.join(ts_dir, "equity.png"))
-    plot_drawdown(drawdown, savepath=os.path.join(ts_dir, "drawdown.png"))
+        plot_equity_curve(equity, savepath=os.path.join(ts_dir, "equity.png"))
+        plot_drawdown(drawdown, savepath=os.path.join(ts_dir, "drawdown.png"))
 
     typer.echo("Metrics:")
     for k, v in metrics.items():
@@ -110,6 +237,12 @@ def run(
         except Exception:
             typer.echo("jinja2 not installed or report generation failed; skipping HTML report.")
 
+    if profiler is not None:
+        profiler.stop()
+        typer.echo("Memory:")
+        for line in profiler.summary().splitlines():
+            typer.echo(f"  {line}")
+        typer.echo(f"Memory profile saved to: {profiler.write(ts_dir)}")
     typer.echo(f"Outputs saved in: {ts_dir}")
 
 
@@ -125,31 +258,41 @@ def run_github(
     path: str = typer.Option(..., help="Path to strategy file in the repo"),
     branch: str = typer.Option("main", help="Git branch or tag"),
     class_name: str | None = typer.Option(None, help="Optional strategy class name"),
+    cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse and revalidate locally cached strategy files"
+    ),
     cash: float = 100000.0,
     slippage_bps: float = 1.0,
     commission_bps: float = 0.0,
     out: str | None = typer.Option(None, help="Output directory"),
+    artifact_format: str = typer.Option(
+        "npy", help="Run artifact format: 'npy' (memory-mappable), 'npz' or 'parquet'"
+    ),
+    csv: bool = typer.Option(False, "--csv/--no-csv", help="Also export history/fills as CSV"),
     html_report: bool = typer.Option(
         False, "--html-report/--no-html-report", help="Generate HTML report"
     ),
+    register: bool = typer.Option(
+        True, "--register/--no-register", help="Record the run in the run catalog"
+    ),
+    catalog: str | None = typer.Option(
+        None, help="Run catalog path (default $FLUXBT_CATALOG or runs/catalog.db)"
+    ),
 ) -> None:
+    from .core.broker import Broker
+    from .core.engine import BacktestEngine
+    from .core.metrics import compute_metrics
+    from .data.feed import DataFeed
+    from .reports.plotting import plot_drawdown, plot_equity_curve
+    from .strategies import StrategyLoadError, load_github_strategy
+
     # Security notice
     typer.echo(
         "WARNING: You are about to fetch and execute Python code from the internet. "
         "Proceed only if you trust the source."
     )
 
-    if source == "csv":
-        if not csv_path:
-            raise typer.BadParameter("csv_path required for --source csv")
-        df = CSVLoader(csv_path).load()
-    elif source == "yfinance":
-        if not ticker:
-            raise typer.BadParameter("ticker required for --source yfinance")
-        df = YFinanceLoader(ticker=ticker, interval=interval, start=start, end=end).load()
-    else:
-        raise typer.BadParameter("source must be 'csv' or 'yfinance'")
-
+    df = _load_frame(source, csv_path, ticker, interval, start, end)
     feed = DataFeed(df)
     broker = Broker(slippage_bps=slippage_bps, commission_bps=commission_bps)
 
@@ -159,7 +302,12 @@ def run_github(
         except ValueError as exc:
             raise typer.BadParameter("--repo must be in 'owner/repo' format") from exc
         strat = load_github_strategy(
-            owner=owner, repo=repo_name, file_path=path, branch=branch, class_name=class_name
+            owner=owner,
+            repo=repo_name,
+            file_path=path,
+            branch=branch,
+            class_name=class_name,
+            use_cache=cache,
         )
     except StrategyLoadError as exc:
         raise typer.BadParameter(str(exc)) from exc
@@ -193,7 +341,9 @@ def run_github(
 
     ts_dir = out or os.path.join("runs", datetime.utcnow().strftime("%Y%m%d_%H%M%S"))
     os.makedirs(ts_dir, exist_ok=True)
-    hist.to_csv(os.path.join(ts_dir, "history.csv"))
+    _save_artifacts(ts_dir, hist, engine.fills, metrics, artifact_format, csv)
+    if register:
+        _register_run(catalog, strat.name, dict(strat.params), df, metrics, ts_dir)
 
     plot_equity_curve(equity, savepath=os.path.join(ts_dir, "equity.png"))
     plot_drawdown(drawdown, savepath=os.path.join(ts_dir, "drawdown.png"))
@@ -218,5 +368,442 @@ def run_github(
     typer.echo(f"Outputs saved in: {ts_dir}")
 
 
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", help="Interface to listen on (keep it local)"),
+    port: int = typer.Option(8765, help="TCP port"),
+    socket_path: str | None = typer.Option(
+        None, "--socket", help="Listen on this Unix socket (mode 0600) instead of TCP"
+    ),
+    workers: int = typer.Option(2, help="Worker processes (0: run in the server process)"),
+    max_feeds: int = typer.Option(8, help="Loaded inputs each worker keeps (LRU)"),
+    max_feed_mb: int = typer.Option(2048, help="Memory cap of each worker's loaded inputs"),
+    token_file: str | None = typer.Option(
+        None,
+        help="Where to write the access token (mode 0600; default $FLUXBT_SERVE_TOKEN_FILE, "
+        "<socket>.token or ~/.fluxbt/serve-<port>.token)",
+    ),
+) -> None:
+    """Keep imports and loaded data warm and run backtests sent by `fluxbt run-client`."""
+    from .serve import RunServer
+
+    server = RunServer(
+        host=host,
+        port=port,
+        socket_path=socket_path,
+        workers=workers,
+        max_feeds=max_feeds,
+        max_feed_bytes=max_feed_mb * 1024 * 1024,
+        token_path=token_file,
+    )
+    typer.echo(f"Serving on {server.address} with {workers} workers (Ctrl-C to stop)")
+    typer.echo(f"Access token in {server.token_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+def run_client(
+    source: str = typer.Option(..., help="Data source: 'csv' (the server caches file inputs)"),
+    csv_path: str | None = typer.Option(None, help="Path to CSV for --source csv"),
+    strategy: str = typer.Option(..., help="Strategy: 'sma' or 'meanrev'"),
+    # SMA params
+    fast: int = 20,
+    slow: int = 50,
+    long_only: bool = True,
+    # Mean Reversion params
+    window: int = 20,
+    entry: float = 2.0,
+    exit: float = 0.5,
+    allow_short: bool = True,
+    # Common
+    size_pct: float = 0.1,
+    cooldown: int = 0,
+    cash: float = 100000.0,
+    slippage_bps: float = 1.0,
+    commission_bps: float = 0.0,
+    block_size: int | None = typer.Option(
+        None, help="Bars per block for strategies with a block (on_bars) implementation"
+    ),
+    dtypes: str = typer.Option("float64", help="Storage dtypes: 'float64' or 'compact'"),
+    out: str | None = typer.Option(None, help="Output directory"),
+    artifact_format: str = typer.Option(
+        "npy", help="Run artifact format: 'npy' (memory-mappable), 'npz' or 'parquet'"
+    ),
+    csv: bool = typer.Option(False, "--csv/--no-csv", help="Also export history/fills as CSV"),
+    register: bool = typer.Option(
+        True, "--register/--no-register", help="Record the run in the server's run catalog"
+    ),
+    catalog: str | None = typer.Option(
+        None, help="Run catalog path (default: the server's $FLUXBT_CATALOG or runs/catalog.db)"
+    ),
+    server: str | None = typer.Option(
+        None,
+        help="Server address: http://host:port or unix:/path "
+        "(default $FLUXBT_SERVE_ADDRESS or http://127.0.0.1:8765)",
+    ),
+    token_file: str | None = typer.Option(
+        None, help="The server's token file (default: where `fluxbt serve` writes it)"
+    ),
+) -> None:
+    """Run a backtest on a `fluxbt serve` process: the options of `run`, without plots."""
+    from .serve.client import RunRequest, ServeClient, ServeError
+
+    if source != "csv":
+        raise typer.BadParameter("run-client supports --source csv only; save other data as CSV")
+    if not csv_path:
+        raise typer.BadParameter("csv_path required for --source csv")
+    params: dict[str, object]
+    if strategy == "sma":
+        params = {
+            "fast": fast,
+            "slow": slow,
+            "size_pct": size_pct,
+            "cooldown": cooldown,
+            "long_only": long_only,
+        }
+    elif strategy == "meanrev":
+        params = {
+            "window": window,
+            "entry": entry,
+            "exit": exit,
+            "size_pct": size_pct,
+            "cooldown": cooldown,
+            "allow_short": allow_short,
+        }
+    else:
+        raise typer.BadParameter("strategy must be 'sma' or 'meanrev'")
+
+    # paths are resolved here: the server may run in another working directory
+    ts_dir = out or os.path.join("runs", datetime.utcnow().strftime("%Y%m%d_%H%M%S"))
+    request = RunRequest(
+        spec={
+            "strategy": strategy,
+            "params": params,
+            "data": {"source": "csv", "path": os.path.abspath(csv_path)},
+            "cash": cash,
+            "slippage_bps": slippage_bps,
+            "commission_bps": commission_bps,
+            "block_size": block_size,
+        },
+        dtypes=dtypes,
+        out=os.path.abspath(ts_dir),
+        artifact_format=artifact_format,
+        csv=csv,
+        register=register,
+        catalog=os.path.abspath(catalog) if catalog else None,
+    )
+    try:
+        result = ServeClient(server, token_path=token_file).run(request)
+    except ServeError as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(1) from exc
+
+    typer.echo("Metrics:")
+    for k, v in result["metrics"].items():
+        typer.echo(f"  {k}: {v:.6f}" if v == v else f"  {k}: nan")
+    cached = "cached" if result["data_cached"] else "loaded"
+    typer.echo(
+        f"Simulated {result['bars']} bars in {result['seconds']:.3f}s "
+        f"on worker {result['worker']} (data {cached})"
+    )
+    typer.echo(f"Outputs saved in: {result['out']}")
+
+
+def _parse_grid(params: list[str]) -> dict[str, list[object]]:
+    import json
+
+    grid: dict[str, list[object]] = {}
+    for item in params:
+        key, sep, values = item.partition("=")
+        if not sep or not key or not values:
+            raise typer.BadParameter(f"--param must look like name=v1,v2,... (got {item!r})")
+        parsed: list[object] = []
+        for raw in values.split(","):
+            try:
+                parsed.append(json.loads(raw))
+            except ValueError:
+                parsed.append(raw)
+        grid[key] = parsed
+    return grid
+
+
+# module-level so ruff's B008 accepts the list-typed option
+_GRID_PARAM_OPTION = typer.Option(
+    None, help="Grid axis as name=v1,v2,... (repeatable); the sweep is their product"
+)
+_JOURNAL_MODE_OPTION = typer.Option(
+    "WAL",
+    help="SQLite journal mode of the queue, the same for every process using it; "
+    "DELETE for workers on several hosts sharing a network filesystem",
+)
+
+
+def _journal_mode(value: str) -> str:
+    from .sweep.queue import JOURNAL_MODES
+
+    if value.upper() not in JOURNAL_MODES:
+        raise typer.BadParameter(f"journal mode must be one of {', '.join(JOURNAL_MODES)}")
+    return value.upper()
+
+
+@app.command()
+def sweep_submit(
+    queue: str = typer.Option(..., help="Path to the SQLite job queue (created if missing)"),
+    strategy: str = typer.Option(..., help="Strategy: 'sma' or 'meanrev'"),
+    param: list[str] | None = _GRID_PARAM_OPTION,
+    csv_path: str | None = typer.Option(None, help="CSV input, readable from every worker host"),
+    synthetic_bars: int | None = typer.Option(
+        None, help="Use SyntheticLoader input with this many bars instead of a CSV"
+    ),
+    seed: int = typer.Option(0, help="Seed for --synthetic-bars"),
+    sweep: str = typer.Option("default", help="Sweep name, for status and results"),
+    max_attempts: int = typer.Option(3, help="Runs per job before it is marked failed"),
+    freq: str = typer.Option("D", help="Bar frequency for metrics: 'D', 'H' or 'MIN'"),
+    cash: float = 100000.0,
+    slippage_bps: float = 1.0,
+    commission_bps: float = 0.0,
+    journal_mode: str = _JOURNAL_MODE_OPTION,
+) -> None:
+    """Queue one backtest job per parameter combination for `fluxbt worker` processes."""
+    from .sweep import STRATEGIES, JobQueue, grid_specs
+
+    journal_mode = _journal_mode(journal_mode)
+
+    if strategy not in STRATEGIES:
+        raise typer.BadParameter(f"strategy must be one of {sorted(STRATEGIES)}")
+    if freq not in ("D", "H", "MIN"):
+        raise typer.BadParameter("freq must be 'D', 'H' or 'MIN'")
+    if (csv_path is None) == (synthetic_bars is None):
+        raise typer.BadParameter("pass exactly one of --csv-path or --synthetic-bars")
+    data: dict[str, object] = (
+        {"source": "csv", "path": os.path.abspath(csv_path)}
+        if csv_path is not None
+        else {"source": "synthetic", "n_bars": synthetic_bars, "seed": seed}
+    )
+    specs = grid_specs(
+        strategy,
+        _parse_grid(param or []),
+        data,
+        cash=cash,
+        slippage_bps=slippage_bps,
+        commission_bps=commission_bps,
+        freq=freq,
+    )
+    with JobQueue(queue, journal_mode=journal_mode) as jobs:
+        ids = jobs.submit(specs, sweep=sweep, max_attempts=max_attempts)
+    typer.echo(f"Queued {len(ids)} jobs in sweep '{sweep}' ({queue})")
+
+
+@app.command()
+def sweep_status(
+    queue: str = typer.Option(..., help="Path to the SQLite job queue"),
+    sweep: str | None = typer.Option(None, help="Only this sweep"),
+    top: int = typer.Option(10, help="Show the best N finished jobs by Sharpe"),
+    journal_mode: str = _JOURNAL_MODE_OPTION,
+) -> None:
+    """Show job counts and the best finished runs of a sweep."""
+    from .sweep import JobQueue
+
+    with JobQueue(queue, journal_mode=_journal_mode(journal_mode)) as jobs:
+        counts = jobs.counts(sweep)
+        finished = jobs.jobs(sweep, status="done")
+        failed = jobs.jobs(sweep, status="failed")
+    typer.echo("  ".join(f"{k}: {v}" for k, v in counts.items()))
+    finished.sort(key=lambda j: -(j.result or {}).get("sharpe", float("-inf")))
+    for job in finished[:top]:
+        sharpe = (job.result or {}).get("sharpe", float("nan"))
+        typer.echo(f"  #{job.id} sharpe={sharpe:.4f} {job.spec.params}")
+    for job in failed:
+        last = (job.error or "").strip().splitlines()[-1:] or [""]
+        typer.echo(f"  #{job.id} FAILED after {job.attempts} attempts: {last[0]}")
+
+
+@app.command()
+def worker(
+    queue: str = typer.Option(..., help="Path to the SQLite job queue"),
+    lease: float = typer.Option(60.0, help="Lease seconds; renewed while a job runs"),
+    poll: float = typer.Option(1.0, help="Seconds between polls when no job is pending"),
+    max_jobs: int | None = typer.Option(None, help="Exit after completing this many jobs"),
+    wait: bool = typer.Option(
+        False, "--wait/--exit-when-idle", help="Keep polling after the queue is drained"
+    ),
+    worker_id: str | None = typer.Option(None, help="Worker name (default host:pid)"),
+    journal_mode: str = _JOURNAL_MODE_OPTION,
+) -> None:
+    """Claim and run sweep jobs until the queue is drained (run any number in parallel)."""
+    from .sweep import run_worker
+
+    done = run_worker(
+        queue,
+        worker_id=worker_id,
+        lease_seconds=lease,
+        poll_interval=poll,
+        max_jobs=max_jobs,
+        exit_when_idle=not wait,
+        journal_mode=_journal_mode(journal_mode),
+    )
+    typer.echo(f"Completed {done} jobs")
+
+
+_STRATEGY_PARAM_OPTION = typer.Option(
+    None, help="Strategy parameter as name=value (repeatable), e.g. fast=10"
+)
+_WEIGHT_OPTION = typer.Option(
+    None, help="Portfolio weight as SYMBOL=weight (repeatable; default: equal weights)"
+)
+
+
+@app.command()
+def universe(
+    strategy: str = typer.Option(..., help="Strategy: 'sma' or 'meanrev'"),
+    param: list[str] | None = _STRATEGY_PARAM_OPTION,
+    csv_dir: str | None = typer.Option(
+        None, help="Directory or glob of per-symbol CSVs (symbol = file name)"
+    ),
+    symbols: str | None = typer.Option(None, help="Comma-separated tickers to fetch (yfinance)"),
+    interval: str = typer.Option("1d", help="Interval for yfinance"),
+    start: str | None = typer.Option(None, help="Start date for yfinance"),
+    end: str | None = typer.Option(None, help="End date for yfinance"),
+    weight: list[str] | None = _WEIGHT_OPTION,
+    workers: int | None = typer.Option(None, help="Worker processes (default: CPU count)"),
+    freq: str = typer.Option("D", help="Bar frequency for metrics: 'D', 'H' or 'MIN'"),
+    cash: float = 100000.0,
+    slippage_bps: float = 1.0,
+    commission_bps: float = 0.0,
+    block_size: int | None = typer.Option(
+        None, help="Bars per block for strategies with a block (on_bars) implementation"
+    ),
+    top: int = typer.Option(10, help="Show the best N symbols by Sharpe"),
+    out: str | None = typer.Option(None, help="Output directory"),
+) -> None:
+    """Backtest one strategy on every symbol in parallel and combine them into a portfolio."""
+    from .core.broker import Broker
+    from .data.universe import UniverseLoader
+    from .sweep import STRATEGIES, UniverseBacktest
+
+    if strategy not in STRATEGIES:
+        raise typer.BadParameter(f"strategy must be one of {sorted(STRATEGIES)}")
+    if freq not in ("D", "H", "MIN"):
+        raise typer.BadParameter("freq must be 'D', 'H' or 'MIN'")
+    if (csv_dir is None) == (symbols is None):
+        raise typer.BadParameter("pass exactly one of --csv-dir or --symbols")
+    params: dict[str, object] = {}
+    for key, values in _parse_grid(param or []).items():
+        if len(values) != 1:
+            raise typer.BadParameter(f"--param {key} takes one value (use sweep-submit for grids)")
+        params[key] = values[0]
+    weights: dict[str, float] | None = None
+    if weight:
+        weights = {}
+        for item in weight:
+            symbol, _, value = item.partition("=")
+            try:
+                weights[symbol] = float(value)
+            except ValueError:
+                symbol = ""
+            if not symbol:
+                raise typer.BadParameter(f"--weight must look like SYMBOL=0.25 (got {item!r})")
+
+    loader = (
+        UniverseLoader.from_csv(csv_dir)
+        if csv_dir is not None
+        else UniverseLoader(
+            [s.strip() for s in (symbols or "").split(",") if s.strip()],
+            interval=interval,
+            start=start,
+            end=end,
+        )
+    )
+    loaded = loader.load()
+    for symbol, error in loaded.errors.items():
+        typer.echo(f"Skipping {symbol}: {error}", err=True)
+    if weights is not None:
+        missing = sorted(set(weights) - set(loaded.frames))
+        if missing:
+            raise typer.BadParameter(f"--weight for symbols that did not load: {missing}")
+    try:
+        backtest = UniverseBacktest(
+            STRATEGIES[strategy],
+            loaded.frames,
+            params=params,
+            weights=weights,
+            broker=Broker(slippage_bps=slippage_bps, commission_bps=commission_bps),
+            initial_cash=cash,
+            block_size=block_size,
+            freq=freq,  # type: ignore[arg-type]
+            workers=workers,
+        )
+        result = backtest.run()
+    except (ValueError, RuntimeError) as exc:
+        typer.echo(f"Error: {exc}", err=True)
+        raise typer.Exit(1) from exc
+
+    for symbol, error in result.errors.items():
+        typer.echo(f"Run failed for {symbol}: {error}", err=True)
+    typer.echo(f"Portfolio of {len(result.metrics)} symbols:")
+    for k, v in result.combined_metrics.items():
+        typer.echo(f"  {k}: {v:.6f}" if v == v else f"  {k}: nan")
+    best = result.metrics.sort_values("sharpe", ascending=False, na_position="last").head(top)
+    typer.echo(f"Top {len(best)} symbols by Sharpe:")
+    for symbol, row in best.iterrows():
+        typer.echo(
+            f"  {symbol}: sharpe={row['sharpe']:.4f} total_return={row['total_return']:.4f} "
+            f"max_dd={row['max_dd']:.4f} weight={row['weight']:.4f}"
+        )
+    out_dir = out or os.path.join("runs", "universe_" + datetime.utcnow().strftime("%Y%m%d_%H%M%S"))
+    result.write(out_dir)
+    typer.echo(f"Outputs saved in: {out_dir}")
+
+
+@runs_app.command("query")
+def runs_query(
+    where: str | None = typer.Option(
+        None, help='Filter, e.g. "sharpe>1.5 and max_dd>-0.2 and param.fast<=20"'
+    ),
+    order_by: str = typer.Option("sharpe", help="Metric or field to rank by"),
+    asc: bool = typer.Option(False, "--asc/--desc", help="Sort direction"),
+    limit: int = typer.Option(20, help="Maximum number of runs shown"),
+    catalog: str | None = typer.Option(
+        None, help="Run catalog path (default $FLUXBT_CATALOG or runs/catalog.db)"
+    ),
+) -> None:
+    """Filter and rank catalogued runs by their metrics and params."""
+    from .reports.catalog import QueryError, RunCatalog
+
+    with RunCatalog(catalog) as runs:
+        try:
+            records = runs.query(where, order_by=order_by, ascending=asc, limit=limit)
+        except QueryError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+    shown = ("sharpe", "calmar", "max_dd", "total_return")
+    for rec in records:
+        values = " ".join(f"{k}={rec.metrics.get(k, float('nan')):.4f}" for k in shown)
+        where_from = rec.run_dir or f"sweep {rec.sweep}"
+        typer.echo(f"#{rec.id} {rec.strategy} {values} {rec.params} {where_from}")
+    typer.echo(f"{len(records)} runs")
+
+
+@runs_app.command("import-sweep")
+def runs_import_sweep(
+    queue: str = typer.Option(..., help="Path to the SQLite job queue"),
+    sweep: str | None = typer.Option(None, help="Only this sweep"),
+    catalog: str | None = typer.Option(
+        None, help="Run catalog path (default $FLUXBT_CATALOG or runs/catalog.db)"
+    ),
+    journal_mode: str = _JOURNAL_MODE_OPTION,
+) -> None:
+    """Add finished sweep jobs to the run catalog (already imported jobs are skipped)."""
+    from .reports.catalog import RunCatalog
+    from .sweep import JobQueue
+
+    journal_mode = _journal_mode(journal_mode)
+    with JobQueue(queue, journal_mode=journal_mode) as jobs, RunCatalog(catalog) as runs:
+        added = jobs.register_results(runs, sweep)
+    typer.echo(f"Registered {added} runs")
+
+
 if __name__ == "__main__":
     app()
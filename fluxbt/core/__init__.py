@@ -1,13 +1,24 @@
 from .orders import Order, Fill, resolve_order_quantity
 from .portfolio import Portfolio
 from .broker import Broker
+from .budget import AbortReason, BudgetMonitor, RunBudget
+from .checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+from .dtypes import COMPACT_POLICY, FLOAT64_POLICY, DtypePolicy
 from .engine import BacktestEngine
-from .metrics import compute_metrics
+from .lookback import ArrayBarContext, BarContext, RollingBarContext
+from .live import AsyncSink, LatencyStats, LiveEngine, QueueSink, RecordingSink
+from .memprofile import MemoryProfiler
+from .metrics import MetricsAccumulator, compute_metrics, compute_metrics_batch
 from .risk import (
     target_position_scale,
     kelly_fraction,
     cap_position_fraction,
+    RiskOverlay,
+    RollingVolatility,
+    VolTargetOverlay,
 )
+from .sinks import CallbackSink, HistorySink, NpyFileSink, RingBufferSink
+from .indicator_cache import IndicatorCache, get_indicator_cache, set_indicator_cache
 from .utils import annualization_factor
 
 __all__ = [
@@ -17,9 +28,39 @@ __all__ = [
     "Portfolio",
     "Broker",
     "BacktestEngine",
+    "RunBudget",
+    "BudgetMonitor",
+    "AbortReason",
+    "Checkpoint",
+    "save_checkpoint",
+    "load_checkpoint",
+    "DtypePolicy",
+    "FLOAT64_POLICY",
+    "COMPACT_POLICY",
+    "BarContext",
+    "ArrayBarContext",
+    "RollingBarContext",
+    "LiveEngine",
+    "AsyncSink",
+    "RecordingSink",
+    "QueueSink",
+    "LatencyStats",
+    "MemoryProfiler",
     "compute_metrics",
+    "compute_metrics_batch",
+    "MetricsAccumulator",
+    "HistorySink",
+    "CallbackSink",
+    "RingBufferSink",
+    "NpyFileSink",
     "target_position_scale",
     "kelly_fraction",
     "cap_position_fraction",
+    "RiskOverlay",
+    "RollingVolatility",
+    "VolTargetOverlay",
     "annualization_factor",
+    "IndicatorCache",
+    "get_indicator_cache",
+    "set_indicator_cache",
 ]
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+
+AbortReason = Literal["max_drawdown", "min_equity", "no_trades", "max_bars", "max_seconds"]
+
+
+@dataclass(frozen=True)
+class RunBudget:
+    """Conditions under which ``BacktestEngine.run`` gives up on a run early.
+
+    ``max_drawdown`` is a positive fraction (0.6 stops once equity is 60% below its
+    running peak); ``min_equity`` stops once equity is at or below that amount;
+    ``no_trade_bars`` stops at that bar if no order has filled yet; ``max_bars`` and
+    ``max_seconds`` cap the bars and wall-clock time of one ``run`` call. Unset
+    conditions are not checked. When several fire on the same bar, the first in this
+    order is reported.
+    """
+
+    max_drawdown: float | None = None
+    min_equity: float | None = None
+    no_trade_bars: int | None = None
+    max_bars: int | None = None
+    max_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_drawdown is not None and not 0 < self.max_drawdown <= 1:
+            raise ValueError("max_drawdown must be in (0, 1]")
+        for name in ("no_trade_bars", "max_bars"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be > 0")
+        if self.max_seconds is not None and self.max_seconds <= 0:
+            raise ValueError("max_seconds must be > 0")
+
+    @classmethod
+    def from_dict(cls, values: Mapping[str, float | int]) -> RunBudget:
+        """Build a budget from plain values, e.g. ``RunSpec.budget`` read from JSON.
+
+        Unknown keys raise ``ValueError``, as do bar counts that are not whole numbers.
+        """
+        unknown = sorted(set(values) - {f.name for f in fields(cls)})
+        if unknown:
+            raise ValueError(f"Unknown budget fields: {unknown}")
+
+        def as_float(name: str) -> float | None:
+            value = values.get(name)
+            return None if value is None else float(value)
+
+        def as_int(name: str) -> int | None:
+            value = values.get(name)
+            if value is None:
+                return None
+            if value != int(value):
+                raise ValueError(f"{name} must be a whole number of bars")
+            return int(value)
+
+        return cls(
+            max_drawdown=as_float("max_drawdown"),
+            min_equity=as_float("min_equity"),
+            no_trade_bars=as_int("no_trade_bars"),
+            max_bars=as_int("max_bars"),
+            max_seconds=as_float("max_seconds"),
+        )
+
+    def start(self) -> BudgetMonitor:
+        return BudgetMonitor(self)
+
+
+class BudgetMonitor:
+    """Per-run state of a ``RunBudget``; every check is O(1) per bar."""
+
+    def __init__(self, budget: RunBudget) -> None:
+        self.budget = budget
+        self.bars = 0
+        self.traded = False
+        self.peak = -math.inf
+        self.deadline = (
+            time.perf_counter() + budget.max_seconds if budget.max_seconds is not None else None
+        )
+
+    def check(self, equity: float, traded: bool = False) -> AbortReason | None:
+        """Account for one bar (``traded``: an order filled on it); the reason to stop, if any."""
+        b = self.budget
+        self.bars += 1
+        self.traded = self.traded or traded
+        if equity > self.peak:
+            self.peak = equity
+        if (
+            b.max_drawdown is not None
+            and self.peak > 0
+            and (equity - self.peak) / self.peak <= -b.max_drawdown
+        ):
+            return "max_drawdown"
+        if b.min_equity is not None and equity <= b.min_equity:
+            return "min_equity"
+        if b.no_trade_bars is not None and not self.traded and self.bars >= b.no_trade_bars:
+            return "no_trades"
+        if b.max_bars is not None and self.bars >= b.max_bars:
+            return "max_bars"
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            return "max_seconds"
+        return None
+
+    def check_many(self, equity: npt.NDArray[np.float64]) -> tuple[int, AbortReason] | None:
+        """``check`` over consecutive bars without fills (``traded`` is left unchanged).
+
+        Returns the index of the first bar that trips a condition and its reason; state
+        then covers bars up to that index only. The clock is read once per call, so a
+        ``max_seconds`` stop lands on the last bar of the call.
+        """
+        n = len(equity)
+        if not n:
+            return None
+        b = self.budget
+        peak = np.fmax.accumulate(np.fmax(equity, self.peak))
+        hits: list[tuple[int, AbortReason]] = []
+        if b.max_drawdown is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                dd = np.where(peak > 0, (equity - peak) / peak, 0.0)
+            self._first(hits, dd <= -b.max_drawdown, "max_drawdown")
+        if b.min_equity is not None:
+            self._first(hits, equity <= b.min_equity, "min_equity")
+        if b.no_trade_bars is not None and not self.traded:
+            self._at_count(hits, b.no_trade_bars, n, "no_trades")
+        if b.max_bars is not None:
+            self._at_count(hits, b.max_bars, n, "max_bars")
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            hits.append((n - 1, "max_seconds"))
+        stop = min(hits, key=lambda h: h[0]) if hits else None
+        last = stop[0] if stop is not None else n - 1
+        self.bars += last + 1
+        if peak[last] > self.peak:
+            self.peak = float(peak[last])
+        return stop
+
+    @staticmethod
+    def _first(
+        hits: list[tuple[int, AbortReason]], mask: npt.NDArray[np.bool_], reason: AbortReason
+    ) -> None:
+        idx = np.flatnonzero(mask)
+        if idx.size:
+            hits.append((int(idx[0]), reason))
+
+    def _at_count(
+        self, hits: list[tuple[int, AbortReason]], limit: int, n: int, reason: AbortReason
+    ) -> None:
+        i = max(limit - self.bars - 1, 0)
+        if i < n:
+            hits.append((i, reason))
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy.typing as npt
+import pandas as pd
+
+from .broker import Broker
+from .metrics import MetricsAccumulator
+from .portfolio import Portfolio
+from .risk import RiskOverlay
+
+CHECKPOINT_VERSION = 3
+
+
+@dataclass
+class Checkpoint:
+    """Complete engine state after the bar at ``ts``, enough to resume a run.
+
+    ``n_bars`` counts every bar processed since the original start, including bars
+    processed by earlier resumed runs. ``lookback`` holds the last bars of each OHLCV
+    column for strategies that read history through ``ctx.window``.
+    """
+
+    ts: pd.Timestamp
+    n_bars: int
+    portfolio: Portfolio
+    broker: Broker
+    accumulator: MetricsAccumulator
+    strategy_name: str
+    strategy_params: dict[str, object]
+    strategy_state: dict[str, object]
+    risk_overlay: RiskOverlay | None = None
+    lookback: dict[str, npt.NDArray[Any]] | None = None
+    version: int = field(default=CHECKPOINT_VERSION)
+
+
+def save_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    """Pickle ``checkpoint`` to ``path`` atomically (write to a temp file, then rename)."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    """Load a checkpoint written by ``save_checkpoint``. Only load files you trust."""
+    with open(path, "rb") as f:
+        checkpoint = pickle.load(f)
+    if not isinstance(checkpoint, Checkpoint):
+        raise ValueError(f"{path} does not contain a fluxbt checkpoint")
+    if checkpoint.version != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Unsupported checkpoint version {checkpoint.version} (expected {CHECKPOINT_VERSION})"
+        )
+    return checkpoint
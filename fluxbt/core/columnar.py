@@ -0,0 +1,246 @@
+"""Columnar on-disk layout of run outputs, shared by ``fluxbt.core.sinks`` and
+``fluxbt.reports.artifacts``.
+
+Each table is a set of typed numpy columns described by a schema in
+``manifest.json``; timestamps are int64 UTC nanoseconds whose timezone the schema
+records. ``RunArtifact`` reads any layout written by an ``ArtifactWriter`` or
+``NpyFileSink``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .utils import fluxbt_version
+
+if TYPE_CHECKING:
+    from .orders import Fill
+
+MANIFEST_FILE = "manifest.json"
+METRICS_FILE = "metrics.json"
+TS_COLUMN = "ts"
+FILL_COLUMNS = ["order_id", "ts", "price", "qty", "commission"]
+
+Columns = dict[str, npt.NDArray[Any]]
+
+
+def fills_to_frame(fills: Iterable[Fill]) -> pd.DataFrame:
+    rows = [(f.order_id, f.ts, f.price, f.qty, f.commission) for f in fills]
+    df = pd.DataFrame(rows, columns=FILL_COLUMNS)
+    return df.astype({"order_id": str, "price": float, "qty": float, "commission": float})
+
+
+def _utc_ns(values: pd.DatetimeIndex) -> npt.NDArray[np.int64]:
+    utc = values.tz_convert("UTC") if values.tz is not None else values
+    out: npt.NDArray[np.int64] = utc.as_unit("ns").asi8
+    return out
+
+
+def frame_to_columns(df: pd.DataFrame) -> tuple[Columns, dict[str, Any]]:
+    """Split a frame into typed numpy columns plus a schema for ``columns_to_frame``.
+
+    A DatetimeIndex becomes the ``ts`` column; datetime columns become int64 UTC ns.
+    """
+    cols: Columns = {}
+    schema: dict[str, Any] = {"index": None, "ts_columns": [], "tz": None}
+    if isinstance(df.index, pd.DatetimeIndex):
+        cols[TS_COLUMN] = _utc_ns(df.index)
+        schema.update(index=TS_COLUMN, ts_columns=[TS_COLUMN])
+        schema["tz"] = str(df.index.tz) if df.index.tz is not None else None
+    for name in df.columns:
+        series = df[name]
+        if isinstance(series.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(
+            series.dtype
+        ):
+            values = pd.DatetimeIndex(series)
+            cols[str(name)] = _utc_ns(values)
+            schema["ts_columns"].append(str(name))
+            if schema["tz"] is None and values.tz is not None:
+                schema["tz"] = str(values.tz)
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            cols[str(name)] = series.to_numpy()
+        else:
+            cols[str(name)] = series.astype(str).to_numpy(dtype=str)
+    schema["columns"] = list(cols)
+    return cols, schema
+
+
+def columns_to_frame(cols: Columns, schema: dict[str, Any]) -> pd.DataFrame:
+    """Inverse of ``frame_to_columns``."""
+    tz = schema.get("tz")
+    ts_columns = set(schema.get("ts_columns", []))
+    index_col = schema.get("index")
+    data: dict[str, Any] = {}
+    index = None
+    for name, arr in cols.items():
+        values: Any = np.asarray(arr)
+        if name in ts_columns:
+            dt = pd.DatetimeIndex(pd.to_datetime(values, utc=True))
+            values = dt.tz_convert(tz) if tz else dt.tz_localize(None)
+        if name == index_col:
+            index = values
+        else:
+            data[name] = values
+    # copy=False keeps memory-mapped columns zero-copy
+    df = pd.DataFrame(data, index=index, copy=False)
+    if index is not None:
+        df.index.name = index_col
+    return df
+
+
+class NpyAppender:
+    """Append to a 1-D ``.npy`` file whose final length is unknown upfront.
+
+    A fixed-size header is written first and rewritten with the real row count on
+    ``close``, so the file is a standard ``.npy`` (memory-mappable by ``np.load``).
+    Unicode columns have a fixed width; longer strings raise instead of truncating.
+    With ``append=True`` an existing file written by ``NpyAppender`` is extended.
+    """
+
+    HEADER_LEN = 256
+
+    def __init__(self, path: str, dtype: npt.DTypeLike, append: bool = False) -> None:
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.count = 0
+        appending = append and os.path.exists(path)
+        self._file = open(path, "r+b" if appending else "w+b")  # noqa: SIM115 - see close()
+        if not appending:
+            self._file.write(self._header(0))
+            return
+        np.lib.format.read_magic(self._file)  # type: ignore[no-untyped-call]
+        shape, _, found = np.lib.format.read_array_header_1_0(  # type: ignore[no-untyped-call]
+            self._file
+        )
+        if self._file.tell() != self.HEADER_LEN or found != self.dtype:
+            self._file.close()
+            raise ValueError(f"{path} was not written by NpyAppender with dtype {self.dtype}")
+        self.count = int(shape[0])
+        self._file.seek(0, os.SEEK_END)
+
+    def _header(self, n: int) -> bytes:
+        meta = {
+            "descr": np.lib.format.dtype_to_descr(self.dtype),  # type: ignore[no-untyped-call]
+            "fortran_order": False,
+            "shape": (n,),
+        }
+        text = repr(meta).encode("latin1")
+        pad = self.HEADER_LEN - 10 - len(text) - 1
+        if pad < 0:  # pragma: no cover - only for exotic structured dtypes
+            raise ValueError(f"dtype {self.dtype} too complex for a fixed npy header")
+        length = struct.pack("<H", self.HEADER_LEN - 10)
+        return b"\x93NUMPY\x01\x00" + length + text + b" " * pad + b"\n"
+
+    def append(self, values: npt.ArrayLike) -> None:
+        arr = np.asarray(values)
+        if self.dtype.kind == "U" and arr.size:
+            width = self.dtype.itemsize // 4
+            longest = int(np.char.str_len(arr.astype(str)).max())
+            if longest > width:
+                raise ValueError(f"String of length {longest} exceeds column width {width}")
+        np.ascontiguousarray(arr, dtype=self.dtype).tofile(self._file)
+        self.count += len(arr)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._file.write(self._header(self.count))
+        self._file.close()
+
+
+def write_manifest(out_dir: str, fmt: str, schemas: dict[str, dict[str, Any]]) -> None:
+    manifest = {"format": fmt, "fluxbt_version": fluxbt_version(), "tables": schemas}
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def write_metrics(out_dir: str, metrics: dict[str, float]) -> None:
+    # NaN/inf are valid JSON extensions in Python's json module and round-trip exactly
+    with open(os.path.join(out_dir, METRICS_FILE), "w", encoding="utf-8") as f:
+        json.dump({k: float(v) for k, v in metrics.items()}, f, indent=2)
+
+
+@dataclass
+class RunArtifact:
+    """Lazy reader for an artifact directory written by an ``ArtifactWriter``.
+
+    Nothing is read until accessed. ``columns`` returns raw arrays (memory-mapped for
+    the "npy" format) so large histories can be analysed without building a frame.
+    """
+
+    path: str
+    manifest: dict[str, Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        with open(os.path.join(self.path, MANIFEST_FILE), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+
+    @property
+    def format(self) -> str:
+        return str(self.manifest["format"])
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        with open(os.path.join(self.path, METRICS_FILE), encoding="utf-8") as f:
+            data: dict[str, float] = json.load(f)
+        return data
+
+    def schema(self, table: str) -> dict[str, Any]:
+        try:
+            schema: dict[str, Any] = self.manifest["tables"][table]
+        except KeyError:
+            raise KeyError(f"Artifact has no table '{table}'") from None
+        return schema
+
+    def columns(self, table: str, names: Iterable[str] | None = None) -> Columns:
+        keys = list(names) if names is not None else list(self.schema(table)["columns"])
+        missing = [k for k in keys if k not in self.schema(table)["columns"]]
+        if missing:
+            raise KeyError(f"Artifact table '{table}' missing columns: {missing}")
+        if self.format == "npy":
+            table_dir = os.path.join(self.path, table)
+            return {
+                k: np.load(os.path.join(table_dir, f"{k}.npy"), mmap_mode="r", allow_pickle=False)
+                for k in keys
+            }
+        if self.format == "npz":
+            with np.load(os.path.join(self.path, f"{table}.npz"), allow_pickle=False) as npz:
+                return {k: npz[k] for k in keys}
+        if self.format == "parquet":
+            import pyarrow.parquet as pq
+
+            tbl = pq.read_table(
+                os.path.join(self.path, f"{table}.parquet"), columns=keys, memory_map=True
+            )
+            return {k: tbl.column(k).to_numpy() for k in keys}
+        raise ValueError(f"Unsupported artifact format '{self.format}'")
+
+    def table(self, table: str, names: Iterable[str] | None = None) -> pd.DataFrame:
+        schema = self.schema(table)
+        if names is not None:
+            names = list(names)
+            if schema.get("index") and schema["index"] not in names:
+                names = [schema["index"], *names]
+        return columns_to_frame(self.columns(table, names), schema)
+
+    @property
+    def history(self) -> pd.DataFrame:
+        return self.table("history")
+
+    @property
+    def fills(self) -> pd.DataFrame:
+        return self.table("fills")
+
+
+def read_artifact(path: str) -> RunArtifact:
+    return RunArtifact(path)
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+# DtypePolicy lives in fluxbt.dtypes, which imports neither core nor data, so that data
+# loaders can use it without loading the engine; it stays importable from here
+from ..dtypes import COMPACT_POLICY, DTYPE_POLICIES, FLOAT64_POLICY, PRICE_COLUMNS, DtypePolicy
+
+__all__ = ["COMPACT_POLICY", "DTYPE_POLICIES", "FLOAT64_POLICY", "PRICE_COLUMNS", "DtypePolicy"]
@@ -1,13 +1,58 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
 import pandas as pd
 
-from ..data.feed import DataFeed
-from ..strategies.base import BaseStrategy
+from ..data.feed import REQUIRED_COLS, DataFeed
+from ..dtypes import DtypePolicy
 from .broker import Broker
-from .orders import Fill
+from .budget import AbortReason, BudgetMonitor, RunBudget
+from .checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+from .lookback import ArrayBarContext
+from .memprofile import MemoryProfiler
+from .metrics import MetricsAccumulator
+from .orders import Fill, Order
 from .portfolio import Portfolio
+from .risk import RiskOverlay
+from .sinks import HISTORY_COLUMNS, FloatArray, HistoryArray, HistorySink, TsArray
+
+if TYPE_CHECKING:
+    # strategies.base imports core.orders; a runtime import here would be circular
+    from ..strategies.base import BaseStrategy
+
+
+def implements_on_bars(strategy: BaseStrategy) -> bool:
+    """True if ``strategy`` overrides the optional block protocol ``on_bars``."""
+    from ..strategies.base import BaseStrategy
+
+    return type(strategy).on_bars is not BaseStrategy.on_bars
+
+
+def execute_orders(
+    broker: Broker, portfolio: Portfolio, orders: list[Order], price: float, ts: pd.Timestamp
+) -> list[Fill]:
+    """Route ``orders`` through ``broker`` at ``price`` and apply the fills to ``portfolio``."""
+    fills: list[Fill] = []
+    for order in orders:
+        fill = broker.execute(
+            order,
+            price,
+            ts,
+            equity=max(portfolio.cash + portfolio.position * price, 0.0),
+            current_position=portfolio.position,
+        )
+        if fill is None:
+            continue
+        fills.append(fill)
+        # Infer side from order
+        side = order.side
+        portfolio.apply_trade(side, fill)
+        portfolio.mark_to_market(price)
+    return fills
 
 
 @dataclass
@@ -16,51 +61,367 @@ class BacktestEngine:
     broker: Broker
     strategy: BaseStrategy
     initial_cash: float = 100_000.0
+    # Optional streaming destination: history and fills are flushed every `chunk_size`
+    # bars instead of being kept in `history`/`fills`.
+    sink: HistorySink | None = None
+    chunk_size: int = 10_000
+    # Bars per `on_bars` call for strategies implementing the block protocol; None
+    # (default) always uses per-bar `on_bar`.
+    block_size: int | None = None
+    # Optional stage between strategy orders and the broker (e.g. `VolTargetOverlay`),
+    # fed every bar's close
+    risk_overlay: RiskOverlay | None = None
+    # Storage dtypes of the returned/streamed history and fill ledger; None uses the
+    # feed's policy. Computation stays float64 either way.
+    dtypes: DtypePolicy | None = None
+    # Early-abort conditions checked every bar; a tripped run stops there and records
+    # the reason in `aborted` (and the returned frame's `attrs["aborted"]`)
+    budget: RunBudget | None = None
+    # Opt-in memory instrumentation: each `run` is recorded as an "engine" stage
+    profiler: MemoryProfiler | None = None
 
     fills: list[Fill] = field(default_factory=list)
     history: list[dict[str, float]] = field(default_factory=list)
+    # Running aggregates for `compute_metrics`-equivalent results without the history
+    accumulator: MetricsAccumulator = field(default_factory=MetricsAccumulator)
+    # State after the last run, captured by `checkpoint()`
+    portfolio: Portfolio | None = field(default=None, init=False)
+    last_ts: pd.Timestamp | None = field(default=None, init=False)
+    n_bars: int = field(default=0, init=False)
+    aborted: AbortReason | None = field(default=None, init=False)
+    # Lookback context bound to strategies that declare `lookback`; views the feed
+    _ctx: ArrayBarContext | None = field(default=None, init=False, repr=False)
+
+    def run(self, resume_from: Checkpoint | str | None = None) -> pd.DataFrame:
+        """Run the backtest, or continue one from a checkpoint (object or file path).
 
-    def run(self) -> pd.DataFrame:
-        portfolio = Portfolio(cash=self.initial_cash)
+        When resuming, only bars after the checkpoint timestamp are processed and the
+        returned history covers just those bars (use ``NpyFileSink(..., append=True)``
+        to extend a stored history on disk). A run without ``resume_from`` starts over:
+        the fills, history and metrics of an earlier run are dropped.
+        """
+        if self.profiler is None:
+            return self._run(resume_from)
+        with self.profiler.stage("engine"):
+            return self._run(resume_from)
+
+    def _run(self, resume_from: Checkpoint | str | None) -> pd.DataFrame:
         self.strategy.reset()
-        for ts, bar in self.feed.iter_bars():
-            price = float(bar["close"])
-            portfolio.mark_to_market(price)
-            orders = self.strategy.on_bar(ts, bar)
-            for order in orders:
-                fill = self.broker.execute(
-                    order,
-                    price,
-                    ts,
-                    equity=max(portfolio.cash + portfolio.position * price, 0.0),
-                    current_position=portfolio.position,
-                )
-                if fill is None:
-                    continue
-                self.fills.append(fill)
-                # Infer side from order
-                side = order.side
-                portfolio.apply_trade(side, fill)
-                portfolio.mark_to_market(price)
-            dd = (
-                Portfolio.drawdown_series(
-                    pd.Series(
-                        [h["equity"] for h in self.history]
-                        + [portfolio.cash + portfolio.position * price]
-                    )
-                ).iloc[-1]
-                if self.history
-                else 0.0
-            )
+        self.aborted = None
+        monitor = self.budget.start() if self.budget is not None else None
+        ckpt: Checkpoint | None = None
+        if resume_from is None:
+            if self.risk_overlay is not None:
+                self.risk_overlay.reset()
+            portfolio = Portfolio(cash=self.initial_cash)
+            # a fresh run starts from empty records, so an engine can be run again
+            self.fills = []
+            self.history = []
+            self.accumulator = MetricsAccumulator()
+            self.n_bars = 0
+            self.last_ts = None
+            feed = self.feed
+        else:
+            ckpt = load_checkpoint(resume_from) if isinstance(resume_from, str) else resume_from
+            portfolio, feed = self._restore(ckpt)
+        self._ctx = self._make_context(feed, ckpt)
+        self.strategy.bind(self._ctx)
+        self.portfolio = portfolio
+        if monitor is not None:
+            # drawdowns are measured from the peak of the whole (resumed) run
+            monitor.peak = self.accumulator.peak
+        if len(feed.df):
+            self.n_bars += len(feed.df)
+            self.last_ts = feed.df.index[-1]
+        if self.block_size is not None and implements_on_bars(self.strategy):
+            return self._run_blocks(portfolio, feed, self.block_size, monitor)
+        if self.sink is not None:
+            return self._run_with_sink(portfolio, self.sink, feed, monitor)
+        for ts, bar in feed.iter_bars():
+            n_fills = len(self.fills)
+            price = self._step(portfolio, ts, bar, self.fills)
+            equity = float(portfolio.cash + portfolio.position * price)
             snapshot = {
                 "ts": ts,
                 "price": price,
                 "position": float(portfolio.position),
                 "cash": float(portfolio.cash),
-                "equity": float(portfolio.cash + portfolio.position * price),
-                "drawdown": float(dd),
+                "equity": equity,
+                "drawdown": float(self.accumulator.update(equity)),
             }
             self.history.append(snapshot)
+            if monitor is not None:
+                reason = monitor.check(equity, len(self.fills) > n_fills)
+                if reason is not None:
+                    self._abort(reason, ts, len(feed.df) - monitor.bars)
+                    break
+        if not self.history:
+            return pd.DataFrame(columns=["ts", *HISTORY_COLUMNS], dtype=float).set_index("ts")
         df = pd.DataFrame(self.history)
         df = df.set_index("ts")
+        return self._flag(self.policy.cast_frame(df, self.policy.history_dtypes()))
+
+    @property
+    def policy(self) -> DtypePolicy:
+        return self.dtypes if self.dtypes is not None else self.feed.dtypes
+
+    def _make_context(self, feed: DataFeed, ckpt: Checkpoint | None) -> ArrayBarContext | None:
+        """Lookback context positioned before the first bar of ``feed``.
+
+        ``feed`` is a suffix of ``self.feed``; when resuming and the earlier bars are
+        not in ``self.feed``, the checkpoint's copy of the last ``lookback`` bars is
+        prepended instead (a one-off copy of the remaining bars).
+        """
+        lookback = self.strategy.lookback
+        if lookback is None:
+            return None
+        full = self.feed.df
+        start = len(full) - len(feed.df)
+        needed = 0 if ckpt is None else min(lookback, ckpt.n_bars)
+        if start >= needed or ckpt is None or ckpt.lookback is None:
+            cols = {c: full[c].to_numpy() for c in REQUIRED_COLS}
+            return ArrayBarContext(cols, lookback, i=start - 1)
+        tail = ckpt.lookback
+        cols = {c: np.concatenate((tail[c], feed.df[c].to_numpy())) for c in REQUIRED_COLS}
+        return ArrayBarContext(cols, lookback, i=len(tail["close"]) - 1)
+
+    def _abort(self, reason: AbortReason, ts: pd.Timestamp, n_skipped: int) -> None:
+        self.aborted = reason
+        self.n_bars -= n_skipped
+        self.last_ts = ts
+
+    def _flag(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.aborted is not None:
+            df.attrs["aborted"] = self.aborted
         return df
+
+    def _restore(self, ckpt: Checkpoint) -> tuple[Portfolio, DataFeed]:
+        if (ckpt.strategy_name, ckpt.strategy_params) != (
+            self.strategy.name,
+            self.strategy.params,
+        ):
+            raise ValueError(
+                f"Checkpoint is for strategy {ckpt.strategy_name} {ckpt.strategy_params}, "
+                f"not {self.strategy.name} {self.strategy.params}"
+            )
+        if ckpt.broker != self.broker:
+            raise ValueError(f"Broker {self.broker} differs from checkpoint broker {ckpt.broker}")
+        if (ckpt.risk_overlay is None) != (self.risk_overlay is None):
+            raise ValueError("Checkpoint and engine disagree on whether a risk overlay is set")
+        if ckpt.risk_overlay is not None:
+            self.risk_overlay = copy.deepcopy(ckpt.risk_overlay)
+        self.strategy.set_state(copy.deepcopy(ckpt.strategy_state))
+        self.accumulator = copy.deepcopy(ckpt.accumulator)
+        self.n_bars = ckpt.n_bars
+        self.last_ts = ckpt.ts
+        start = int(self.feed.df.index.searchsorted(ckpt.ts, side="right"))
+        return copy.deepcopy(ckpt.portfolio), DataFeed(
+            self.feed.df.iloc[start:], dtypes=self.feed.dtypes
+        )
+
+    def checkpoint(self) -> Checkpoint:
+        """Snapshot the state after the last processed bar for a later ``run(resume_from=...)``."""
+        if self.portfolio is None or self.last_ts is None:
+            raise ValueError("Nothing to checkpoint: run() has not processed any bars")
+        if self.aborted is not None:
+            raise ValueError(f"Cannot checkpoint a run aborted by its budget ({self.aborted})")
+        state = self.strategy.get_state()
+        if state is None:
+            raise ValueError(
+                f"Strategy '{self.strategy.name}' does not implement get_state/set_state"
+            )
+        return Checkpoint(
+            ts=self.last_ts,
+            n_bars=self.n_bars,
+            portfolio=copy.deepcopy(self.portfolio),
+            broker=copy.deepcopy(self.broker),
+            accumulator=copy.deepcopy(self.accumulator),
+            strategy_name=self.strategy.name,
+            strategy_params=dict(self.strategy.params),
+            strategy_state=copy.deepcopy(state),
+            risk_overlay=copy.deepcopy(self.risk_overlay),
+            lookback=self._ctx.tail() if self._ctx is not None else None,
+        )
+
+    def save_checkpoint(self, path: str) -> Checkpoint:
+        ckpt = self.checkpoint()
+        save_checkpoint(path, ckpt)
+        return ckpt
+
+    def _step(
+        self, portfolio: Portfolio, ts: pd.Timestamp, bar: dict[str, float], fills: list[Fill]
+    ) -> float:
+        """Process one bar: mark to market, route strategy orders, record fills."""
+        price = float(bar["close"])
+        portfolio.mark_to_market(price)
+        if self._ctx is not None:
+            self._ctx.i += 1
+        orders = self.strategy.on_bar(ts, bar)
+        if self.risk_overlay is not None:
+            self.risk_overlay.update(price)
+            orders = self.risk_overlay.apply(orders)
+        fills.extend(execute_orders(self.broker, portfolio, orders, price, ts))
+        return price
+
+    def _run_with_sink(
+        self,
+        portfolio: Portfolio,
+        sink: HistorySink,
+        feed: DataFeed,
+        monitor: BudgetMonitor | None = None,
+    ) -> pd.DataFrame:
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size must be > 0")
+        tz = feed.df.index.tz
+        sink.open(str(tz) if tz is not None else None, self.policy)
+        ts_buf = np.empty(self.chunk_size, dtype=np.int64)
+        bufs = {c: np.empty(self.chunk_size) for c in HISTORY_COLUMNS}
+        pending: list[Fill] = []
+        n = 0
+        for ts, bar in feed.iter_bars():
+            n_fills = len(pending)
+            price = self._step(portfolio, ts, bar, pending)
+            equity = float(portfolio.cash + portfolio.position * price)
+            ts_buf[n] = pd.Timestamp(ts).value
+            bufs["price"][n] = price
+            bufs["position"][n] = portfolio.position
+            bufs["cash"][n] = portfolio.cash
+            bufs["equity"][n] = equity
+            bufs["drawdown"][n] = self.accumulator.update(equity)
+            n += 1
+            if monitor is not None:
+                reason = monitor.check(equity, len(pending) > n_fills)
+                if reason is not None:
+                    self._abort(reason, ts, len(feed.df) - monitor.bars)
+                    break
+            if n == self.chunk_size:
+                self._flush(sink, ts_buf, bufs, n, pending)
+                n = 0
+        self._flush(sink, ts_buf, bufs, n, pending)
+        sink.close()
+        return self._flag(sink.to_frame())
+
+    def _run_blocks(
+        self,
+        portfolio: Portfolio,
+        feed: DataFeed,
+        block_size: int,
+        monitor: BudgetMonitor | None = None,
+    ) -> pd.DataFrame:
+        """Hand the strategy whole blocks and replay only the bars it acts on.
+
+        Position and cash are constant between action bars, so the other history rows
+        are filled in vectorized. In this mode ``history`` is not populated: rows are
+        returned as a DataFrame or streamed to ``sink`` (one chunk per block).
+        """
+        if block_size <= 0:
+            raise ValueError("block_size must be > 0")
+        index = pd.DatetimeIndex(feed.df.index)
+        # columns stay in the feed's storage dtype; each block is widened to float64
+        cols = {c: feed.df[c].to_numpy() for c in REQUIRED_COLS}
+        policy = self.policy
+        sink, overlay = self.sink, self.risk_overlay
+        if sink is not None:
+            sink.open(str(index.tz) if index.tz is not None else None, policy)
+        chunks: list[dict[str, HistoryArray]] = []
+        fills: list[Fill] = []
+        for start in range(0, len(index), block_size):
+            ts_block = index[start : start + block_size]
+            block = {
+                c: np.asarray(v[start : start + block_size], dtype=np.float64)
+                for c, v in cols.items()
+            }
+            for values in block.values():
+                values.flags.writeable = False
+            close = block["close"]
+            position, cash = np.empty(len(close)), np.empty(len(close))
+            cur = fed = 0
+            actions = self.strategy.on_bars(ts_block, block)
+            if self._ctx is not None:
+                self._ctx.i += len(close)
+            # (bar, reason) at which the budget stopped the run; the bars between two
+            # action bars share one position, so they are checked in one call
+            stop: tuple[int, AbortReason] | None = None
+            for i, orders in sorted(actions, key=lambda a: a[0]):
+                position[cur:i], cash[cur:i] = portfolio.position, portfolio.cash
+                if monitor is not None and i > cur:
+                    stop = self._check_range(monitor, close, position, cash, cur, i)
+                    if stop is not None:
+                        break
+                price = float(close[i])
+                portfolio.mark_to_market(price)
+                if overlay is not None:
+                    overlay.update_many(close[fed : i + 1])
+                    fed = i + 1
+                    orders = overlay.apply(orders)
+                new = execute_orders(self.broker, portfolio, orders, price, ts_block[i])
+                if monitor is not None and new:
+                    monitor.traded = True
+                fills.extend(new)
+                cur = i
+            if stop is None:
+                position[cur:], cash[cur:] = portfolio.position, portfolio.cash
+                if monitor is not None:
+                    stop = self._check_range(monitor, close, position, cash, cur, len(close))
+            n = stop[0] + 1 if stop is not None else len(close)
+            close, position, cash = close[:n], position[:n], cash[:n]
+            if overlay is not None:
+                overlay.update_many(close[fed:])
+            portfolio.mark_to_market(float(close[-1]))
+            equity = cash + position * close
+            chunk = {
+                "price": close,
+                "position": position,
+                "cash": cash,
+                "equity": equity,
+                "drawdown": self.accumulator.update_many(equity),
+            }
+            if sink is not None:
+                self._flush(sink, ts_block[:n].as_unit("ns").asi8, chunk, n, fills)
+            else:
+                chunks.append(policy.cast_columns(chunk, policy.history_dtypes()))
+                self.fills.extend(fills)
+                fills.clear()
+            if stop is not None:
+                self._abort(stop[1], ts_block[n - 1], len(index) - start - n)
+                index = index[: start + n]
+                break
+        if sink is not None:
+            sink.close()
+            return self._flag(sink.to_frame())
+        if not chunks:
+            return pd.DataFrame(columns=["ts", *HISTORY_COLUMNS], dtype=float).set_index("ts")
+        out = pd.DataFrame(
+            {c: np.concatenate([chunk[c] for chunk in chunks]) for c in HISTORY_COLUMNS},
+            index=index,
+        )
+        out.index.name = "ts"
+        return self._flag(out)
+
+    @staticmethod
+    def _check_range(
+        monitor: BudgetMonitor,
+        close: FloatArray,
+        position: FloatArray,
+        cash: FloatArray,
+        start: int,
+        end: int,
+    ) -> tuple[int, AbortReason] | None:
+        hit = monitor.check_many(cash[start:end] + position[start:end] * close[start:end])
+        return (start + hit[0], hit[1]) if hit is not None else None
+
+    def _flush(
+        self,
+        sink: HistorySink,
+        ts_buf: TsArray,
+        bufs: dict[str, FloatArray],
+        n: int,
+        pending: list[Fill],
+    ) -> None:
+        if n:
+            policy = self.policy
+            cols = policy.cast_columns({c: b[:n] for c, b in bufs.items()}, policy.history_dtypes())
+            sink.write_history(ts_buf[:n], cols)
+        if pending:
+            sink.write_fills(list(pending))
+            pending.clear()
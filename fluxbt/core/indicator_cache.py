@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+ENV_CACHE_DIR = "FLUXBT_INDICATOR_CACHE_DIR"
+ENV_CACHE_BYTES = "FLUXBT_INDICATOR_CACHE_BYTES"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+Array = npt.NDArray[np.generic]
+
+
+def fingerprint(values: npt.ArrayLike) -> str:
+    """Content hash of an array (dtype, shape and bytes); equal data gives equal keys."""
+    arr = np.ascontiguousarray(values)
+    if arr.dtype.hasobject:
+        raise TypeError("cannot fingerprint object arrays")
+    h = hashlib.sha1(usedforsecurity=False)
+    h.update(f"{arr.dtype.str}{arr.shape}".encode())
+    h.update(arr.reshape(-1).view(np.uint8).data)
+    return h.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / total if total else 0.0
+
+
+class IndicatorCache:
+    """Memoize indicator arrays keyed by name, params and a fingerprint of the input.
+
+    The in-process tier is an LRU bounded by ``max_bytes``. With ``disk_dir`` set,
+    results are also saved as ``.npy`` files and memory-mapped on a later miss, so
+    worker processes pointed at the same directory reuse each other's work. Returned
+    arrays are read-only; copy before modifying.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, disk_dir: str | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, Array] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @staticmethod
+    def key(name: str, params: tuple[object, ...], data: npt.ArrayLike) -> str:
+        return hashlib.sha1(
+            f"{name}{params!r}{fingerprint(data)}".encode(), usedforsecurity=False
+        ).hexdigest()
+
+    def get_or_compute(
+        self,
+        name: str,
+        params: tuple[object, ...],
+        data: npt.ArrayLike,
+        compute: Callable[[], npt.ArrayLike],
+    ) -> Array:
+        """Return the cached result for ``(name, params, data)``, computing it on a miss."""
+        key = self.key(name, params, data)
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return hit
+        value = self._load(key)
+        with self._lock:
+            if value is not None:
+                self.stats.disk_hits += 1
+            else:
+                self.stats.misses += 1
+        if value is None:
+            value = np.array(compute())
+            value.flags.writeable = False
+            self._save(key, value)
+        self._put(key, value)
+        return value
+
+    def _put(self, key: str, value: Array) -> None:
+        if value.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = value
+            self._nbytes += value.nbytes
+            while self._nbytes > self.max_bytes:
+                _, old = self._entries.popitem(last=False)
+                self._nbytes -= old.nbytes
+                self.stats.evictions += 1
+
+    def _path(self, key: str) -> str | None:
+        return os.path.join(self.disk_dir, f"{key}.npy") if self.disk_dir else None
+
+    def _load(self, key: str) -> Array | None:
+        path = self._path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            value: Array = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):  # truncated or foreign file: recompute
+            return None
+        return value
+
+    def _save(self, key: str, value: Array) -> None:
+        path = self._path(key)
+        if path is None or value.dtype.hasobject:
+            return
+        # write-then-rename so concurrent readers never map a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, value)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (disk files are kept) and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.stats = CacheStats()
+
+
+_default_cache: IndicatorCache | None = None
+_enabled = True
+
+
+def get_indicator_cache() -> IndicatorCache | None:
+    """Process-wide cache used by indicator helpers, or None when disabled.
+
+    Created on first use from ``FLUXBT_INDICATOR_CACHE_BYTES`` (memory budget) and
+    ``FLUXBT_INDICATOR_CACHE_DIR`` (optional shared disk tier), so pool workers that
+    inherit the environment share the same directory.
+    """
+    global _default_cache
+    if not _enabled:
+        return None
+    if _default_cache is None:
+        max_bytes = int(os.environ.get(ENV_CACHE_BYTES, DEFAULT_MAX_BYTES))
+        _default_cache = IndicatorCache(max_bytes, os.environ.get(ENV_CACHE_DIR) or None)
+    return _default_cache
+
+
+def set_indicator_cache(cache: IndicatorCache | None) -> None:
+    """Install ``cache`` as the process-wide cache; None disables caching."""
+    global _default_cache, _enabled
+    _default_cache = cache
+    _enabled = cache is not None
+
+
+def cached(
+    name: str,
+    params: tuple[object, ...],
+    data: npt.ArrayLike,
+    compute: Callable[[], npt.ArrayLike],
+) -> Array:
+    """``get_or_compute`` on the process-wide cache, or plain ``compute`` when disabled."""
+    cache = get_indicator_cache()
+    if cache is None:
+        return np.asarray(compute())
+    return cache.get_or_compute(name, params, data, compute)
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .broker import Broker
+from .engine import execute_orders
+from .lookback import RollingBarContext
+from .metrics import MetricsAccumulator
+from .orders import Fill, Order
+from .portfolio import Portfolio
+from .risk import RiskOverlay
+
+if TYPE_CHECKING:
+    from ..data.stream import BarStream
+    from ..strategies.base import BaseStrategy
+
+OverflowPolicy = Literal["block", "drop_oldest"]
+
+# (arrival time from time.perf_counter, ts, bar); None marks the end of the stream
+_QueueItem = tuple[float, pd.Timestamp, dict[str, float]] | None
+
+
+class AsyncSink:
+    """Receiver of live-engine events. Override the coroutines you need; all default to no-ops."""
+
+    async def on_order(self, ts: pd.Timestamp, order: Order) -> None:
+        pass
+
+    async def on_fill(self, fill: Fill) -> None:
+        pass
+
+    async def on_bar(self, ts: pd.Timestamp, snapshot: dict[str, float]) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class RecordingSink(AsyncSink):
+    """Keep every event in memory (paper-trading logs, tests)."""
+
+    def __init__(self) -> None:
+        self.orders: list[tuple[pd.Timestamp, Order]] = []
+        self.fills: list[Fill] = []
+        self.bars: list[tuple[pd.Timestamp, dict[str, float]]] = []
+
+    async def on_order(self, ts: pd.Timestamp, order: Order) -> None:
+        self.orders.append((ts, order))
+
+    async def on_fill(self, fill: Fill) -> None:
+        self.fills.append(fill)
+
+    async def on_bar(self, ts: pd.Timestamp, snapshot: dict[str, float]) -> None:
+        self.bars.append((ts, snapshot))
+
+
+class QueueSink(AsyncSink):
+    """Forward ``("order" | "fill" | "bar", payload)`` events to an ``asyncio.Queue``.
+
+    Awaiting ``put`` on a bounded queue applies backpressure to the engine when the
+    downstream consumer falls behind.
+    """
+
+    def __init__(self, queue: asyncio.Queue[tuple[str, object]]) -> None:
+        self.queue = queue
+
+    async def on_order(self, ts: pd.Timestamp, order: Order) -> None:
+        await self.queue.put(("order", (ts, order)))
+
+    async def on_fill(self, fill: Fill) -> None:
+        await self.queue.put(("fill", fill))
+
+    async def on_bar(self, ts: pd.Timestamp, snapshot: dict[str, float]) -> None:
+        await self.queue.put(("bar", (ts, snapshot)))
+
+
+@dataclass
+class LatencyStats:
+    """Rolling sample of durations (seconds) over the last ``maxlen`` observations."""
+
+    maxlen: int = 100_000
+    count: int = 0
+    _samples: npt.NDArray[np.float64] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._samples = np.empty(self.maxlen)
+
+    def record(self, seconds: float) -> None:
+        self._samples[self.count % self.maxlen] = seconds
+        self.count += 1
+
+    def percentiles(self, qs: Sequence[float] = (50, 90, 99)) -> dict[str, float]:
+        """Percentiles in milliseconds, keyed ``p50``, ``p90``, ... (NaN when empty)."""
+        window = self._samples[: min(self.count, self.maxlen)]
+        if not len(window):
+            return {f"p{q:g}": float("nan") for q in qs}
+        values = np.percentile(window, list(qs)) * 1_000.0
+        return {f"p{q:g}": float(v) for q, v in zip(qs, values, strict=True)}
+
+
+@dataclass
+class LiveEngine:
+    """Drive a strategy from an async bar stream (live or paper trading).
+
+    Uses the same ``BaseStrategy``, ``Broker`` and ``Portfolio`` as ``BacktestEngine``,
+    so replaying a ``DataFeed`` through ``replay_feed`` reproduces a backtest exactly.
+
+    A reader task moves bars from ``stream`` into a queue of ``queue_size`` bars. When
+    it is full, ``overflow="block"`` stops reading (backpressure on the source) and
+    ``"drop_oldest"`` discards the stalest bar (counted in ``dropped``). With
+    ``offload=True`` each ``on_bar`` call runs in ``executor`` (default: the loop's
+    thread pool) so slow strategies never block the event loop; calls stay sequential.
+
+    ``latency`` measures per-bar decision time (strategy plus order routing) and
+    ``queue_wait`` the time a bar spent queued before processing.
+    """
+
+    stream: BarStream
+    broker: Broker
+    strategy: BaseStrategy
+    initial_cash: float = 100_000.0
+    sinks: list[AsyncSink] = field(default_factory=list)
+    queue_size: int = 1_000
+    overflow: OverflowPolicy = "block"
+    offload: bool = True
+    executor: Executor | None = None
+    keep_history: bool = True
+    risk_overlay: RiskOverlay | None = None
+
+    fills: list[Fill] = field(default_factory=list)
+    history: list[dict[str, float]] = field(default_factory=list)
+    accumulator: MetricsAccumulator = field(default_factory=MetricsAccumulator)
+    latency: LatencyStats = field(default_factory=LatencyStats)
+    queue_wait: LatencyStats = field(default_factory=LatencyStats)
+    dropped: int = 0
+
+    def __post_init__(self) -> None:
+        if self.queue_size <= 0:
+            raise ValueError("queue_size must be > 0")
+        if self.overflow not in ("block", "drop_oldest"):
+            raise ValueError("overflow must be 'block' or 'drop_oldest'")
+        self.portfolio = Portfolio(cash=self.initial_cash)
+        self._queue: asyncio.Queue[_QueueItem] | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    async def _read(self, queue: asyncio.Queue[_QueueItem]) -> None:
+        try:
+            async for ts, bar in self.stream:
+                if self.overflow == "drop_oldest" and queue.full():
+                    queue.get_nowait()
+                    self.dropped += 1
+                await queue.put((time.perf_counter(), ts, bar))
+        finally:
+            if not self._stopping:
+                await queue.put(None)
+
+    def stop(self) -> None:
+        """Stop reading the stream; bars still queued are discarded."""
+        self._stopping = True
+        if self._reader is not None:
+            self._reader.cancel()
+        if self._queue is not None and not self._queue.full():
+            self._queue.put_nowait(None)
+
+    async def _emit(
+        self, ts: pd.Timestamp, orders: list[Order], fills: list[Fill], snapshot: dict[str, float]
+    ) -> None:
+        for sink in self.sinks:
+            for order in orders:
+                await sink.on_order(ts, order)
+            for fill in fills:
+                await sink.on_fill(fill)
+            await sink.on_bar(ts, snapshot)
+
+    async def run(self) -> pd.DataFrame:
+        loop = asyncio.get_running_loop()
+        portfolio = self.portfolio = Portfolio(cash=self.initial_cash)
+        self.strategy.reset()
+        lookback = self.strategy.lookback
+        ctx = RollingBarContext(lookback) if lookback is not None else None
+        self.strategy.bind(ctx)
+        self.accumulator = MetricsAccumulator()
+        if self.risk_overlay is not None:
+            self.risk_overlay.reset()
+        self._stopping = False
+        queue: asyncio.Queue[_QueueItem] = asyncio.Queue(maxsize=self.queue_size)
+        self._queue = queue
+        self._reader = reader = asyncio.create_task(self._read(queue))
+        try:
+            while True:
+                item = await queue.get()
+                if item is None or self._stopping:
+                    break
+                arrived, ts, bar = item
+                start = time.perf_counter()
+                self.queue_wait.record(start - arrived)
+
+                price = float(bar["close"])
+                portfolio.mark_to_market(price)
+                if ctx is not None:
+                    ctx.append(bar)
+                if self.offload:
+                    orders = await loop.run_in_executor(
+                        self.executor, self.strategy.on_bar, ts, bar
+                    )
+                else:
+                    orders = self.strategy.on_bar(ts, bar)
+                if self.risk_overlay is not None:
+                    self.risk_overlay.update(price)
+                    orders = self.risk_overlay.apply(orders)
+                fills = execute_orders(self.broker, portfolio, orders, price, ts)
+                self.latency.record(time.perf_counter() - start)
+
+                equity = float(portfolio.cash + portfolio.position * price)
+                snapshot = {
+                    "price": price,
+                    "position": float(portfolio.position),
+                    "cash": float(portfolio.cash),
+                    "equity": equity,
+                    "drawdown": float(self.accumulator.update(equity)),
+                }
+                self.fills.extend(fills)
+                if self.keep_history:
+                    self.history.append({"ts": ts, **snapshot})
+                await self._emit(ts, orders, fills, snapshot)
+        finally:
+            if not reader.done():
+                self._stopping = True
+                reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
+            for sink in self.sinks:
+                await sink.close()
+            self._queue = self._reader = None
+        if not self.history:
+            return pd.DataFrame()
+        return pd.DataFrame(self.history).set_index("ts")
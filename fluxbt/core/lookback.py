@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from ..data.feed import REQUIRED_COLS
+
+Window = npt.NDArray[Any]
+
+
+class BarContext(ABC):
+    """Lookback access for strategies: ``window(field, n)`` ends at the current bar.
+
+    Engines bind a context to every strategy that declares a ``lookback`` and move it
+    to each bar before calling the strategy, so a window can never include a future
+    bar. Windows are read-only views (no copy) in the feed's storage dtype, hold
+    fewer than ``n`` values until that many bars have been seen, and are only valid
+    during the current bar: copy anything you keep.
+    """
+
+    def __init__(self, max_lookback: int) -> None:
+        if max_lookback <= 0:
+            raise ValueError("max_lookback must be > 0")
+        self.max_lookback = max_lookback
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Bars seen so far, including the current one."""
+
+    @abstractmethod
+    def _view(self, field: str, n: int) -> Window: ...
+
+    def window(self, field: str, n: int) -> Window:
+        """The last ``n`` values of ``field`` (e.g. "close"), current bar last."""
+        if not 0 < n <= self.max_lookback:
+            raise ValueError(
+                f"window of {n} bars is outside the declared lookback (1..{self.max_lookback})"
+            )
+        return self._view(field, n)
+
+    def tail(self) -> dict[str, Window]:
+        """Copies of the last ``max_lookback`` bars of every field (for checkpoints)."""
+        n = min(len(self), self.max_lookback)
+        if not n:
+            return {c: np.empty(0) for c in REQUIRED_COLS}
+        return {c: np.array(self._view(c, n)) for c in REQUIRED_COLS}
+
+
+def _readonly(values: npt.ArrayLike) -> Window:
+    view: Window = np.asarray(values).view()
+    view.flags.writeable = False
+    return view
+
+
+class ArrayBarContext(BarContext):
+    """Context over whole columns (a ``DataFeed``'s arrays); ``i`` is the current bar."""
+
+    def __init__(
+        self, columns: Mapping[str, npt.ArrayLike], max_lookback: int, i: int = -1
+    ) -> None:
+        super().__init__(max_lookback)
+        self._cols = {c: _readonly(v) for c, v in columns.items()}
+        self.i = i
+
+    def __len__(self) -> int:
+        return self.i + 1
+
+    def _view(self, field: str, n: int) -> Window:
+        end = self.i + 1
+        return self._cols[field][max(end - n, 0) : end]
+
+
+class RollingBarContext(BarContext):
+    """Context for streamed bars: keeps only the last ``max_lookback`` bars.
+
+    Each field lives in a buffer of twice that size; when it fills up, the newest
+    ``max_lookback - 1`` values move to the front, so windows stay contiguous views
+    and appends cost amortized O(1).
+    """
+
+    def __init__(self, max_lookback: int) -> None:
+        super().__init__(max_lookback)
+        self._bufs = {c: np.empty(2 * max_lookback) for c in REQUIRED_COLS}
+        self._end = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, bar: Mapping[str, float]) -> None:
+        keep = self.max_lookback - 1
+        if self._end == 2 * self.max_lookback:
+            for buf in self._bufs.values():
+                buf[:keep] = buf[self._end - keep : self._end]
+            self._end = keep
+        for c, buf in self._bufs.items():
+            buf[self._end] = bar[c]
+        self._end += 1
+        self._count += 1
+
+    def _view(self, field: str, n: int) -> Window:
+        return _readonly(self._bufs[field][max(self._end - n, 0) : self._end])
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import math
+from dataclasses import dataclass
 from typing import Dict, Literal
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from .utils import annualization_factor
@@ -12,26 +15,26 @@ def _nan_safe(series: pd.Series) -> pd.Series:
     return series.replace([np.inf, -np.inf], np.nan).dropna()
 
 
+METRIC_NAMES = [
+    "total_return",
+    "cagr",
+    "ann_vol",
+    "sharpe",
+    "max_dd",
+    "calmar",
+    "hit_rate",
+    "avg_win",
+    "avg_loss",
+    "profit_factor",
+]
+
+
 def compute_metrics(
     equity: pd.Series, freq: Literal["D", "H", "MIN"], rf: float = 0.0
 ) -> Dict[str, float]:
     equity = equity.dropna()
     if equity.empty:
-        return {
-            k: float("nan")
-            for k in [
-                "total_return",
-                "cagr",
-                "ann_vol",
-                "sharpe",
-                "max_dd",
-                "calmar",
-                "hit_rate",
-                "avg_win",
-                "avg_loss",
-                "profit_factor",
-            ]
-        }
+        return {k: float("nan") for k in METRIC_NAMES}
 
     ret = equity.pct_change().fillna(0.0)
     ann = annualization_factor(freq)
@@ -78,3 +81,209 @@ def compute_metrics(
         "avg_loss": avg_loss,
         "profit_factor": profit_factor,
     }
+
+
+def compute_metrics_batch(
+    equity: pd.DataFrame, freq: Literal["D", "H", "MIN"], rf: float = 0.0
+) -> pd.DataFrame:
+    """``compute_metrics`` of every column of ``equity`` in one vectorized pass.
+
+    Returns one row per column with ``METRIC_NAMES`` as columns. NaN values are
+    dropped per column, as in ``compute_metrics``, so curves covering different
+    periods can share one index. Results agree with ``compute_metrics`` up to
+    floating-point rounding.
+    """
+    eq = equity.to_numpy(dtype=np.float64, na_value=np.nan)
+    n_rows, n_cols = eq.shape
+    cols = np.arange(n_cols)
+    ann = annualization_factor(freq)
+    valid = ~np.isnan(eq)
+    count = valid.sum(axis=0)
+    has = count > 0
+
+    # row of the latest valid value at or before each row; returns are taken against
+    # the previous valid value, like pct_change after dropna
+    latest = np.maximum.accumulate(np.where(valid, np.arange(n_rows)[:, None], -1), axis=0)
+    prev_row = np.vstack([np.full((1, n_cols), -1), latest[:-1]])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        prev = np.where(prev_row >= 0, eq[np.maximum(prev_row, 0), cols], np.nan)
+        ret = np.where(valid, eq / prev - 1.0, 0.0)
+    ret[valid & (prev_row < 0)] = 0.0
+    n = np.maximum(count, 1)
+
+    first = eq[np.argmax(valid, axis=0), cols]
+    last = eq[np.maximum(latest[-1], 0), cols] if n_rows else np.full(n_cols, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        total_return = last / first - 1.0
+        years = np.maximum(count - 1, 1) / ann
+        cagr = (last / first) ** (1 / years) - 1
+
+        mean = ret.sum(axis=0) / n
+        std = np.sqrt((np.where(valid, ret - mean, 0.0) ** 2).sum(axis=0) / n)
+        ann_vol = np.where(count > 1, std * np.sqrt(ann), np.nan)
+        sharpe = np.where(std > 0, (mean - rf / ann) / std * np.sqrt(ann), np.nan)
+
+        peak = np.fmax.accumulate(eq, axis=0)
+        max_dd = np.where(valid, (eq - peak) / peak, np.inf).min(axis=0)
+        calmar = np.where(max_dd < 0, cagr / np.abs(max_dd), np.nan)
+
+        wins, losses = valid & (ret > 0), valid & (ret < 0)
+        n_wins, n_losses = wins.sum(axis=0), losses.sum(axis=0)
+        sum_wins = np.where(wins, ret, 0.0).sum(axis=0)
+        sum_losses = np.where(losses, ret, 0.0).sum(axis=0)
+        out = pd.DataFrame(
+            {
+                "total_return": total_return,
+                "cagr": cagr,
+                "ann_vol": ann_vol,
+                "sharpe": sharpe,
+                "max_dd": max_dd,
+                "calmar": calmar,
+                "hit_rate": n_wins / np.maximum(n_wins + n_losses, 1),
+                "avg_win": np.where(n_wins > 0, sum_wins / np.maximum(n_wins, 1), 0.0),
+                "avg_loss": np.where(n_losses > 0, sum_losses / np.maximum(n_losses, 1), 0.0),
+                "profit_factor": np.where(
+                    np.abs(sum_losses) > 0, sum_wins / np.abs(sum_losses), np.inf
+                ),
+            },
+            index=equity.columns,
+        )
+    out.loc[~has, :] = np.nan
+    return out
+
+
+@dataclass
+class MetricsAccumulator:
+    """Running aggregates of an equity curve, updated in O(1) per bar.
+
+    ``result`` returns the same dictionary as ``compute_metrics`` on the full equity
+    series, so long runs can report metrics without keeping their history.
+    """
+
+    count: int = 0
+    first: float = math.nan
+    last: float = math.nan
+    peak: float = -math.inf
+    max_dd: float = 0.0
+    # Welford running mean/M2 of per-bar returns (the first return counts as 0); returns
+    # after a zero equity are undefined and left out, so ``n_rets`` can trail ``count``
+    n_rets: int = 0
+    ret_mean: float = 0.0
+    ret_m2: float = 0.0
+    n_wins: int = 0
+    n_losses: int = 0
+    sum_wins: float = 0.0
+    sum_losses: float = 0.0
+
+    def update(self, equity: float) -> float:
+        """Add one equity value; returns the current drawdown from the running peak."""
+        if equity != equity:  # NaN values are dropped, as in compute_metrics
+            return 0.0
+        if self.count == 0:
+            ret = 0.0
+            self.first = equity
+        elif self.last != 0:
+            ret = equity / self.last - 1.0
+        else:  # pct_change gives inf/NaN here too
+            ret = math.nan
+        self.count += 1
+        self.last = equity
+        if math.isfinite(ret):
+            self.n_rets += 1
+            delta = ret - self.ret_mean
+            self.ret_mean += delta / self.n_rets
+            self.ret_m2 += delta * (ret - self.ret_mean)
+            if ret > 0:
+                self.n_wins += 1
+                self.sum_wins += ret
+            elif ret < 0:
+                self.n_losses += 1
+                self.sum_losses += ret
+        if equity > self.peak:
+            self.peak = equity
+        dd = (equity - self.peak) / self.peak if self.peak != 0 else 0.0
+        if dd < self.max_dd:
+            self.max_dd = dd
+        return dd
+
+    def update_many(self, equity: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Vectorized ``update`` over an array; returns the drawdown of every value.
+
+        Drawdowns are identical to repeated ``update`` calls; return moments are merged
+        in one step, so metrics agree with ``update`` up to floating-point rounding.
+        """
+        eq = np.asarray(equity, dtype=np.float64)
+        out = np.zeros(len(eq))
+        valid = ~np.isnan(eq)
+        values = eq[valid]
+        if not len(values):
+            return out
+        prev = np.empty(len(values))
+        prev[0] = self.last if self.count else values[0]
+        prev[1:] = values[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rets = values / prev - 1.0
+        if self.count == 0:
+            rets[0] = 0.0
+        rets = rets[np.isfinite(rets)]  # returns after a zero equity, as in ``update``
+        n_new = len(rets)
+        if n_new:
+            # Chan et al. pairwise merge of (count, mean, M2)
+            mean_new = float(rets.mean())
+            m2_new = float(((rets - mean_new) ** 2).sum())
+            total = self.n_rets + n_new
+            delta = mean_new - self.ret_mean
+            self.ret_m2 += m2_new + delta * delta * self.n_rets * n_new / total
+            self.ret_mean += delta * n_new / total
+            self.n_rets = total
+            wins, losses = rets[rets > 0], rets[rets < 0]
+            self.n_wins += len(wins)
+            self.n_losses += len(losses)
+            self.sum_wins += float(wins.sum())
+            self.sum_losses += float(losses.sum())
+        if self.count == 0:
+            self.first = float(values[0])
+        self.count += len(values)
+        self.last = float(values[-1])
+
+        peak = np.maximum.accumulate(np.maximum(values, self.peak))
+        self.peak = float(peak[-1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dd = np.where(peak != 0, (values - peak) / peak, 0.0)
+        self.max_dd = min(self.max_dd, float(dd.min()))
+        out[valid] = dd
+        return out
+
+    def result(self, freq: Literal["D", "H", "MIN"], rf: float = 0.0) -> Dict[str, float]:
+        if self.count == 0:
+            return {k: float("nan") for k in METRIC_NAMES}
+        ann = annualization_factor(freq)
+        ratio = self.last / self.first if self.first != 0 else math.nan
+        total_return = ratio - 1.0
+        years = max(self.count - 1, 1) / ann
+        # math.pow, unlike float ** float, does not turn a negative ratio into a complex
+        cagr = math.pow(ratio, 1 / years) - 1 if ratio >= 0 else math.nan
+        std = math.sqrt(max(self.ret_m2, 0.0) / self.n_rets) if self.n_rets else math.nan
+        ann_vol = float(std * math.sqrt(ann)) if self.count > 1 else float("nan")
+        sharpe = (
+            float((self.ret_mean - rf / ann) / std * math.sqrt(ann)) if std > 0 else float("nan")
+        )
+        max_dd = float(self.max_dd)
+        calmar = float(cagr / abs(max_dd)) if max_dd < 0 else float("nan")
+        n_signed = self.n_wins + self.n_losses
+        return {
+            "total_return": total_return,
+            "cagr": cagr,
+            "ann_vol": ann_vol,
+            "sharpe": sharpe,
+            "max_dd": max_dd,
+            "calmar": calmar,
+            "hit_rate": float(self.n_wins / max(n_signed, 1)),
+            "avg_win": float(self.sum_wins / self.n_wins) if self.n_wins else 0.0,
+            "avg_loss": float(self.sum_losses / self.n_losses) if self.n_losses else 0.0,
+            "profit_factor": (
+                float(self.sum_wins / abs(self.sum_losses))
+                if abs(self.sum_losses) > 0
+                else float("inf")
+            ),
+        }
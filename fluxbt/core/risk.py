@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import math
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from typing import Literal
+
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from .orders import Order
 from .utils import annualization_factor
 
 
@@ -33,3 +40,158 @@ def cap_position_fraction(fraction: float, max_abs_fraction: float) -> float:
     if max_abs_fraction <= 0:
         return 0.0
     return float(max(-max_abs_fraction, min(fraction, max_abs_fraction)))
+
+
+class RollingVolatility:
+    """O(1)-per-update population std (``ddof=0``) of the last ``window`` simple returns.
+
+    Running sums are refreshed from the ring buffer every ``window`` updates so
+    floating-point drift cannot accumulate over long runs.
+    """
+
+    def __init__(self, window: int = 20) -> None:
+        if window < 2:
+            raise ValueError("window must be >= 2")
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        self._buf = [0.0] * self.window
+        self._pos = 0
+        self.count = 0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._since_refresh = 0
+        self.last_price = math.nan
+
+    def _refresh(self) -> None:
+        values = self._buf[: self.count] if self.count < self.window else self._buf
+        self._sum = math.fsum(values)
+        self._sumsq = math.fsum(v * v for v in values)
+        self._since_refresh = 0
+
+    def update(self, price: float) -> None:
+        last, self.last_price = self.last_price, price
+        if last != last or last == 0:  # first price (NaN) or undefined return
+            return
+        ret = price / last - 1.0
+        if self.count == self.window:
+            old = self._buf[self._pos]
+            self._sum -= old
+            self._sumsq -= old * old
+        else:
+            self.count += 1
+        self._buf[self._pos] = ret
+        self._sum += ret
+        self._sumsq += ret * ret
+        self._pos = (self._pos + 1) % self.window
+        self._since_refresh += 1
+        if self._since_refresh >= self.window:
+            self._refresh()
+
+    def update_many(self, prices: npt.NDArray[np.float64]) -> None:
+        """Equivalent to ``update`` for each price; only the last ``window`` returns are kept."""
+        if not len(prices):
+            return
+        series = np.concatenate(([self.last_price], prices))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rets = series[1:] / series[:-1] - 1.0
+        rets = rets[np.isfinite(rets) & (series[:-1] != 0)]
+        self.last_price = float(prices[-1])
+        if not len(rets):
+            return
+        ordered = self._buf[self._pos :] + self._buf[: self._pos]
+        recent = ordered[self.window - self.count :] + rets[-self.window :].tolist()
+        self.count = min(len(recent), self.window)
+        self._buf = recent[-self.count :] + [0.0] * (self.window - self.count)
+        self._pos = self.count % self.window
+        self._refresh()
+
+    @property
+    def std(self) -> float:
+        """Current std of returns; NaN until two returns have been seen."""
+        if self.count < 2:
+            return math.nan
+        mean = self._sum / self.count
+        return math.sqrt(max(self._sumsq / self.count - mean * mean, 0.0))
+
+
+class RiskOverlay(ABC):
+    """Stage between strategy orders and the broker, fed every bar's price by the engine."""
+
+    def reset(self) -> None:  # noqa: B027 - optional hook
+        pass
+
+    @abstractmethod
+    def update(self, price: float) -> None:
+        raise NotImplementedError
+
+    def update_many(self, prices: npt.NDArray[np.float64]) -> None:
+        for price in prices:
+            self.update(float(price))
+
+    @abstractmethod
+    def apply(self, orders: list[Order]) -> list[Order]:
+        """Return the orders to send to the broker (resized or dropped as needed)."""
+        raise NotImplementedError
+
+
+class VolTargetOverlay(RiskOverlay):
+    """Scale ``PCT:`` order sizes so the position targets ``target_ann_vol``.
+
+    Uses the streaming equivalent of ``target_position_scale`` over a rolling window
+    of bar returns, capped by ``max_scale`` and, after scaling, ``cap_position_fraction``
+    with ``max_fraction``. Share-count and ``CLOSE`` orders pass through unchanged, as
+    do all orders until ``min_periods`` returns are available.
+    """
+
+    def __init__(
+        self,
+        target_ann_vol: float = 0.10,
+        window: int = 20,
+        freq: Literal["D", "H", "MIN"] = "D",
+        max_scale: float = 5.0,
+        max_fraction: float = 1.0,
+        min_periods: int | None = None,
+    ) -> None:
+        self.target_ann_vol = target_ann_vol
+        self.freq = freq
+        self.max_scale = max_scale
+        self.max_fraction = max_fraction
+        self.min_periods = window if min_periods is None else min_periods
+        self._ann_sqrt = math.sqrt(annualization_factor(freq))
+        self.vol = RollingVolatility(window)
+
+    def reset(self) -> None:
+        self.vol.reset()
+
+    def update(self, price: float) -> None:
+        self.vol.update(price)
+
+    def update_many(self, prices: npt.NDArray[np.float64]) -> None:
+        self.vol.update_many(prices)
+
+    def scale(self) -> float | None:
+        """Current size multiplier, or None while fewer than ``min_periods`` returns exist."""
+        if self.vol.count < max(self.min_periods, 2):
+            return None
+        ann_vol = self.vol.std * self._ann_sqrt
+        if ann_vol <= 0:
+            return self.max_scale
+        return min(self.target_ann_vol / ann_vol, self.max_scale)
+
+    def apply(self, orders: list[Order]) -> list[Order]:
+        scale = self.scale()
+        if scale is None:
+            return orders
+        out: list[Order] = []
+        for order in orders:
+            if isinstance(order.qty, str) and order.qty.startswith("PCT:"):
+                frac = cap_position_fraction(
+                    float(order.qty.split(":", 1)[1]) * scale, self.max_fraction
+                )
+                if frac <= 0:
+                    continue
+                order = replace(order, qty=f"PCT:{frac}")
+            out.append(order)
+        return out
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ..dtypes import FLOAT64_POLICY, DtypePolicy
+from .columnar import (
+    FILL_COLUMNS,
+    TS_COLUMN,
+    NpyAppender,
+    RunArtifact,
+    fills_to_frame,
+    write_manifest,
+)
+from .orders import Fill
+
+HISTORY_COLUMNS = ["price", "position", "cash", "equity", "drawdown"]
+
+TsArray = npt.NDArray[np.int64]
+FloatArray = npt.NDArray[np.float64]
+# History columns as stored, per the run's `DtypePolicy` (e.g. int32 positions)
+HistoryArray = npt.NDArray[Any]
+
+
+def chunk_to_frame(ts: TsArray, cols: dict[str, HistoryArray], tz: str | None) -> pd.DataFrame:
+    idx = pd.DatetimeIndex(pd.to_datetime(np.asarray(ts), utc=True))
+    idx = idx.tz_convert(tz) if tz else idx.tz_localize(None)
+    df = pd.DataFrame({c: np.array(cols[c]) for c in HISTORY_COLUMNS}, index=idx)
+    df.index.name = TS_COLUMN
+    return df
+
+
+class HistorySink(ABC):
+    """Destination for engine history and fills, delivered in fixed-size chunks.
+
+    ``BacktestEngine`` reuses its chunk buffers, so sinks must copy any arrays they
+    keep. Lifecycle per run: ``open`` -> ``write_history``/``write_fills`` -> ``close``.
+    History columns arrive already cast to ``dtypes.history_dtypes()``.
+    """
+
+    tz: str | None = None
+    dtypes: DtypePolicy = FLOAT64_POLICY
+
+    def open(self, tz: str | None, dtypes: DtypePolicy = FLOAT64_POLICY) -> None:
+        self.tz = tz
+        self.dtypes = dtypes
+
+    @abstractmethod
+    def write_history(self, ts: TsArray, cols: dict[str, HistoryArray]) -> None:
+        raise NotImplementedError
+
+    def write_fills(self, fills: list[Fill]) -> None:  # noqa: B027 - optional hook
+        pass
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        pass
+
+    @abstractmethod
+    def to_frame(self) -> pd.DataFrame:
+        """History retained by the sink, indexed by timestamp."""
+        raise NotImplementedError
+
+
+class CallbackSink(HistorySink):
+    """Hand each history chunk (as a DataFrame) and fill batch to callbacks; keep nothing."""
+
+    def __init__(
+        self,
+        on_history: Callable[[pd.DataFrame], None],
+        on_fills: Callable[[list[Fill]], None] | None = None,
+    ) -> None:
+        self.on_history = on_history
+        self.on_fills = on_fills
+
+    def write_history(self, ts: TsArray, cols: dict[str, HistoryArray]) -> None:
+        self.on_history(chunk_to_frame(ts, cols, self.tz))
+
+    def write_fills(self, fills: list[Fill]) -> None:
+        if self.on_fills is not None:
+            self.on_fills(fills)
+
+    def to_frame(self) -> pd.DataFrame:
+        return chunk_to_frame(
+            np.empty(0, dtype=np.int64), {c: np.empty(0) for c in HISTORY_COLUMNS}, self.tz
+        )
+
+
+class RingBufferSink(HistorySink):
+    """Keep only the last ``maxlen`` history rows and fills in preallocated buffers."""
+
+    def __init__(self, maxlen: int) -> None:
+        if maxlen <= 0:
+            raise ValueError("maxlen must be > 0")
+        self.maxlen = maxlen
+        self._ts = np.empty(maxlen, dtype=np.int64)
+        self._cols = {c: np.empty(maxlen) for c in HISTORY_COLUMNS}
+        self._written = 0
+        self.fills: deque[Fill] = deque(maxlen=maxlen)
+
+    def open(self, tz: str | None, dtypes: DtypePolicy = FLOAT64_POLICY) -> None:
+        super().open(tz, dtypes)
+        self._cols = {c: np.empty(self.maxlen, dtype=d) for c, d in dtypes.history_dtypes().items()}
+        self._written = 0
+        self.fills.clear()
+
+    def write_history(self, ts: TsArray, cols: dict[str, HistoryArray]) -> None:
+        n = len(ts)
+        if n >= self.maxlen:
+            ts, cols = ts[-self.maxlen :], {c: v[-self.maxlen :] for c, v in cols.items()}
+            self._written += n - self.maxlen
+            n = self.maxlen
+        pos = self._written % self.maxlen
+        first = min(n, self.maxlen - pos)
+        for dst, src in [(self._ts, ts), *((self._cols[c], cols[c]) for c in HISTORY_COLUMNS)]:
+            dst[pos : pos + first] = src[:first]
+            dst[: n - first] = src[first:n]
+        self._written += n
+
+    def write_fills(self, fills: list[Fill]) -> None:
+        self.fills.extend(fills)
+
+    def to_frame(self) -> pd.DataFrame:
+        size = min(self._written, self.maxlen)
+        order = (np.arange(size) + self._written - size) % self.maxlen
+        return chunk_to_frame(
+            self._ts[order], {c: v[order] for c, v in self._cols.items()}, self.tz
+        )
+
+
+class NpyFileSink(HistorySink):
+    """Stream history and fills to an ``npy`` run-artifact directory on disk.
+
+    The result is readable with ``read_artifact(out_dir)`` (memory-mapped) and
+    ``to_frame`` returns a DataFrame backed by those maps without copying columns.
+    Order ids are stored with a fixed width of ``id_width`` characters. With
+    ``append=True`` rows are added to an existing sink directory (e.g. when resuming
+    from a checkpoint) instead of replacing it.
+    """
+
+    def __init__(self, out_dir: str, id_width: int = 64, append: bool = False) -> None:
+        self.out_dir = out_dir
+        self.id_width = id_width
+        self.append = append
+        self._history: dict[str, NpyAppender] = {}
+        self._fills: dict[str, NpyAppender] = {}
+
+    def open(self, tz: str | None, dtypes: DtypePolicy = FLOAT64_POLICY) -> None:
+        super().open(tz, dtypes)
+        hist_dir = os.path.join(self.out_dir, "history")
+        fills_dir = os.path.join(self.out_dir, "fills")
+        os.makedirs(hist_dir, exist_ok=True)
+        os.makedirs(fills_dir, exist_ok=True)
+        hist_dtypes: dict[str, Any] = {TS_COLUMN: np.int64, **dtypes.history_dtypes()}
+        self._history = {
+            c: NpyAppender(os.path.join(hist_dir, f"{c}.npy"), hist_dtypes[c], append=self.append)
+            for c in [TS_COLUMN, *HISTORY_COLUMNS]
+        }
+        fill_dtypes: dict[str, Any] = {
+            "order_id": f"<U{self.id_width}",
+            "ts": np.int64,
+            **dtypes.fill_dtypes(),
+        }
+        self._fills = {
+            c: NpyAppender(os.path.join(fills_dir, f"{c}.npy"), fill_dtypes[c], append=self.append)
+            for c in FILL_COLUMNS
+        }
+
+    def write_history(self, ts: TsArray, cols: dict[str, HistoryArray]) -> None:
+        self._history[TS_COLUMN].append(ts)
+        for c in HISTORY_COLUMNS:
+            self._history[c].append(cols[c])
+
+    def write_fills(self, fills: list[Fill]) -> None:
+        if not fills:
+            return
+        frame = fills_to_frame(fills)
+        self._fills["order_id"].append(frame["order_id"].to_numpy(dtype=str))
+        self._fills["ts"].append(np.array([pd.Timestamp(f.ts).value for f in fills]))
+        for c, d in self.dtypes.fill_dtypes().items():
+            self._fills[c].append(self.dtypes.cast(frame[c].to_numpy(), d))
+
+    def close(self) -> None:
+        for appender in (*self._history.values(), *self._fills.values()):
+            appender.close()
+        schema = {"ts_columns": [TS_COLUMN], "tz": self.tz}
+        write_manifest(
+            self.out_dir,
+            "npy",
+            {
+                "history": {
+                    **schema,
+                    "index": TS_COLUMN,
+                    "columns": [TS_COLUMN, *HISTORY_COLUMNS],
+                },
+                "fills": {**schema, "index": None, "columns": FILL_COLUMNS},
+            },
+        )
+
+    def artifact(self) -> RunArtifact:
+        return RunArtifact(self.out_dir)
+
+    def to_frame(self) -> pd.DataFrame:
+        return self.artifact().history
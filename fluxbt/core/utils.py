@@ -1,9 +1,22 @@
 from __future__ import annotations
 
 from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 
+def fluxbt_version() -> str:
+    """Installed fluxbt version, or ``"unknown"`` for a source checkout."""
+    try:
+        from importlib.metadata import version
+
+        return version("fluxbt")
+    except Exception:  # noqa: BLE001 - source checkout without install
+        return "unknown"
+
+
 def annualization_factor(freq: Literal["D", "H", "MIN"]) -> float:
     if freq == "D":
         return 252.0
@@ -17,13 +30,31 @@ def annualization_factor(freq: Literal["D", "H", "MIN"]) -> float:
 def safe_rolling_mean(series: pd.Series, window: int) -> pd.Series:
     if window <= 1:
         return series.copy()
-    return series.rolling(window=window, min_periods=window).mean()
+    return _cached_rolling(series, "rolling_mean", window)
 
 
 def safe_rolling_std(series: pd.Series, window: int) -> pd.Series:
     if window <= 1:
         return pd.Series(0.0, index=series.index)
-    return series.rolling(window=window, min_periods=window).std(ddof=0)
+    return _cached_rolling(series, "rolling_std", window)
+
+
+def _cached_rolling(series: pd.Series, name: str, window: int) -> pd.Series:
+    """Rolling mean/std memoized in the process-wide indicator cache."""
+    from .indicator_cache import cached
+
+    def compute() -> npt.NDArray[np.float64]:
+        rolling = series.rolling(window=window, min_periods=window)
+        out = rolling.mean() if name == "rolling_mean" else rolling.std(ddof=0)
+        values: npt.NDArray[np.float64] = out.to_numpy(dtype=np.float64)
+        return values
+
+    data = series.to_numpy()
+    if data.dtype.hasobject:  # e.g. nullable dtypes: not fingerprintable, compute directly
+        return pd.Series(compute(), index=series.index, name=series.name)
+    values = cached(name, (window,), data, compute)
+    # cached arrays are shared and read-only; callers get their own copy
+    return pd.Series(values, index=series.index, name=series.name, copy=True)
 
 
 def to_timestamp(x: pd.Timestamp | str) -> pd.Timestamp:
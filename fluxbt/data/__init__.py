@@ -1,9 +1,23 @@
-from .loader import DataLoader, CSVLoader, YFinanceLoader
+from .loader import DataLoader, CSVLoader, YFinanceLoader, BinaryLoader
+from .synthetic import SyntheticLoader
 from .feed import DataFeed
+from .stream import replay_feed, socket_bars, tail_csv
+from .ticks import TickBarAggregator, TickBarLoader, aggregate_ticks
+from .universe import UniverseLoader, UniverseResult
 
 __all__ = [
     "DataLoader",
     "CSVLoader",
     "YFinanceLoader",
+    "BinaryLoader",
+    "SyntheticLoader",
     "DataFeed",
+    "replay_feed",
+    "tail_csv",
+    "socket_bars",
+    "TickBarAggregator",
+    "TickBarLoader",
+    "aggregate_ticks",
+    "UniverseLoader",
+    "UniverseResult",
 ]
@@ -5,12 +5,16 @@ from collections.abc import Iterator
 
 import pandas as pd
 
+from ..dtypes import FLOAT64_POLICY, DtypePolicy
+
 REQUIRED_COLS = ["open", "high", "low", "close", "volume"]
 
 
 @dataclass
 class DataFeed:
     df: pd.DataFrame
+    # OHLCV storage dtypes; the frame is cast on construction if needed
+    dtypes: DtypePolicy = FLOAT64_POLICY
 
     def __post_init__(self) -> None:
         if not isinstance(self.df.index, pd.DatetimeIndex):
@@ -20,6 +24,7 @@ class DataFeed:
         missing = [c for c in REQUIRED_COLS if c not in self.df.columns]
         if missing:
             raise ValueError(f"DataFeed missing columns: {missing}")
+        self.df = self.dtypes.cast_frame(self.df, self.dtypes.ohlcv_dtypes())
 
     def iter_bars(self) -> Iterator[tuple[pd.Timestamp, dict[str, float]]]:
         for ts, row in self.df.iterrows():
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from ..dtypes import FLOAT64_POLICY, DtypePolicy
 
 STANDARD_COLUMNS = ["open", "high", "low", "close", "volume"]
+BINARY_META_FILE = "meta.json"
 
 
 class DataLoader(ABC):
@@ -43,6 +49,7 @@ def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
 class CSVLoader(DataLoader):
     path: str
     tz: Optional[str] = "UTC"
+    dtypes: DtypePolicy = FLOAT64_POLICY
 
     def load(self) -> pd.DataFrame:
         df = pd.read_csv(self.path)
@@ -74,7 +81,7 @@ class CSVLoader(DataLoader):
                 df.index = df.index.tz_localize(self.tz)
             else:
                 df.index = df.index.tz_convert(self.tz)
-        return df
+        return self.dtypes.cast_frame(df, self.dtypes.ohlcv_dtypes())
 
 
 @dataclass
@@ -122,3 +129,35 @@ class YFinanceLoader(DataLoader):
             df.index = df.index.tz_localize("UTC")
         df = df.sort_index()
         return df
+
+
+@dataclass
+class BinaryLoader(DataLoader):
+    """Load OHLCV from a binary column directory (``ts.npy`` + one ``.npy`` per column).
+
+    ``ts.npy`` holds UTC nanoseconds as int64; ``meta.json`` records the timezone.
+    Directories are produced by ``SyntheticLoader.write``.
+    """
+
+    path: str
+    mmap: bool = True
+    dtypes: DtypePolicy = FLOAT64_POLICY
+
+    def arrays(self) -> dict[str, npt.NDArray[Any]]:
+        """Return raw columns, memory-mapped read-only when ``mmap`` is set."""
+        return {
+            c: np.load(os.path.join(self.path, f"{c}.npy"), mmap_mode="r" if self.mmap else None)
+            for c in ["ts", *STANDARD_COLUMNS]
+        }
+
+    def load(self) -> pd.DataFrame:
+        meta_path = os.path.join(self.path, BINARY_META_FILE)
+        tz = "UTC"
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                tz = json.load(f).get("tz") or "UTC"
+        cols = self.arrays()
+        idx = pd.DatetimeIndex(pd.to_datetime(np.asarray(cols.pop("ts")), utc=True))
+        df = pd.DataFrame({c: np.asarray(cols[c]) for c in STANDARD_COLUMNS}, index=idx)
+        df.index = df.index.tz_convert(tz)
+        return self.dtypes.cast_frame(df, self.dtypes.ohlcv_dtypes())
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Mapping
+from typing import Any
+
+import pandas as pd
+
+from .feed import REQUIRED_COLS, DataFeed
+
+Bar = tuple[pd.Timestamp, dict[str, float]]
+BarStream = AsyncIterator[Bar]
+
+
+def parse_bar(record: Mapping[str, Any], ts_key: str = "ts", tz: str | None = "UTC") -> Bar:
+    """Convert a mapping with a timestamp and OHLCV fields into an engine bar."""
+    ts = pd.Timestamp(record[ts_key])
+    if tz is not None:
+        ts = ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+    missing = [c for c in REQUIRED_COLS if c not in record]
+    if missing:
+        raise ValueError(f"Bar missing columns: {missing}")
+    return ts, {c: float(record[c]) for c in REQUIRED_COLS}
+
+
+async def replay_feed(feed: DataFeed, delay_s: float = 0.0) -> BarStream:
+    """Replay a static ``DataFeed`` as an async stream, optionally pacing bars."""
+    for ts, bar in feed.iter_bars():
+        yield ts, bar
+        # Always yield to the event loop so consumers and other tasks make progress
+        await asyncio.sleep(delay_s)
+
+
+async def tail_csv(
+    path: str,
+    poll_s: float = 0.5,
+    idle_timeout_s: float | None = None,
+    ts_key: str = "ts",
+    tz: str | None = "UTC",
+) -> BarStream:
+    """Follow a CSV file as rows are appended (``tail -f`` stand-in for a live feed).
+
+    The first line is the header. Incomplete trailing lines are held until their
+    newline arrives. Stops after ``idle_timeout_s`` without new rows (None = never).
+    """
+    header: list[str] | None = None
+    pending = ""
+    idle = 0.0
+    with open(path, encoding="utf-8") as f:
+        while True:
+            chunk = f.read()
+            if not chunk:
+                if idle_timeout_s is not None and idle >= idle_timeout_s:
+                    return
+                await asyncio.sleep(poll_s)
+                idle += poll_s
+                continue
+            idle = 0.0
+            pending += chunk
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                fields = line.split(",")
+                if header is None:
+                    header = [h.strip() for h in fields]
+                    continue
+                yield parse_bar(dict(zip(header, fields, strict=True)), ts_key, tz)
+
+
+async def socket_bars(
+    host: str, port: int, ts_key: str = "ts", tz: str | None = "UTC"
+) -> BarStream:
+    """Read newline-delimited JSON bars from a TCP socket until the peer closes it."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while line := await reader.readline():
+            if line.strip():
+                yield parse_bar(json.loads(line), ts_key, tz)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def bar_to_json(ts: pd.Timestamp, bar: Mapping[str, float], ts_key: str = "ts") -> str:
+    """Inverse of ``parse_bar`` for JSON-lines producers (e.g. test or replay servers)."""
+    return json.dumps({ts_key: pd.Timestamp(ts).isoformat(), **bar}) + "\n"
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+from ..dtypes import FLOAT64_POLICY, DtypePolicy
+from .loader import BINARY_META_FILE, STANDARD_COLUMNS, DataLoader
+
+SyntheticModel = Literal["gbm", "jump", "regime"]
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+_YEAR = pd.Timedelta(days=365.25)
+# One independent stream per random variable keeps output identical for any chunk_size
+_STREAMS = ("ret", "switch", "hop", "jump_n", "jump_z", "high", "low", "volume")
+
+
+def _periods_per_year(freq: str) -> float:
+    offset = to_offset(freq)
+    try:
+        # ``nanos`` rather than ``pd.Timedelta(offset)``: pandas 3 no longer converts Day
+        step = pd.Timedelta(offset.nanos)
+    except (ValueError, TypeError):
+        # Calendar-aware offsets (business days, month ends) have no fixed length
+        if offset.name.startswith("B"):
+            return float(252.0 / offset.n)
+        raise ValueError(
+            f"Cannot infer periods per year for freq '{freq}'; pass periods_per_year"
+        ) from None
+    return float(_YEAR / step)
+
+
+@dataclass
+class SyntheticLoader(DataLoader):
+    """Seedable synthetic OHLCV generator.
+
+    Models:
+    - "gbm": geometric Brownian motion with annualized ``mu``/``sigma``
+    - "jump": Merton jump diffusion (Poisson jumps with lognormal sizes)
+    - "regime": Markov regime switching between ``regime_mus``/``regime_sigmas``
+
+    Prices are generated in vectorized chunks of ``chunk_size`` bars. Each bar opens at
+    the previous close, ``high``/``low`` always bracket ``open``/``close`` and volume
+    rises with the absolute bar return.
+    """
+
+    n_bars: int = 10_000
+    model: SyntheticModel = "gbm"
+    freq: str = "1min"
+    start: str = "2000-01-03"
+    tz: str = "UTC"
+    s0: float = 100.0
+    mu: float = 0.05
+    sigma: float = 0.2
+    periods_per_year: float | None = None
+    # jump diffusion: expected jumps per year and log jump size distribution
+    jump_intensity: float = 5.0
+    jump_mean: float = -0.02
+    jump_std: float = 0.05
+    # regime switching: per-regime annualized drift/vol and per-bar switch probability
+    regime_mus: tuple[float, ...] = (0.10, -0.20)
+    regime_sigmas: tuple[float, ...] = (0.15, 0.40)
+    switch_prob: float = 0.001
+    base_volume: float = 10_000.0
+    seed: int | None = None
+    chunk_size: int = 1_000_000
+    # storage dtypes of the output (generation itself runs in float64)
+    dtypes: DtypePolicy = FLOAT64_POLICY
+
+    def __post_init__(self) -> None:
+        if self.n_bars < 0:
+            raise ValueError("n_bars must be >= 0")
+        if self.model not in ("gbm", "jump", "regime"):
+            raise ValueError("model must be one of 'gbm', 'jump', 'regime'")
+        if len(self.regime_mus) != len(self.regime_sigmas) or not self.regime_mus:
+            raise ValueError("regime_mus and regime_sigmas must be non-empty and equal length")
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size must be > 0")
+
+    def load(self) -> pd.DataFrame:
+        ts_parts: list[IntArray] = []
+        col_parts: dict[str, list[npt.NDArray[Any]]] = {c: [] for c in STANDARD_COLUMNS}
+        dtypes = self.dtypes.ohlcv_dtypes()
+        for ts, cols in self._iter_chunks():
+            ts_parts.append(ts)
+            for c in STANDARD_COLUMNS:
+                col_parts[c].append(cols[c].astype(dtypes[c], copy=False))
+        ts_all = np.concatenate(ts_parts) if ts_parts else np.empty(0, dtype=np.int64)
+        idx = pd.DatetimeIndex(pd.to_datetime(ts_all, utc=True)).tz_convert(self.tz)
+        data = {
+            c: (np.concatenate(parts) if parts else np.empty(0, dtype=dtypes[c]))
+            for c, parts in col_parts.items()
+        }
+        return pd.DataFrame(data, index=idx)[STANDARD_COLUMNS]
+
+    def write(self, path: str) -> str:
+        """Generate straight to a binary column directory readable by ``BinaryLoader``.
+
+        Only one chunk is held in memory at a time, so datasets far larger than RAM
+        can be produced.
+        """
+        os.makedirs(path, exist_ok=True)
+        shape = (self.n_bars,)
+        dtypes = self.dtypes.ohlcv_dtypes()
+        ts_out = np.lib.format.open_memmap(  # type: ignore[no-untyped-call]
+            os.path.join(path, "ts.npy"), mode="w+", dtype=np.int64, shape=shape
+        )
+        outs = {
+            c: np.lib.format.open_memmap(  # type: ignore[no-untyped-call]
+                os.path.join(path, f"{c}.npy"), mode="w+", dtype=dtypes[c], shape=shape
+            )
+            for c in STANDARD_COLUMNS
+        }
+        pos = 0
+        for ts, cols in self._iter_chunks():
+            end = pos + len(ts)
+            ts_out[pos:end] = ts
+            for c in STANDARD_COLUMNS:
+                outs[c][pos:end] = cols[c]
+            pos = end
+        for arr in (ts_out, *outs.values()):
+            arr.flush()
+        del ts_out, outs
+        with open(os.path.join(path, BINARY_META_FILE), "w", encoding="utf-8") as f:
+            json.dump({"tz": self.tz, "freq": self.freq, "n_bars": self.n_bars}, f)
+        return path
+
+    def _iter_chunks(self) -> Iterator[tuple[IntArray, dict[str, FloatArray]]]:
+        seeds = np.random.SeedSequence(self.seed).spawn(len(_STREAMS))
+        rngs = {name: np.random.default_rng(sd) for name, sd in zip(_STREAMS, seeds, strict=True)}
+        ppy = self.periods_per_year or _periods_per_year(self.freq)
+        dt = 1.0 / ppy
+        offset = to_offset(self.freq)
+        next_ts = pd.Timestamp(self.start)
+        next_ts = next_ts.tz_localize(self.tz) if next_ts.tz is None else next_ts
+        prev_close = float(self.s0)
+        regime = 0
+        remaining = self.n_bars
+        while remaining > 0:
+            n = min(self.chunk_size, remaining)
+            idx = pd.date_range(next_ts, periods=n, freq=self.freq)
+            next_ts = idx[-1] + offset
+            log_ret, bar_sigma, regime = self._log_returns(rngs, n, dt, regime)
+            cols = self._ohlcv(rngs, log_ret, bar_sigma, prev_close)
+            prev_close = float(cols["close"][-1])
+            remaining -= n
+            yield idx.as_unit("ns").asi8, cols
+
+    def _log_returns(
+        self, rngs: dict[str, np.random.Generator], n: int, dt: float, regime: int
+    ) -> tuple[FloatArray, FloatArray, int]:
+        z = rngs["ret"].standard_normal(n)
+        if self.model == "regime":
+            k = len(self.regime_mus)
+            if k > 1:
+                # a switch moves to one of the other k-1 regimes uniformly at random
+                switches = rngs["switch"].random(n) < self.switch_prob
+                hops = switches * (1 + np.floor(rngs["hop"].random(n) * (k - 1)).astype(np.int64))
+                states = (regime + np.cumsum(hops)) % k
+            else:
+                states = np.zeros(n, dtype=np.int64)
+            mu = np.asarray(self.regime_mus, dtype=float)[states]
+            sigma = np.asarray(self.regime_sigmas, dtype=float)[states]
+            regime = int(states[-1])
+        else:
+            mu = np.full(n, self.mu)
+            sigma = np.full(n, self.sigma)
+        bar_sigma = sigma * np.sqrt(dt)
+        log_ret = (mu - 0.5 * sigma**2) * dt + bar_sigma * z
+        if self.model == "jump":
+            n_jumps = rngs["jump_n"].poisson(self.jump_intensity * dt, size=n)
+            jump_z = rngs["jump_z"].standard_normal(n)
+            log_ret += n_jumps * self.jump_mean + np.sqrt(n_jumps) * self.jump_std * jump_z
+        return log_ret, bar_sigma, regime
+
+    def _ohlcv(
+        self,
+        rngs: dict[str, np.random.Generator],
+        log_ret: FloatArray,
+        bar_sigma: FloatArray,
+        prev_close: float,
+    ) -> dict[str, FloatArray]:
+        close = prev_close * np.exp(np.cumsum(log_ret))
+        open_ = np.empty_like(close)
+        open_[0] = prev_close
+        open_[1:] = close[:-1]
+        n = len(close)
+        # intrabar excursions beyond the open/close range
+        high = np.maximum(open_, close) * np.exp(
+            np.abs(rngs["high"].standard_normal(n)) * bar_sigma * 0.5
+        )
+        low = np.minimum(open_, close) * np.exp(
+            -np.abs(rngs["low"].standard_normal(n)) * bar_sigma * 0.5
+        )
+        activity = 1.0 + np.abs(log_ret) / np.maximum(bar_sigma, 1e-12)
+        volume = np.rint(self.base_volume * activity * rngs["volume"].lognormal(0.0, 0.25, size=n))
+        return {"open": open_, "high": high, "low": low, "close": close, "volume": volume}
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .feed import REQUIRED_COLS
+from .loader import DataLoader
+from .stream import BarStream
+
+BarKind = Literal["time", "volume", "dollar"]
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+
+def _bars_frame(stamps: IntArray, cols: dict[str, FloatArray], tz: str | None) -> pd.DataFrame:
+    index = pd.DatetimeIndex(pd.to_datetime(stamps, utc=True), name="ts")
+    if tz is not None:
+        index = index.tz_convert(tz)
+    return pd.DataFrame({c: cols[c] for c in REQUIRED_COLS}, index=index)
+
+
+def _empty_bars(tz: str | None) -> pd.DataFrame:
+    return _bars_frame(np.empty(0, dtype=np.int64), {c: np.empty(0) for c in REQUIRED_COLS}, tz)
+
+
+@dataclass
+class TickBarAggregator:
+    """Incrementally turn time-ordered trade ticks into OHLCV bars.
+
+    ``kind="time"`` groups ticks into fixed ``size`` intervals (a pandas-style
+    duration such as "1min"), aligned to the epoch; empty intervals produce no bar.
+    ``kind="volume"``/``"dollar"`` start a new bar each time cumulative quantity /
+    notional (price * qty) crosses the next multiple of ``size``; the crossing tick
+    closes its bar, and any overshoot counts toward the next one.
+
+    Bars are stamped with the time they complete (interval end for time bars, last
+    tick otherwise), so a strategy never sees a bar before it has closed. Each chunk
+    is reduced with ``ufunc.reduceat`` over its group boundaries; the last (possibly
+    partial) group is carried into the next ``update`` and emitted by ``flush``.
+    """
+
+    kind: BarKind = "time"
+    size: str | float = "1min"
+    tz: str | None = "UTC"
+
+    _step: int = field(default=0, init=False, repr=False)
+    # bar in progress: OHLCV values, group id and timestamp of its last tick
+    _carry: tuple[dict[str, float], int, int] | None = field(default=None, init=False, repr=False)
+    _cum: float = field(default=0.0, init=False, repr=False)
+    _last_ts: int = field(default=np.iinfo(np.int64).min, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.kind == "time":
+            if not isinstance(self.size, str):
+                raise ValueError("time bars need a duration string size, e.g. '1min'")
+            try:
+                self._step = int(pd.Timedelta(self.size).value)
+            except ValueError as exc:
+                raise ValueError(
+                    f"time bar size must be a fixed duration, got {self.size!r}"
+                ) from exc
+            if self._step <= 0:
+                raise ValueError("time bar size must be positive")
+        elif self.kind in ("volume", "dollar"):
+            if isinstance(self.size, str) or self.size <= 0:
+                raise ValueError(f"{self.kind} bars need a positive numeric size")
+        else:
+            raise ValueError("kind must be 'time', 'volume' or 'dollar'")
+
+    def reset(self) -> None:
+        self._carry = None
+        self._cum = 0.0
+        self._last_ts = np.iinfo(np.int64).min
+
+    def _group_ids(self, ts: IntArray, price: FloatArray, qty: FloatArray) -> IntArray:
+        if self.kind == "time":
+            ids: IntArray = ts // self._step
+            return ids
+        measure = qty if self.kind == "volume" else price * qty
+        cum = np.cumsum(measure)
+        # a tick belongs to the bar in progress before it traded
+        before = self._cum + np.concatenate(([0.0], cum[:-1]))
+        self._cum += float(cum[-1])
+        bar_ids: IntArray = np.floor(before / float(self.size)).astype(np.int64)
+        return bar_ids
+
+    def update(self, ts: npt.ArrayLike, price: npt.ArrayLike, qty: npt.ArrayLike) -> pd.DataFrame:
+        """Add a chunk of ticks (UTC ns timestamps) and return the bars it completed."""
+        ts_arr = np.asarray(ts, dtype=np.int64)
+        px = np.asarray(price, dtype=np.float64)
+        q = np.asarray(qty, dtype=np.float64)
+        if not len(ts_arr):
+            return _empty_bars(self.tz)
+        if ts_arr[0] < self._last_ts or np.any(np.diff(ts_arr) < 0):
+            raise ValueError("ticks must be sorted by time across all chunks")
+        self._last_ts = int(ts_arr[-1])
+
+        ids = self._group_ids(ts_arr, px, q)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(ids)) + 1))
+        ends = np.append(starts[1:], len(ids)) - 1
+        cols = {
+            "open": px[starts],
+            "high": np.maximum.reduceat(px, starts),
+            "low": np.minimum.reduceat(px, starts),
+            "close": px[ends],
+            "volume": np.add.reduceat(q, starts),
+        }
+        gid = ids[starts]
+        last = ts_arr[ends]
+
+        if self._carry is not None:
+            prev, prev_id, prev_last = self._carry
+            if prev_id == gid[0]:
+                cols["open"][0] = prev["open"]
+                cols["high"][0] = max(cols["high"][0], prev["high"])
+                cols["low"][0] = min(cols["low"][0], prev["low"])
+                cols["volume"][0] += prev["volume"]
+            else:
+                cols = {c: np.concatenate(([prev[c]], v)) for c, v in cols.items()}
+                gid = np.concatenate(([prev_id], gid))
+                last = np.concatenate(([prev_last], last))
+        self._carry = ({c: float(v[-1]) for c, v in cols.items()}, int(gid[-1]), int(last[-1]))
+        return self._frame(gid[:-1], last[:-1], {c: v[:-1] for c, v in cols.items()})
+
+    def flush(self) -> pd.DataFrame:
+        """Emit the bar still in progress (end of data) and reset."""
+        carry = self._carry
+        self.reset()
+        if carry is None:
+            return _empty_bars(self.tz)
+        values, gid, last = carry
+        return self._frame(
+            np.array([gid]), np.array([last]), {c: np.array([values[c]]) for c in REQUIRED_COLS}
+        )
+
+    def _frame(self, gid: IntArray, last: IntArray, cols: dict[str, FloatArray]) -> pd.DataFrame:
+        stamps = (gid + 1) * self._step if self.kind == "time" else last
+        return _bars_frame(stamps, cols, self.tz)
+
+
+def aggregate_ticks(
+    chunks: Iterable[pd.DataFrame],
+    aggregator: TickBarAggregator,
+    ts_col: str = "ts",
+    price_col: str = "price",
+    qty_col: str = "qty",
+) -> Iterator[pd.DataFrame]:
+    """Feed tick frames through ``aggregator``, yielding the bars completed by each."""
+    aggregator.reset()
+    for chunk in chunks:
+        ts = pd.DatetimeIndex(pd.to_datetime(chunk[ts_col], utc=True)).as_unit("ns").asi8
+        bars = aggregator.update(ts, chunk[price_col].to_numpy(), chunk[qty_col].to_numpy())
+        if len(bars):
+            yield bars
+    tail = aggregator.flush()
+    if len(tail):
+        yield tail
+
+
+@dataclass
+class TickBarLoader(DataLoader):
+    """Build bars from a tick CSV (columns ``ts_col``, ``price_col``, ``qty_col``).
+
+    Ticks are read ``chunk_size`` rows at a time, so memory is bounded by the chunk
+    and the bars produced, never by the tick count. ``load()`` returns a frame for
+    ``DataFeed``/``BacktestEngine``; ``stream()`` feeds ``LiveEngine`` bar by bar.
+    """
+
+    path: str
+    kind: BarKind = "time"
+    size: str | float = "1min"
+    chunk_size: int = 1_000_000
+    ts_col: str = "ts"
+    price_col: str = "price"
+    qty_col: str = "qty"
+    tz: str | None = "UTC"
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Bar frames, one per tick chunk that completed any bars."""
+        reader = pd.read_csv(
+            self.path,
+            usecols=[self.ts_col, self.price_col, self.qty_col],
+            chunksize=self.chunk_size,
+        )
+        with reader:
+            yield from aggregate_ticks(
+                reader,
+                TickBarAggregator(self.kind, self.size, self.tz),
+                self.ts_col,
+                self.price_col,
+                self.qty_col,
+            )
+
+    def load(self) -> pd.DataFrame:
+        frames = list(self.iter_chunks())
+        if not frames:
+            return _empty_bars(self.tz)
+        return pd.concat(frames)
+
+    async def stream(self) -> BarStream:
+        for bars in self.iter_chunks():
+            for ts, row in zip(bars.index, bars.itertuples(index=False), strict=True):
+                yield ts, {c: float(getattr(row, c)) for c in REQUIRED_COLS}
+            await asyncio.sleep(0)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import glob
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Literal
+
+import pandas as pd
+
+from .loader import CSVLoader, YFinanceLoader, _normalize_columns
+
+# symbol -> raw OHLCV frame (any of the column spellings `_normalize_columns` accepts)
+FetchFn = Callable[[str], pd.DataFrame]
+
+
+@dataclass
+class UniverseResult:
+    """Frames of the symbols that loaded, in request order, and errors for the rest."""
+
+    frames: dict[str, pd.DataFrame]
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def raise_errors(self) -> None:
+        if self.errors:
+            details = "; ".join(f"{s}: {e}" for s, e in self.errors.items())
+            raise ValueError(f"{len(self.errors)} symbols failed to load: {details}")
+
+    def panel(
+        self, field: str | None = None, join: Literal["outer", "inner"] = "outer"
+    ) -> pd.DataFrame:
+        """Align all frames on one index.
+
+        With ``field`` (e.g. "close") columns are symbols; otherwise columns are a
+        ``(symbol, field)`` MultiIndex. ``join="inner"`` keeps only common timestamps.
+        """
+        if not self.frames:
+            return pd.DataFrame()
+        if field is not None:
+            return pd.concat({s: df[field] for s, df in self.frames.items()}, axis=1, join=join)
+        return pd.concat(self.frames, axis=1, join=join)
+
+
+def _normalize_frame(df: pd.DataFrame, tz: str | None) -> pd.DataFrame:
+    if not isinstance(df.index, pd.DatetimeIndex):
+        df = df.set_axis(pd.to_datetime(df.index), axis=0)
+    df = _normalize_columns(df).sort_index()
+    if tz:
+        index = pd.DatetimeIndex(df.index)
+        df.index = index.tz_localize(tz) if index.tz is None else index.tz_convert(tz)
+    return df
+
+
+@dataclass
+class UniverseLoader:
+    """Load many symbols concurrently in a bounded thread pool.
+
+    Loading is dominated by network I/O and CSV parsing (which releases the GIL), so
+    threads overlap well. ``fetch`` maps a symbol to a raw frame and defaults to
+    ``YFinanceLoader``; every result goes through ``_normalize_columns``. A failing
+    symbol is reported in ``UniverseResult.errors`` without affecting the others.
+    """
+
+    symbols: Sequence[str]
+    fetch: FetchFn | None = None
+    max_workers: int = 8
+    tz: str | None = "UTC"
+    # YFinanceLoader arguments for the default fetch
+    interval: str = "1d"
+    start: str | None = None
+    end: str | None = None
+
+    @classmethod
+    def from_csv(
+        cls, path_or_glob: str, max_workers: int = 8, tz: str | None = "UTC"
+    ) -> UniverseLoader:
+        """One symbol per CSV (named after the file stem) in a directory or glob pattern."""
+        pattern = (
+            os.path.join(path_or_glob, "*.csv") if os.path.isdir(path_or_glob) else path_or_glob
+        )
+        paths = {os.path.splitext(os.path.basename(p))[0]: p for p in sorted(glob.glob(pattern))}
+        if not paths:
+            raise ValueError(f"No CSV files match {pattern!r}")
+
+        def fetch(symbol: str) -> pd.DataFrame:
+            return CSVLoader(paths[symbol], tz=tz).load()
+
+        return cls(symbols=list(paths), fetch=fetch, max_workers=max_workers, tz=tz)
+
+    def _fetch_yfinance(self, symbol: str) -> pd.DataFrame:
+        return YFinanceLoader(symbol, interval=self.interval, start=self.start, end=self.end).load()
+
+    def _load_one(self, symbol: str) -> pd.DataFrame:
+        fetch = self.fetch or self._fetch_yfinance
+        return _normalize_frame(fetch(symbol), self.tz)
+
+    def load(self) -> UniverseResult:
+        if self.max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+        symbols = list(dict.fromkeys(self.symbols))
+        loaded: dict[str, pd.DataFrame] = {}
+        errors: dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(symbols), 1))) as pool:
+            futures = {pool.submit(self._load_one, s): s for s in symbols}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    loaded[symbol] = future.result()
+                except Exception as exc:  # noqa: BLE001 - reported per symbol
+                    errors[symbol] = f"{type(exc).__name__}: {exc}"
+        return UniverseResult(
+            frames={s: loaded[s] for s in symbols if s in loaded},
+            errors={s: errors[s] for s in symbols if s in errors},
+        )
+
+    def load_panel(
+        self, field: str | None = None, join: Literal["outer", "inner"] = "outer"
+    ) -> pd.DataFrame:
+        """``load().panel(...)``, raising if any symbol failed."""
+        result = self.load()
+        result.raise_errors()
+        return result.panel(field, join)
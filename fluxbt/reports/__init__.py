@@ -1,9 +1,12 @@
 from .plotting import plot_equity_curve, plot_drawdown, plot_trade_pnl
 from .report import generate_html_report
+from .multi_report import RunSummary, generate_multi_run_report
 
 __all__ = [
     "plot_equity_curve",
     "plot_drawdown",
     "plot_trade_pnl",
     "generate_html_report",
+    "RunSummary",
+    "generate_multi_run_report",
 ]
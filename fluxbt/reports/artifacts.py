@@ -0,0 +1,168 @@
+"""Binary run artifacts: history, fills and metrics in a typed columnar layout.
+
+Layout of an artifact directory::
+
+    manifest.json        format, tables, index timezone, fluxbt version
+    metrics.json
+    history/<col>.npy    "npy": one file per column, memory-mappable
+    history.npz          "npz": one archive per table, optionally compressed
+    history.parquet      "parquet": requires pyarrow
+    history.csv          text export via ``export_csv``, opt-in
+
+Timestamps are stored as int64 UTC nanoseconds in a ``ts`` column; the original
+timezone is recorded in the manifest and restored on read.
+"""
+
+from __future__ import annotations
+
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from ..core.columnar import (
+    FILL_COLUMNS,
+    MANIFEST_FILE,
+    METRICS_FILE,
+    TS_COLUMN,
+    Columns,
+    NpyAppender,
+    RunArtifact,
+    columns_to_frame,
+    fills_to_frame,
+    frame_to_columns,
+    read_artifact,
+    write_manifest,
+    write_metrics,
+)
+
+if TYPE_CHECKING:
+    from ..core.orders import Fill
+
+# The layout helpers and reader live in fluxbt.core.columnar, so core sinks need not
+# import reports; they stay importable from here
+__all__ = [
+    "ARTIFACT_WRITERS",
+    "FILL_COLUMNS",
+    "MANIFEST_FILE",
+    "METRICS_FILE",
+    "TS_COLUMN",
+    "ArtifactWriter",
+    "Columns",
+    "NpyAppender",
+    "NpyArtifactWriter",
+    "NpzArtifactWriter",
+    "ParquetArtifactWriter",
+    "RunArtifact",
+    "columns_to_frame",
+    "export_csv",
+    "fills_to_frame",
+    "frame_to_columns",
+    "get_artifact_writer",
+    "read_artifact",
+    "write_manifest",
+    "write_metrics",
+]
+
+
+class ArtifactWriter(ABC):
+    """Write a run's history, fills and metrics into ``out_dir``.
+
+    Subclasses implement ``write_columns`` for one table; everything else (manifest,
+    metrics, column conversion) is shared.
+    """
+
+    format: str
+
+    @abstractmethod
+    def write_columns(self, out_dir: str, table: str, cols: Columns) -> None:
+        raise NotImplementedError
+
+    def write(
+        self,
+        out_dir: str,
+        history: pd.DataFrame,
+        fills: Iterable[Fill] = (),
+        metrics: dict[str, float] | None = None,
+    ) -> str:
+        os.makedirs(out_dir, exist_ok=True)
+        schemas: dict[str, dict[str, Any]] = {}
+        for table, frame in (("history", history), ("fills", fills_to_frame(fills))):
+            cols, schemas[table] = frame_to_columns(frame)
+            self.write_columns(out_dir, table, cols)
+        write_metrics(out_dir, metrics or {})
+        write_manifest(out_dir, self.format, schemas)
+        return out_dir
+
+
+class NpyArtifactWriter(ArtifactWriter):
+    """One uncompressed ``.npy`` file per column; read back memory-mapped."""
+
+    format = "npy"
+
+    def write_columns(self, out_dir: str, table: str, cols: Columns) -> None:
+        table_dir = os.path.join(out_dir, table)
+        os.makedirs(table_dir, exist_ok=True)
+        for name, arr in cols.items():
+            np.save(os.path.join(table_dir, f"{name}.npy"), arr, allow_pickle=False)
+
+
+@dataclass
+class NpzArtifactWriter(ArtifactWriter):
+    """One ``.npz`` archive per table, zlib-compressed unless ``compress`` is False."""
+
+    compress: bool = True
+    format = "npz"
+
+    def write_columns(self, out_dir: str, table: str, cols: Columns) -> None:
+        path = os.path.join(out_dir, f"{table}.npz")
+        if self.compress:
+            np.savez_compressed(path, **cols)
+        else:
+            np.savez(path, **cols)
+
+
+@dataclass
+class ParquetArtifactWriter(ArtifactWriter):
+    """One Parquet file per table (requires ``pyarrow``)."""
+
+    compression: str | None = "zstd"
+    format = "parquet"
+
+    def write_columns(self, out_dir: str, table: str, cols: Columns) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_table(
+            pa.table(dict(cols)),
+            os.path.join(out_dir, f"{table}.parquet"),
+            compression=self.compression or "none",
+        )
+
+
+ARTIFACT_WRITERS: dict[str, type[ArtifactWriter]] = {
+    "npy": NpyArtifactWriter,
+    "npz": NpzArtifactWriter,
+    "parquet": ParquetArtifactWriter,
+}
+
+
+def get_artifact_writer(fmt: str) -> ArtifactWriter:
+    try:
+        return ARTIFACT_WRITERS[fmt]()
+    except KeyError:
+        choices = sorted(ARTIFACT_WRITERS)
+        raise ValueError(f"Unknown artifact format '{fmt}'; choose from {choices}") from None
+
+
+def export_csv(out_dir: str, history: pd.DataFrame, fills: Iterable[Fill] = ()) -> str:
+    """Opt-in text export: ``history.csv`` (as the CLI always wrote it) and ``fills.csv``."""
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, "history.csv")
+    history.to_csv(path)
+    fills_to_frame(fills).to_csv(os.path.join(out_dir, "fills.csv"), index=False)
+    return path
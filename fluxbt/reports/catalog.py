@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from ..core.indicator_cache import fingerprint
+from ..core.metrics import METRIC_NAMES
+
+ENV_CATALOG = "FLUXBT_CATALOG"
+DEFAULT_CATALOG = os.path.join("runs", "catalog.db")
+
+# Non-metric columns usable in `where` and `order_by`; params are `param.<name>`
+_BASE_COLUMNS = ("id", "created", "strategy", "sweep", "data_fingerprint", "run_dir")
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS runs ("
+    " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+    " created REAL NOT NULL,"
+    " strategy TEXT NOT NULL,"
+    " sweep TEXT,"
+    " params TEXT NOT NULL,"
+    " data_fingerprint TEXT NOT NULL,"
+    " run_dir TEXT,"
+    " key TEXT UNIQUE,"
+    " metrics TEXT NOT NULL," + ",".join(f" {m} REAL" for m in METRIC_NAMES) + ")",
+    "CREATE INDEX IF NOT EXISTS runs_strategy ON runs (strategy)",
+    "CREATE INDEX IF NOT EXISTS runs_sweep ON runs (sweep)",
+    *(f"CREATE INDEX IF NOT EXISTS runs_{m} ON runs ({m})" for m in METRIC_NAMES),
+]
+
+
+def default_catalog_path() -> str:
+    """``$FLUXBT_CATALOG`` if set, else ``runs/catalog.db``."""
+    return os.environ.get(ENV_CATALOG) or DEFAULT_CATALOG
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a bar frame (index and every column), for matching runs by input."""
+    h = hashlib.sha1(usedforsecurity=False)
+    if isinstance(df.index, pd.DatetimeIndex):
+        h.update(fingerprint(df.index.as_unit("ns").asi8).encode())
+    else:
+        h.update(fingerprint(df.index.to_numpy()).encode())
+    for name in df.columns:
+        h.update(str(name).encode())
+        h.update(fingerprint(df[name].to_numpy()).encode())
+    return h.hexdigest()
+
+
+@dataclass
+class RunRecord:
+    strategy: str
+    params: dict[str, object]
+    metrics: dict[str, float]
+    data_fingerprint: str = ""
+    run_dir: str | None = None
+    sweep: str | None = None
+    # Optional unique identity (e.g. a sweep job); re-registering the same key is a no-op
+    key: str | None = None
+    created: float = field(default_factory=time.time)
+    id: int | None = None
+
+
+class QueryError(ValueError):
+    """Invalid ``where`` or ``order_by`` expression."""
+
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<num>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)|(?P<str>'[^']*'|\"[^\"]*\")"
+    r"|(?P<op>>=|<=|!=|==|=|<|>)|(?P<paren>[()])|(?P<name>[A-Za-z_][\w.]*))"
+)
+_SQL_OPS = {"==": "=", "=": "=", "!=": "!=", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+
+
+def _column(name: str) -> str:
+    if name in METRIC_NAMES or name in _BASE_COLUMNS:
+        return name
+    prefix, _, key = name.partition(".")
+    if prefix in ("param", "params") and re.fullmatch(r"[A-Za-z_]\w*", key):
+        return f"json_extract(params, '$.{key}')"
+    raise QueryError(
+        f"Unknown field {name!r}; use a metric ({', '.join(METRIC_NAMES)}), "
+        f"{', '.join(_BASE_COLUMNS)} or param.<name>"
+    )
+
+
+class _WhereParser:
+    """Translate ``sharpe>1.5 and (max_dd>-0.2 or param.fast=10)`` into parameterized SQL.
+
+    Only field/operator/literal comparisons combined with and/or/not and parentheses
+    are accepted; field names are whitelisted and literals become ``?`` parameters.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.tokens: list[tuple[str, str]] = []
+        pos = 0
+        text = text.strip()
+        while pos < len(text):
+            m = _TOKEN.match(text, pos)
+            if m is None or m.end() == pos:
+                raise QueryError(f"Cannot parse {text[pos:]!r}")
+            kind = m.lastgroup
+            assert kind is not None
+            self.tokens.append((kind, m.group(kind)))
+            pos = m.end()
+        self.pos = 0
+        self.args: list[object] = []
+
+    def parse(self) -> str:
+        sql = self._or()
+        if self.pos != len(self.tokens):
+            raise QueryError(f"Unexpected {self.tokens[self.pos][1]!r}")
+        return sql
+
+    def _peek_word(self) -> str | None:
+        if self.pos < len(self.tokens) and self.tokens[self.pos][0] == "name":
+            return self.tokens[self.pos][1].lower()
+        return None
+
+    def _next(self) -> tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise QueryError("Unexpected end of expression")
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
+
+    def _or(self) -> str:
+        parts = [self._and()]
+        while self._peek_word() == "or":
+            self.pos += 1
+            parts.append(self._and())
+        return parts[0] if len(parts) == 1 else "(" + " OR ".join(parts) + ")"
+
+    def _and(self) -> str:
+        parts = [self._not()]
+        while self._peek_word() == "and":
+            self.pos += 1
+            parts.append(self._not())
+        return parts[0] if len(parts) == 1 else "(" + " AND ".join(parts) + ")"
+
+    def _not(self) -> str:
+        if self._peek_word() == "not":
+            self.pos += 1
+            return f"NOT {self._not()}"
+        kind, value = self._next()
+        if (kind, value) == ("paren", "("):
+            inner = self._or()
+            if self._next() != ("paren", ")"):
+                raise QueryError("Missing ')'")
+            return inner  # and/or groups are already parenthesized
+        if kind != "name":
+            raise QueryError(f"Expected a field name, got {value!r}")
+        column = _column(value)
+        op_kind, op = self._next()
+        if op_kind != "op":
+            raise QueryError(f"Expected a comparison after {value!r}, got {op!r}")
+        lit_kind, literal = self._next()
+        if lit_kind == "num":
+            self.args.append(float(literal))
+        elif lit_kind == "str":
+            self.args.append(literal[1:-1])
+        elif lit_kind == "name" and literal.lower() in ("true", "false"):
+            self.args.append(literal.lower() == "true")
+        else:
+            raise QueryError(f"Expected a number or quoted string, got {literal!r}")
+        return f"{column} {_SQL_OPS[op]} ?"
+
+
+def parse_where(text: str) -> tuple[str, list[object]]:
+    """Parse a ``where`` filter into a SQL fragment and its parameters."""
+    parser = _WhereParser(text)
+    return parser.parse(), parser.args
+
+
+class RunCatalog:
+    """Indexed SQLite catalog of runs: params, input fingerprint, metrics and artifact dir.
+
+    Every metric in ``METRIC_NAMES`` is an indexed column (NaN is stored as NULL), so
+    filtering and ranking tens of thousands of runs does not touch the run directories.
+    """
+
+    def __init__(self, path: str | None = None, timeout: float = 30.0) -> None:
+        self.path = path or default_catalog_path()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=timeout)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> RunCatalog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        count: int = self._conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        return count
+
+    def register(self, record: RunRecord) -> int | None:
+        """Insert one run; returns its id, or None if its ``key`` is already registered."""
+        ids = self.register_many([record])
+        return ids[0] if ids else None
+
+    def register_many(self, records: Iterable[RunRecord]) -> list[int]:
+        """Insert ``records`` in a single transaction (use this for sweeps).
+
+        Returns the ids of inserted rows; records whose ``key`` is already present are
+        skipped.
+        """
+        columns = ["created", "strategy", "sweep", "params", "data_fingerprint", "run_dir", "key"]
+        columns += ["metrics", *METRIC_NAMES]
+        sql = (
+            f"INSERT OR IGNORE INTO runs ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) RETURNING id"
+        )
+        ids: list[int] = []
+        with self._conn:
+            for r in records:
+                metrics = {k: float(v) for k, v in r.metrics.items()}
+                row = (
+                    r.created,
+                    r.strategy,
+                    r.sweep,
+                    json.dumps(r.params, sort_keys=True, default=str),
+                    r.data_fingerprint,
+                    r.run_dir,
+                    r.key,
+                    json.dumps(metrics),
+                    *(_sql_float(metrics.get(m)) for m in METRIC_NAMES),
+                )
+                inserted = self._conn.execute(sql, row).fetchone()
+                if inserted is not None:
+                    ids.append(int(inserted[0]))
+        return ids
+
+    def query(
+        self,
+        where: str | None = None,
+        order_by: str | None = None,
+        ascending: bool = False,
+        limit: int | None = 20,
+    ) -> list[RunRecord]:
+        """Filter with a ``where`` expression (see ``parse_where``) and rank by a field.
+
+        Without ``order_by`` the most recent runs come first. Runs whose sort field is
+        NaN/missing are ranked last either way.
+        """
+        sql, args = _select(where, order_by, ascending, limit)
+        return [_row_to_record(row) for row in self._conn.execute(sql, args)]
+
+    def explain(
+        self,
+        where: str | None = None,
+        order_by: str | None = None,
+        ascending: bool = False,
+        limit: int | None = 20,
+    ) -> list[str]:
+        """SQLite's ``EXPLAIN QUERY PLAN`` steps for the same ``query`` arguments."""
+        sql, args = _select(where, order_by, ascending, limit)
+        return [str(row["detail"]) for row in self._conn.execute(f"EXPLAIN QUERY PLAN {sql}", args)]
+
+
+def _select(
+    where: str | None, order_by: str | None, ascending: bool, limit: int | None
+) -> tuple[str, list[object]]:
+    sql = "SELECT * FROM runs"
+    args: list[object] = []
+    if where:
+        clause, args = parse_where(where)
+        sql += f" WHERE {clause}"
+    column = _column(order_by) if order_by else "id"
+    direction = "ASC" if ascending and order_by else "DESC"
+    sql += f" ORDER BY {column} IS NULL, {column} {direction}"
+    if limit is not None:
+        sql += " LIMIT ?"
+        args.append(int(limit))
+    return sql, args
+
+
+def _sql_float(value: float | None) -> float | None:
+    return None if value is None or math.isnan(value) else value
+
+
+def _row_to_record(row: sqlite3.Row) -> RunRecord:
+    return RunRecord(
+        strategy=row["strategy"],
+        params=json.loads(row["params"]),
+        metrics=json.loads(row["metrics"]),
+        data_fingerprint=row["data_fingerprint"],
+        run_dir=row["run_dir"],
+        sweep=row["sweep"],
+        key=row["key"],
+        created=row["created"],
+        id=row["id"],
+    )
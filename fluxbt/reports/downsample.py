@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+DownsampleMethod = Literal["lttb", "minmax"]
+IndexArray = npt.NDArray[np.intp]
+
+
+def _as_xy(series: pd.Series) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    if isinstance(series.index, pd.DatetimeIndex):
+        x = series.index.as_unit("ns").asi8.astype(np.float64)
+    else:
+        x = np.arange(len(series), dtype=np.float64)
+    return x, series.to_numpy(dtype=np.float64)
+
+
+def lttb_indices(x: npt.NDArray[np.float64], y: npt.NDArray[np.float64], n_out: int) -> IndexArray:
+    """Largest-Triangle-Three-Buckets: indices of ``n_out`` points preserving shape.
+
+    The first and last points are always kept. Each inner bucket keeps the point
+    forming the largest triangle with the previously kept point and the mean of the
+    next bucket. Cost is O(n) with one Python iteration per output point.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n, dtype=np.intp)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    out = np.empty(n_out, dtype=np.intp)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = hi, (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = x[nlo:nhi].mean()
+        avg_y = y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = int(lo + np.argmax(area)) if hi > lo else int(lo)
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y: npt.NDArray[np.float64], n_out: int) -> IndexArray:
+    """Keep the min and max of each of ``n_out // 2`` equal buckets (plus endpoints).
+
+    Fully vectorized; extremes such as the deepest drawdown are never dropped.
+    """
+    n = len(y)
+    n_buckets = max(n_out // 2, 1)
+    if n_out >= n or n < 2 * n_buckets:
+        return np.arange(n, dtype=np.intp)
+    width = n // n_buckets
+    body = y[: n_buckets * width].reshape(n_buckets, width)
+    starts = np.arange(n_buckets, dtype=np.intp) * width
+    picks = [starts + body.argmin(axis=1), starts + body.argmax(axis=1)]
+    tail = y[n_buckets * width :]
+    if len(tail):
+        base = n_buckets * width
+        picks.append(np.array([base + tail.argmin(), base + tail.argmax()], dtype=np.intp))
+    picks.append(np.array([0, n - 1], dtype=np.intp))
+    out: IndexArray = np.unique(np.concatenate(picks))
+    return out
+
+
+def downsample(
+    series: pd.Series, max_points: int | None = 2_000, method: DownsampleMethod = "lttb"
+) -> pd.Series:
+    """Reduce ``series`` to about ``max_points`` points for plotting.
+
+    Returns the input unchanged when it is already small enough or ``max_points`` is
+    None. NaNs are dropped before selecting points.
+    """
+    if max_points is None or len(series) <= max_points:
+        return series
+    clean = series.dropna()
+    if len(clean) <= max_points:
+        return clean
+    x, y = _as_xy(clean)
+    if method == "lttb":
+        idx = lttb_indices(x, y, max_points)
+    elif method == "minmax":
+        idx = minmax_indices(y, max_points)
+    else:
+        raise ValueError("method must be 'lttb' or 'minmax'")
+    return clean.iloc[idx]
@@ -0,0 +1,247 @@
+"""On-disk memo of whole backtest runs, keyed by everything that determines the result.
+
+Each entry is an ``npy`` run artifact directory (see ``artifacts``) named after the run
+key, plus ``memo.json`` with the key's inputs. Entries are evicted least recently used
+first once the store exceeds ``max_bytes``; a hit refreshes the entry's mtime.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+import pandas as pd
+
+from ..core.orders import Fill
+from ..core.utils import fluxbt_version
+from .artifacts import NpyArtifactWriter, read_artifact
+from .catalog import frame_fingerprint
+
+if TYPE_CHECKING:
+    from ..core.engine import BacktestEngine
+
+ENV_MEMO_DIR = "FLUXBT_MEMO_DIR"
+ENV_MEMO_BYTES = "FLUXBT_MEMO_BYTES"
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+MEMO_FILE = "memo.json"
+
+
+def default_memo_dir() -> str:
+    return os.environ.get(ENV_MEMO_DIR) or os.path.join("runs", "memo")
+
+
+def _describe(obj: object) -> object:
+    """JSON-able description of a configuration object (public state only)."""
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, dict):
+        return {str(k): _describe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_describe(v) for v in obj]
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        values = {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj) if f.init}
+    elif hasattr(obj, "__dict__"):
+        values = {k: v for k, v in vars(obj).items() if not k.startswith("_")}
+    else:
+        return repr(obj)
+    return {
+        "type": f"{type(obj).__module__}.{type(obj).__qualname__}",
+        **{k: _describe(v) for k, v in values.items()},
+    }
+
+
+def run_inputs(engine: BacktestEngine, freq: Literal["D", "H", "MIN"] = "D") -> dict[str, object]:
+    """Everything that determines ``engine.run()``'s result and its metrics at ``freq``,
+    for ``run_key``."""
+    overlay = copy.deepcopy(engine.risk_overlay)
+    if overlay is not None:
+        overlay.reset()  # run() resets it too; describe its configuration, not its state
+    strategy = engine.strategy
+    return {
+        "data": frame_fingerprint(engine.feed.df),
+        "dtypes": engine.policy.name,
+        "strategy": f"{type(strategy).__module__}.{type(strategy).__qualname__}",
+        "params": _describe(dict(strategy.params)),
+        "broker": _describe(engine.broker),
+        "initial_cash": engine.initial_cash,
+        "block_size": engine.block_size,
+        "risk_overlay": _describe(overlay),
+        "budget": _describe(engine.budget),
+        "freq": freq,
+        "version": fluxbt_version(),
+    }
+
+
+def run_key(engine: BacktestEngine, freq: Literal["D", "H", "MIN"] = "D") -> str:
+    text = json.dumps(run_inputs(engine, freq), sort_keys=True, default=repr)
+    return hashlib.sha1(text.encode(), usedforsecurity=False).hexdigest()
+
+
+@dataclass
+class MemoResult:
+    history: pd.DataFrame
+    fills: list[Fill]
+    metrics: dict[str, float]
+    key: str
+    hit: bool
+
+
+@dataclass
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class RunMemo:
+    """Skip backtests whose exact inputs already ran: data, strategy, broker, cash, version.
+
+    The stored metrics are annualized for the ``freq`` of the run, so ``freq`` is part of
+    the key too.
+
+    ``run(engine)`` returns the stored history, fills and metrics on a hit and runs the
+    engine (then stores the result) on a miss or with ``refresh=True``. Strategies must
+    be deterministic given their ``params``, and the engine must not have a ``sink``
+    (memoized runs keep their full history). Writes are atomic (directory rename), so
+    processes can share one store.
+    """
+
+    path: str = field(default_factory=default_memo_dir)
+    max_bytes: int = field(
+        default_factory=lambda: int(os.environ.get(ENV_MEMO_BYTES, DEFAULT_MAX_BYTES))
+    )
+    stats: MemoStats = field(default_factory=MemoStats, init=False)
+
+    def __post_init__(self) -> None:
+        os.makedirs(self.path, exist_ok=True)
+
+    def run(
+        self,
+        engine: BacktestEngine,
+        freq: Literal["D", "H", "MIN"] = "D",
+        refresh: bool = False,
+    ) -> MemoResult:
+        if engine.sink is not None:
+            raise ValueError("RunMemo stores the full history; run the engine without a sink")
+        inputs = run_inputs(engine, freq)
+        key = run_key(engine, freq)
+        if not refresh:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+        self.stats.misses += 1
+        history = engine.run()
+        metrics = engine.accumulator.result(freq)
+        self.put(key, history, engine.fills, metrics, inputs)
+        return MemoResult(history, list(engine.fills), metrics, key, hit=False)
+
+    def get(self, key: str) -> MemoResult | None:
+        entry = os.path.join(self.path, key)
+        try:
+            with open(os.path.join(entry, MEMO_FILE), encoding="utf-8") as f:
+                info = json.load(f)
+            artifact = read_artifact(entry)
+            history = artifact.history
+            fills_df = artifact.fills
+            metrics = artifact.metrics
+        except (OSError, ValueError, KeyError):  # missing, evicted or partial entry
+            return None
+        if info.get("aborted") is not None:
+            history.attrs["aborted"] = info["aborted"]
+        fills = [
+            Fill(
+                str(r.order_id),
+                pd.Timestamp(r.ts),
+                float(r.price),
+                float(r.qty),
+                float(r.commission),
+            )
+            for r in fills_df.itertuples(index=False)
+        ]
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        self.stats.hits += 1
+        return MemoResult(history, fills, dict(metrics), key, hit=True)
+
+    def put(
+        self,
+        key: str,
+        history: pd.DataFrame,
+        fills: list[Fill],
+        metrics: dict[str, float],
+        inputs: dict[str, object] | None = None,
+    ) -> None:
+        tmp = tempfile.mkdtemp(dir=self.path, prefix=".tmp-")
+        try:
+            NpyArtifactWriter().write(tmp, history, fills, metrics)
+            info = {"inputs": inputs, "aborted": history.attrs.get("aborted")}
+            with open(os.path.join(tmp, MEMO_FILE), "w", encoding="utf-8") as f:
+                json.dump(info, f, indent=2, default=repr)
+            entry = os.path.join(self.path, key)
+            if os.path.isdir(entry):
+                shutil.rmtree(entry, ignore_errors=True)
+            os.replace(tmp, entry)
+        except OSError:
+            # another process stored the same key first (or the disk is full)
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        self.evict(keep=key)
+
+    def entries(self) -> list[tuple[str, int, float]]:
+        """``(key, bytes, last_used)`` of every stored run, least recently used first."""
+        out = []
+        for name in os.listdir(self.path):
+            entry = os.path.join(self.path, name)
+            if name.startswith(".") or not os.path.isdir(entry):
+                continue
+            size = 0
+            for root, _, files in os.walk(entry):
+                for file in files:
+                    try:
+                        size += os.path.getsize(os.path.join(root, file))
+                    except OSError:
+                        pass
+            try:
+                mtime = os.path.getmtime(entry)
+            except OSError:
+                continue
+            out.append((name, size, mtime))
+        return sorted(out, key=lambda e: e[2])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: str | None = None) -> int:
+        """Drop least recently used entries until the store fits ``max_bytes``."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for name, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
+            total -= size
+            removed += 1
+        self.stats.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        for name, _, _ in self.entries():
+            shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
+        self.stats = MemoStats()
+
+    def __len__(self) -> int:
+        return len(self.entries())
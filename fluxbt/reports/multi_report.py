@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .downsample import downsample
+from .plotting import _finish, _subplots
+from .report import compile_template
+
+
+@dataclass
+class RunSummary:
+    """One backtest in a sweep: identifying name, parameters, metrics and equity curve."""
+
+    name: str
+    params: dict[str, object]
+    metrics: dict[str, float]
+    equity: pd.Series = field(repr=False)
+
+
+_MULTI_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+  <head>
+    <meta charset="utf-8" />
+    <title>FluxBT Sweep Report</title>
+    <style>
+      body { font-family: Arial, sans-serif; margin: 20px; }
+      table { border-collapse: collapse; width: 100%; }
+      th, td { border: 1px solid #ddd; padding: 6px; text-align: right; }
+      th { background: #f5f5f5; cursor: pointer; user-select: none; }
+      .left { text-align: left; }
+      img.full { width: 100%; max-width: 1000px; }
+      img.thumb { height: 40px; }
+    </style>
+  </head>
+  <body>
+    <h1>FluxBT Sweep Report</h1>
+    <p>{{ runs|length }} runs, sorted by {{ sort_by }}. Click a column header to re-sort.</p>
+    {% if overlay %}
+    <h2>Top {{ top_n }} Equity Curves</h2>
+    <img class="full" src="{{ overlay }}" />
+    {% endif %}
+    {% if heatmap %}
+    <h2>{{ heatmap_metric }} by {{ heatmap_params[0] }} x {{ heatmap_params[1] }}</h2>
+    <img class="full" src="{{ heatmap }}" />
+    {% endif %}
+    <h2>Runs</h2>
+    <table id="runs">
+      <thead>
+        <tr>
+          <th class="left">run</th>
+          {% for p in param_keys %}<th class="left">{{ p }}</th>{% endfor %}
+          {% for m in metric_keys %}<th>{{ m }}</th>{% endfor %}
+          <th>equity</th>
+        </tr>
+      </thead>
+      <tbody>
+        {% for r in rows %}
+        <tr>
+          <td class="left">{{ r.name }}</td>
+          {% for p in param_keys %}<td class="left">{{ r.params.get(p, "") }}</td>{% endfor %}
+          {% for m in metric_keys %}
+          {% set v = r.metrics.get(m, nan) %}
+          <td data-v="{{ v if v == v else '' }}">{{ "%0.4f" % v if v == v else "nan" }}</td>
+          {% endfor %}
+          <td>{% if r.chart %}<img class="thumb" src="{{ r.chart }}" />{% else %}{{ r.spark|safe }}{% endif %}</td>
+        </tr>
+        {% endfor %}
+      </tbody>
+    </table>
+    <script>
+      document.querySelectorAll("#runs th").forEach(function (th, col) {
+        th.addEventListener("click", function () {
+          var body = document.querySelector("#runs tbody");
+          var rows = Array.from(body.rows);
+          var asc = th.dataset.asc !== "1";
+          th.dataset.asc = asc ? "1" : "0";
+          rows.sort(function (a, b) {
+            var x = a.cells[col], y = b.cells[col];
+            var xv = x.dataset.v !== undefined ? parseFloat(x.dataset.v) : x.textContent;
+            var yv = y.dataset.v !== undefined ? parseFloat(y.dataset.v) : y.textContent;
+            if (typeof xv === "number" && isNaN(xv)) return 1;
+            if (typeof yv === "number" && isNaN(yv)) return -1;
+            return (xv < yv ? -1 : xv > yv ? 1 : 0) * (asc ? 1 : -1);
+          });
+          rows.forEach(function (r) { body.appendChild(r); });
+        });
+      });
+    </script>
+  </body>
+</html>
+"""
+
+
+def _sparkline_svg(equity: pd.Series, points: int, width: int = 120, height: int = 30) -> str:
+    """Inline SVG polyline of a downsampled equity curve (no image file needed)."""
+    y = downsample(equity, points).to_numpy(dtype=float)
+    y = y[np.isfinite(y)]
+    if len(y) < 2:
+        return ""
+    span = float(y.max() - y.min()) or 1.0
+    xs = np.linspace(0, width, len(y))
+    ys = height - (y - y.min()) / span * height
+    pts = " ".join(f"{a:.1f},{b:.1f}" for a, b in zip(xs, ys, strict=True))
+    color = "#2a7" if y[-1] >= y[0] else "#c33"
+    return (
+        f'<svg width="{width}" height="{height}"><polyline fill="none" stroke="{color}" '
+        f'stroke-width="1" points="{pts}" /></svg>'
+    )
+
+
+def _render_run_chart(job: tuple[pd.Series, str]) -> str:
+    equity, path = job
+    fig, ax = _subplots((3, 1))
+    ax.plot(equity.index, equity.to_numpy(), linewidth=0.8)
+    ax.set_axis_off()
+    fig.set_dpi(80)
+    _finish(fig, path)
+    return path
+
+
+def _plot_overlay(runs: Sequence[RunSummary], path: str, max_points: int) -> None:
+    fig, ax = _subplots((10, 4))
+    for run in runs:
+        eq = run.equity.dropna()
+        if eq.empty or eq.iloc[0] == 0:
+            continue
+        downsample(eq / eq.iloc[0], max_points).plot(ax=ax, label=run.name, linewidth=1)
+    ax.set_title("Equity (normalized to 1.0)")
+    ax.set_xlabel("Time")
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize="small", loc="upper left")
+    _finish(fig, path)
+
+
+def _plot_heatmap(table: pd.DataFrame, metric: str, path: str) -> None:
+    fig, ax = _subplots((8, 6))
+    values = table.to_numpy(dtype=float)
+    img = ax.imshow(values, aspect="auto", origin="lower", cmap="viridis")
+    ax.set_xticks(range(len(table.columns)), [str(c) for c in table.columns], rotation=45)
+    ax.set_yticks(range(len(table.index)), [str(i) for i in table.index])
+    ax.set_xlabel(str(table.columns.name))
+    ax.set_ylabel(str(table.index.name))
+    fig.colorbar(img, ax=ax, label=metric)
+    _finish(fig, path)
+
+
+def _heatmap_table(
+    runs: Sequence[RunSummary], params: tuple[str, str] | None, metric: str
+) -> pd.DataFrame | None:
+    frame = pd.DataFrame(
+        [{**run.params, "__metric__": run.metrics.get(metric, math.nan)} for run in runs]
+    )
+    if params is None:
+        # auto-pick the first two numeric parameters that actually vary
+        varying = [
+            c
+            for c in frame.columns
+            if c != "__metric__"
+            and pd.api.types.is_numeric_dtype(frame[c])
+            and not pd.api.types.is_bool_dtype(frame[c])
+            and frame[c].nunique() > 1
+        ]
+        if len(varying) < 2:
+            return None
+        params = (varying[0], varying[1])
+    if any(p not in frame.columns for p in params):
+        return None
+    return frame.pivot_table(index=params[0], columns=params[1], values="__metric__")
+
+
+def generate_multi_run_report(
+    runs: Sequence[RunSummary],
+    out_dir: str | None = None,
+    sort_by: str = "sharpe",
+    top_n: int = 10,
+    heatmap_params: tuple[str, str] | None = None,
+    heatmap_metric: str | None = None,
+    workers: int | None = None,
+    png_per_run_limit: int = 50,
+    max_points: int = 1_000,
+    spark_points: int = 60,
+) -> str | None:
+    """Write one HTML report comparing many runs (e.g. a parameter sweep).
+
+    Contains a sortable metrics table, a parameter heatmap of ``heatmap_metric``
+    (default ``sort_by``) and the top-``top_n`` equity curves overlaid. Up to
+    ``png_per_run_limit`` runs get their own equity PNG, rendered in a process pool of
+    ``workers`` processes (``workers=1`` renders serially); larger sweeps embed inline
+    SVG sparklines of ``spark_points`` points instead of writing one file per run.
+    """
+    try:
+        template = compile_template(_MULTI_TEMPLATE)
+    except ImportError:
+        print("jinja2 not installed; skipping HTML report generation.")
+        return None
+
+    ts_dir = out_dir or os.path.join("runs", datetime.utcnow().strftime("%Y%m%d_%H%M%S"))
+    os.makedirs(ts_dir, exist_ok=True)
+
+    def sort_key(run: RunSummary) -> float:
+        v = run.metrics.get(sort_by, math.nan)
+        return -v if v == v else math.inf
+
+    ranked = sorted(runs, key=sort_key)
+
+    overlay = None
+    if ranked and top_n > 0:
+        overlay = "top_equity.png"
+        _plot_overlay(ranked[:top_n], os.path.join(ts_dir, overlay), max_points)
+
+    metric = heatmap_metric or sort_by
+    heatmap = None
+    table = _heatmap_table(ranked, heatmap_params, metric)
+    if table is not None and table.size:
+        heatmap = "heatmap.png"
+        heatmap_params = (str(table.index.name), str(table.columns.name))
+        _plot_heatmap(table, metric, os.path.join(ts_dir, heatmap))
+
+    charts: list[str | None] = [None] * len(ranked)
+    sparks = [""] * len(ranked)
+    if len(ranked) <= png_per_run_limit:
+        chart_dir = os.path.join(ts_dir, "runs")
+        os.makedirs(chart_dir, exist_ok=True)
+        # downsample before pickling so workers receive small payloads
+        jobs = [
+            (downsample(run.equity, max_points), os.path.join(chart_dir, f"{i:05d}.png"))
+            for i, run in enumerate(ranked)
+        ]
+        n_workers = workers or os.cpu_count() or 1
+        if n_workers <= 1 or len(jobs) <= 1:
+            paths = [_render_run_chart(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(jobs))) as pool:
+                paths = list(pool.map(_render_run_chart, jobs))
+        charts = [os.path.relpath(p, ts_dir) for p in paths]
+    else:
+        sparks = [_sparkline_svg(run.equity, spark_points) for run in ranked]
+
+    param_keys = list(dict.fromkeys(k for run in ranked for k in run.params))
+    metric_keys = list(dict.fromkeys(k for run in ranked for k in run.metrics))
+    rows = [
+        {"name": run.name, "params": run.params, "metrics": run.metrics, "chart": c, "spark": s}
+        for run, c, s in zip(ranked, charts, sparks, strict=True)
+    ]
+    html = template.render(
+        runs=ranked,
+        rows=rows,
+        sort_by=sort_by,
+        top_n=min(top_n, len(ranked)),
+        overlay=overlay,
+        heatmap=heatmap,
+        heatmap_params=heatmap_params,
+        heatmap_metric=metric,
+        param_keys=param_keys,
+        metric_keys=metric_keys,
+        nan=math.nan,
+    )
+    out_path = os.path.join(ts_dir, "sweep_report.html")
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return out_path
@@ -1,45 +1,88 @@
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
+import os
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
+
 import pandas as pd
 
+from .downsample import DownsampleMethod, downsample
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+
+def _pyplot() -> ModuleType:
+    """Import pyplot on first use, defaulting to the non-interactive Agg backend.
+
+    An explicit ``MPLBACKEND`` or an already-imported pyplot (e.g. in notebooks) wins.
+    """
+    if "matplotlib.pyplot" not in sys.modules and not os.environ.get("MPLBACKEND"):
+        import matplotlib
+
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
 
-def plot_equity_curve(equity: pd.Series, savepath: str | None = None) -> Figure:
-    fig, ax = plt.subplots(figsize=(10, 4))
-    equity.plot(ax=ax)
+
+def _subplots(figsize: tuple[float, float]) -> tuple[Figure, Axes]:
+    fig, ax = _pyplot().subplots(figsize=figsize)
+    return fig, ax
+
+
+def _finish(fig: Figure, savepath: str | None) -> None:
+    """Save ``fig`` if requested and release it from pyplot so repeated calls don't leak.
+
+    Figures without a ``savepath`` stay registered with pyplot for interactive display.
+    """
+    fig.tight_layout()
+    if savepath:
+        fig.savefig(savepath)
+        _pyplot().close(fig)
+
+
+def plot_equity_curve(
+    equity: pd.Series,
+    savepath: str | None = None,
+    max_points: int | None = 2_000,
+    method: DownsampleMethod = "lttb",
+) -> Figure:
+    fig, ax = _subplots((10, 4))
+    downsample(equity, max_points, method).plot(ax=ax)
     ax.set_title("Equity Curve")
     ax.set_xlabel("Time")
     ax.set_ylabel("Equity")
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
-    if savepath:
-        fig.savefig(savepath)
+    _finish(fig, savepath)
     return fig
 
 
-def plot_drawdown(drawdown: pd.Series, savepath: str | None = None) -> Figure:
-    fig, ax = plt.subplots(figsize=(10, 2.5))
-    drawdown.plot(ax=ax)
+def plot_drawdown(
+    drawdown: pd.Series,
+    savepath: str | None = None,
+    max_points: int | None = 2_000,
+    method: DownsampleMethod = "minmax",
+) -> Figure:
+    fig, ax = _subplots((10, 2.5))
+    downsample(drawdown, max_points, method).plot(ax=ax)
     ax.set_title("Drawdown")
     ax.set_xlabel("Time")
     ax.set_ylabel("Drawdown")
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
-    if savepath:
-        fig.savefig(savepath)
+    _finish(fig, savepath)
     return fig
 
 
 def plot_trade_pnl(trades_df: pd.DataFrame, savepath: str | None = None) -> Figure:
-    fig, ax = plt.subplots(figsize=(10, 3))
+    fig, ax = _subplots((10, 3))
     if not trades_df.empty and "pnl" in trades_df.columns:
         trades_df["pnl"].plot(kind="bar", ax=ax)
     ax.set_title("Trade PnL")
     ax.set_xlabel("Trade #")
     ax.set_ylabel("PnL")
     ax.grid(True, axis="y", alpha=0.3)
-    fig.tight_layout()
-    if savepath:
-        fig.savefig(savepath)
+    _finish(fig, savepath)
     return fig
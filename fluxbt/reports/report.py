@@ -2,33 +2,27 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 import pandas as pd
 
 from .plotting import plot_drawdown, plot_equity_curve
 
+if TYPE_CHECKING:
+    from jinja2 import Template
 
-def generate_html_report(
-    params: dict[str, object],
-    metrics: dict[str, float],
-    equity: pd.Series,
-    out_dir: str | None = None,
-) -> str | None:
-    try:
-        from jinja2 import Environment, FileSystemLoader, select_autoescape
-    except Exception:
-        print("jinja2 not installed; skipping HTML report generation.")
-        return None
 
-    ts_dir = out_dir or os.path.join("runs", datetime.utcnow().strftime("%Y%m%d_%H%M%S"))
-    os.makedirs(ts_dir, exist_ok=True)
+@lru_cache(maxsize=None)
+def compile_template(template_str: str) -> Template:
+    """Compile a jinja2 template once per process; raises ImportError without jinja2."""
+    from jinja2 import Environment, select_autoescape
 
-    eq_path = os.path.join(ts_dir, "equity.png")
-    dd_path = os.path.join(ts_dir, "drawdown.png")
-    plot_equity_curve(equity, savepath=eq_path)
-    drawdown = (equity / equity.cummax() - 1.0).fillna(0.0)
-    plot_drawdown(drawdown, savepath=dd_path)
+    env = Environment(autoescape=select_autoescape())
+    return env.from_string(template_str)
 
-    template_str = """
+
+_REPORT_TEMPLATE = """
 <!DOCTYPE html>
 <html>
   <head>
@@ -73,8 +67,28 @@ def generate_html_report(
 </html>
 """
 
-    env = Environment(loader=FileSystemLoader("."), autoescape=select_autoescape())
-    template = env.from_string(template_str)
+
+def generate_html_report(
+    params: dict[str, object],
+    metrics: dict[str, float],
+    equity: pd.Series,
+    out_dir: str | None = None,
+) -> str | None:
+    try:
+        template = compile_template(_REPORT_TEMPLATE)
+    except ImportError:
+        print("jinja2 not installed; skipping HTML report generation.")
+        return None
+
+    ts_dir = out_dir or os.path.join("runs", datetime.utcnow().strftime("%Y%m%d_%H%M%S"))
+    os.makedirs(ts_dir, exist_ok=True)
+
+    eq_path = os.path.join(ts_dir, "equity.png")
+    dd_path = os.path.join(ts_dir, "drawdown.png")
+    plot_equity_curve(equity, savepath=eq_path)
+    drawdown = (equity / equity.cummax() - 1.0).fillna(0.0)
+    plot_drawdown(drawdown, savepath=dd_path)
+
     html = template.render(params=params, metrics=metrics)
     out_path = os.path.join(ts_dir, "report.html")
     with open(out_path, "w", encoding="utf-8") as f:
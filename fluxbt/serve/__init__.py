@@ -0,0 +1,27 @@
+from .client import (
+    DEFAULT_PORT,
+    ENV_SERVE_ADDRESS,
+    ENV_SERVE_TOKEN_FILE,
+    TOKEN_HEADER,
+    RunRequest,
+    ServeClient,
+    ServeError,
+    default_address,
+    default_token_path,
+)
+from .server import FeedCache, RunServer, execute
+
+__all__ = [
+    "RunRequest",
+    "ServeClient",
+    "ServeError",
+    "default_address",
+    "default_token_path",
+    "DEFAULT_PORT",
+    "ENV_SERVE_ADDRESS",
+    "ENV_SERVE_TOKEN_FILE",
+    "TOKEN_HEADER",
+    "RunServer",
+    "FeedCache",
+    "execute",
+]
@@ -0,0 +1,164 @@
+"""Client side of ``fluxbt serve``: request type and a stdlib-only HTTP client.
+
+Kept free of pandas/numpy imports so that ``fluxbt run-client`` starts as fast as the
+interpreter allows; all heavy work happens in the server's warm workers.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import math
+import os
+import socket
+from dataclasses import asdict, dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+ENV_SERVE_ADDRESS = "FLUXBT_SERVE_ADDRESS"
+ENV_SERVE_TOKEN_FILE = "FLUXBT_SERVE_TOKEN_FILE"
+DEFAULT_PORT = 8765
+TOKEN_HEADER = "X-Fluxbt-Token"
+
+
+def default_address() -> str:
+    return os.environ.get(ENV_SERVE_ADDRESS) or f"http://127.0.0.1:{DEFAULT_PORT}"
+
+
+def default_token_path(address: str) -> str:
+    """Where the server at ``address`` writes its token: ``$FLUXBT_SERVE_TOKEN_FILE``,
+    else ``<socket>.token`` next to a Unix socket or ``~/.fluxbt/serve-<port>.token``."""
+    env = os.environ.get(ENV_SERVE_TOKEN_FILE)
+    if env:
+        return env
+    if address.startswith("unix:"):
+        return address[len("unix:") :] + ".token"
+    url = urlsplit(address if "://" in address else f"http://{address}")
+    port = url.port or DEFAULT_PORT
+    return os.path.join(os.path.expanduser("~"), ".fluxbt", f"serve-{port}.token")
+
+
+class ServeError(RuntimeError):
+    """The server could not be reached or rejected/failed a request."""
+
+
+@dataclass
+class RunRequest:
+    """One ``fluxbt run`` for the server.
+
+    ``spec`` holds ``RunSpec`` fields (strategy, params, data, cash, ...); file paths
+    in it and ``out`` are resolved by the server, so pass absolute paths. With
+    ``out=None`` the server picks ``runs/<timestamp>_<id>`` under its working directory.
+    """
+
+    spec: dict[str, Any]
+    dtypes: str = "float64"
+    out: str | None = None
+    artifact_format: str = "npy"
+    csv: bool = False
+    register: bool = True
+    catalog: str | None = None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> RunRequest:
+        body = json.loads(text)
+        if not isinstance(body, dict):
+            raise ValueError("run request must be a JSON object")
+        return cls(**body)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float | None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            sock.settimeout(self.timeout)
+        sock.connect(self.unix_path)
+        self.sock = sock
+
+
+class ServeClient:
+    """Talks to a ``RunServer`` at ``address``: ``unix:/path/to.sock``,
+    ``http://host:port`` or ``host:port`` (default ``$FLUXBT_SERVE_ADDRESS`` or
+    ``http://127.0.0.1:8765``).
+
+    Requests carry the server's token: ``token`` if given, else the contents of
+    ``token_path`` (default ``default_token_path(address)``), read on every request
+    so a restarted server's new token is picked up.
+    """
+
+    def __init__(
+        self,
+        address: str | None = None,
+        timeout: float | None = None,
+        token: str | None = None,
+        token_path: str | None = None,
+    ) -> None:
+        self.address = address or default_address()
+        self.timeout = timeout
+        self.token = token
+        self.token_path = token_path or default_token_path(self.address)
+
+    def _token(self) -> str | None:
+        if self.token is not None:
+            return self.token
+        try:
+            with open(self.token_path, encoding="utf-8") as f:
+                return f.read().strip()
+        except OSError:
+            return None  # the server answers 401, naming the token file
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.address.startswith("unix:"):
+            return _UnixHTTPConnection(self.address[len("unix:") :], self.timeout)
+        url = urlsplit(self.address if "://" in self.address else f"http://{self.address}")
+        return http.client.HTTPConnection(
+            url.hostname or "127.0.0.1", url.port or DEFAULT_PORT, timeout=self.timeout
+        )
+
+    def _request(self, method: str, path: str, body: str | None = None) -> dict[str, Any]:
+        conn = self._connection()
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        token = self._token()
+        if token is not None:
+            headers[TOKEN_HEADER] = token
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            payload = json.loads(response.read() or b"{}")
+        except (OSError, http.client.HTTPException) as exc:
+            raise ServeError(f"No fluxbt server reachable at {self.address}: {exc}") from exc
+        except ValueError as exc:
+            raise ServeError(f"Malformed response from {self.address}: {exc}") from exc
+        finally:
+            conn.close()
+        if response.status == 401:
+            raise ServeError(
+                f"{payload.get('error', 'Unauthorized')} (token file: {self.token_path})"
+            )
+        if response.status != 200:
+            raise ServeError(payload.get("error", f"HTTP {response.status}"))
+        return dict(payload)
+
+    def health(self) -> dict[str, Any]:
+        """Server status: pid, uptime, workers, run counts and feed cache stats."""
+        return self._request("GET", "/health")
+
+    def run(self, request: RunRequest) -> dict[str, Any]:
+        """Run a backtest on the server; returns metrics, the output directory and timings.
+
+        Non-finite metrics travel as JSON ``null`` and come back as NaN.
+        """
+        result = self._request("POST", "/run", request.to_json())
+        metrics = result.get("metrics") or {}
+        result["metrics"] = {k: math.nan if v is None else v for k, v in metrics.items()}
+        return result
+
+    def shutdown(self) -> None:
+        self._request("POST", "/shutdown", "{}")
@@ -0,0 +1,532 @@
+"""``fluxbt serve``: a long-running process that keeps imports and loaded inputs warm.
+
+A ``RunServer`` accepts ``RunRequest``s over HTTP on localhost or a Unix socket and
+runs them on a pool of worker processes. Each worker imports the engine, loaders and
+strategies once at startup and keeps an LRU ``FeedCache`` of parsed inputs, so a
+request pays only for the simulation and writing its artifacts.
+
+Endpoints: ``GET /health``, ``POST /run`` (a ``RunRequest`` as JSON) and
+``POST /shutdown``. A request can make the server write files anywhere its user can,
+so every request must carry the server's random token in an ``X-Fluxbt-Token``
+header; the server writes the token to a file only its user can read (mode 0600),
+where ``ServeClient`` finds it. Requests whose ``Host`` is not a loopback name or the
+bound host, or that carry a non-local ``Origin``, are refused, as are POSTs that are
+not ``application/json``: together these stop web pages (cross-site requests, DNS
+rebinding) from driving the server. Keep TCP servers on localhost and prefer a Unix
+socket (mode 0600) on shared machines.
+"""
+
+from __future__ import annotations
+
+import hmac
+import json
+import math
+import multiprocessing
+import os
+import secrets
+import socket
+import socketserver
+import stat
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import urlsplit
+
+from .client import DEFAULT_PORT, TOKEN_HEADER, RunRequest, default_token_path
+
+if TYPE_CHECKING:
+    from ..data.feed import DataFeed
+
+DEFAULT_MAX_FEEDS = 8
+DEFAULT_MAX_FEED_BYTES = 2 * 1024 * 1024 * 1024
+_LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+
+@dataclass
+class FeedCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _Entry:
+    feed: DataFeed
+    fingerprint: str
+    stamp: tuple[int, int] | None
+    nbytes: int
+
+
+def _stamp(data: Mapping[str, object]) -> tuple[int, int] | None:
+    """Size and mtime of a CSV input, so edits to the file invalidate its entry."""
+    if data.get("source") != "csv":
+        return None
+    try:
+        st = os.stat(str(data["path"]))
+    except (KeyError, OSError):
+        return None  # the loader reports the problem
+    return st.st_size, st.st_mtime_ns
+
+
+class FeedCache:
+    """Thread-safe LRU of loaded inputs, keyed by a ``RunSpec.data`` mapping and dtypes.
+
+    CSV entries are revalidated against the file's size and mtime on every lookup.
+    The least recently used entries are dropped once there are more than
+    ``max_entries`` or they hold more than ``max_bytes`` (the newest entry is always
+    kept). Feeds are shared between runs and must not be modified.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_FEEDS, max_bytes: int = DEFAULT_MAX_FEED_BYTES
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = FeedCacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, data: Mapping[str, object], dtypes: str = "float64"
+    ) -> tuple[DataFeed, str, bool]:
+        """``(feed, data fingerprint, was cached)``; loads and stores the input on a miss."""
+        from ..dtypes import DtypePolicy
+        from ..data.feed import DataFeed
+        from ..reports.catalog import frame_fingerprint
+        from ..sweep.spec import load_data
+
+        key = json.dumps({"data": dict(data), "dtypes": dtypes}, sort_keys=True)
+        stamp = _stamp(data)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry.feed, entry.fingerprint, True
+        # Load outside the lock so runs on other inputs are not held up; concurrent
+        # misses on one input each load it and the last store wins
+        policy = DtypePolicy.from_name(dtypes)
+        df = load_data(data)
+        feed = DataFeed(df, dtypes=policy)
+        nbytes = int(feed.df.memory_usage(index=True).sum())
+        entry = _Entry(feed, frame_fingerprint(df), stamp, nbytes)
+        with self._lock:
+            self.stats.misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+        return feed, entry.fingerprint, False
+
+    def _evict(self) -> None:
+        total = sum(e.nbytes for e in self._entries.values())
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or total > self.max_bytes
+        ):
+            _, oldest = self._entries.popitem(last=False)
+            total -= oldest.nbytes
+            self.stats.evictions += 1
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(e.nbytes for e in self._entries.values())
+
+    def info(self) -> dict[str, int]:
+        return {"entries": len(self), "bytes": self.nbytes, **asdict(self.stats)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def _default_out() -> str:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    return os.path.join("runs", f"{stamp}_{uuid.uuid4().hex[:6]}")
+
+
+def execute(request: RunRequest, feeds: FeedCache) -> dict[str, Any]:
+    """Run ``request`` with inputs from ``feeds``, as ``fluxbt run`` does minus plots.
+
+    Returns the metrics, the absolute output directory and run details.
+    """
+    from ..core.broker import Broker
+    from ..core.budget import RunBudget
+    from ..core.engine import BacktestEngine
+    from ..core.metrics import compute_metrics
+    from ..reports.artifacts import export_csv, get_artifact_writer
+    from ..reports.catalog import RunCatalog, RunRecord
+    from ..sweep.spec import STRATEGIES, RunSpec
+
+    spec = RunSpec(**request.spec)
+    if spec.strategy not in STRATEGIES:
+        raise ValueError(
+            f"Unknown strategy {spec.strategy!r}; expected one of {sorted(STRATEGIES)}"
+        )
+    writer = get_artifact_writer(request.artifact_format)
+    feed, fingerprint, cached = feeds.get(spec.data, request.dtypes)
+    strategy = STRATEGIES[spec.strategy](**spec.params)
+    engine = BacktestEngine(
+        feed=feed,
+        broker=Broker(slippage_bps=spec.slippage_bps, commission_bps=spec.commission_bps),
+        strategy=strategy,
+        initial_cash=spec.cash,
+        block_size=spec.block_size,
+        budget=RunBudget.from_dict(spec.budget) if spec.budget is not None else None,
+    )
+    start = time.perf_counter()
+    hist = engine.run()
+    seconds = time.perf_counter() - start
+    metrics = compute_metrics(hist["equity"], freq=spec.freq)
+
+    out = os.path.abspath(request.out or _default_out())
+    os.makedirs(out, exist_ok=True)
+    writer.write(out, hist, engine.fills, metrics)
+    if request.csv:
+        export_csv(out, hist, engine.fills)
+    if request.register:
+        record = RunRecord(
+            strategy=strategy.name,
+            params=dict(strategy.params),
+            metrics=metrics,
+            data_fingerprint=fingerprint,
+            run_dir=out,
+        )
+        with RunCatalog(request.catalog) as catalog:
+            catalog.register(record)
+    return {
+        "metrics": metrics,
+        "out": out,
+        "bars": engine.n_bars,
+        "fills": len(engine.fills),
+        "aborted": engine.aborted,
+        "seconds": seconds,
+        "data_cached": cached,
+        "worker": os.getpid(),
+    }
+
+
+# Per-process state of pool workers, set up once by `_init_worker`
+_worker_feeds: FeedCache | None = None
+
+
+def _init_worker(max_feeds: int, max_feed_bytes: int) -> None:
+    global _worker_feeds
+    _worker_feeds = FeedCache(max_feeds, max_feed_bytes)
+    # pay for the heavy imports now rather than on the first request
+    from ..core import engine  # noqa: F401
+    from ..data import loader  # noqa: F401
+    from ..reports import artifacts, catalog  # noqa: F401
+    from ..sweep import spec  # noqa: F401
+
+
+def _execute_in_worker(request_json: str) -> dict[str, Any]:
+    assert _worker_feeds is not None, "worker not initialized"
+    return execute(RunRequest.from_json(request_json), _worker_feeds)
+
+
+@dataclass
+class ServerStats:
+    runs: int = 0
+    failures: int = 0
+    data_cache_hits: int = 0
+
+
+class _Owned:
+    owner: RunServer
+
+
+class _TCPServer(_Owned, ThreadingHTTPServer):
+    pass
+
+
+class _UnixServer(_Owned, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _json_safe(value: Any) -> Any:
+    """``value`` with NaN/inf floats replaced by None, which JSON spells ``null``."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    return value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        owner = cast(_Owned, self.server).owner
+        refused = owner.check_request(self.headers)
+        if refused is not None:
+            self._reply(refused[0], {"error": refused[1]})
+        elif self.path == "/health":
+            self._reply(200, owner.health())
+        else:
+            self._reply(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        owner = cast(_Owned, self.server).owner
+        refused = owner.check_request(self.headers, post=True)
+        if refused is not None:
+            self._reply(refused[0], {"error": refused[1]})
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path == "/run":
+            self._reply(*owner.handle_run(body))
+        elif self.path == "/shutdown":
+            self._reply(200, {"status": "stopping"})
+            # shutdown() waits for the serving loop, so it cannot run on this thread's stack
+            threading.Thread(target=owner.stop, daemon=True).start()
+        else:
+            self._reply(404, {"error": f"Unknown path {self.path}"})
+
+    def _reply(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(_json_safe(payload), default=str, allow_nan=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # one line per request is noise for a local daemon
+
+
+class RunServer:
+    """Local backtest server; see the module docstring for the protocol.
+
+    Listens on ``host:port`` (``port=0`` picks a free port) or, with ``socket_path``,
+    on a Unix socket. ``workers`` processes (started eagerly, with ``spawn``) run the
+    requests, each with its own ``FeedCache(max_feeds, max_feed_bytes)``; with
+    ``workers=0`` requests run on the server's own threads sharing ``feeds``. Use
+    ``serve_forever`` to block or ``start``/``close`` (or ``with``) to serve from a
+    background thread. A new ``token`` is written to ``token_path`` (default
+    ``default_token_path(address)``) and removed on ``close``. A pool whose worker
+    dies (crash, OOM kill) fails the request it was running and is replaced.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        socket_path: str | None = None,
+        workers: int = 1,
+        max_feeds: int = DEFAULT_MAX_FEEDS,
+        max_feed_bytes: int = DEFAULT_MAX_FEED_BYTES,
+        token_path: str | None = None,
+    ) -> None:
+        if workers < 0:
+            raise ValueError("workers must be >= 0")
+        self.workers = workers
+        self.socket_path = socket_path
+        self.feeds = FeedCache(max_feeds, max_feed_bytes)
+        self.stats = ServerStats()
+        self.token = secrets.token_urlsafe(32)
+        self._max_feeds, self._max_feed_bytes = max_feeds, max_feed_bytes
+        self._lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._started = time.time()
+        self._thread: threading.Thread | None = None
+        self._http: _TCPServer | _UnixServer
+        if socket_path is not None:
+            _claim_socket_path(socket_path)
+            self._http = _UnixServer(socket_path, _Handler)
+            os.chmod(socket_path, 0o600)
+        else:
+            tcp = _TCPServer((host, port), _Handler)
+            self._http, port = tcp, tcp.server_port
+        self._host, self._port = host, port
+        self._http.owner = self
+        self._allowed_hosts = set(_LOOPBACK_HOSTS)
+        if host not in ("", "0.0.0.0", "::"):  # a wildcard bind has no one name to check
+            self._allowed_hosts.add(host.lower())
+        self._pool: ProcessPoolExecutor | None = None
+        self.token_path = token_path or default_token_path(self.address)
+        self._token_written = False
+        try:
+            _write_token(self.token_path, self.token)
+            self._token_written = True
+            if workers:
+                self._pool = self._start_pool()
+        except BaseException:
+            self.close()
+            raise
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        pool = ProcessPoolExecutor(
+            self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self._max_feeds, self._max_feed_bytes),
+        )
+        try:
+            # start every worker now so no request waits for interpreter startup
+            for future in [pool.submit(os.getpid) for _ in range(self.workers)]:
+                future.result()
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+        return pool
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        with self._pool_lock:
+            if self._pool is not broken:  # already replaced by another request, or closed
+                return
+            try:
+                pool = self._start_pool()
+            except Exception:  # noqa: BLE001 - the next request tries again
+                return
+            self._pool = pool
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def address(self) -> str:
+        """Address for ``ServeClient``."""
+        if self.socket_path is not None:
+            return f"unix:{self.socket_path}"
+        return f"http://{self._host}:{self._port}"
+
+    def check_request(self, headers: Message, post: bool = False) -> tuple[int, str] | None:
+        """``(HTTP status, reason)`` to refuse a request with, or None to serve it."""
+        host = urlsplit(f"http://{headers.get('Host', '')}").hostname
+        if host not in self._allowed_hosts:
+            return 403, f"Host {headers.get('Host')!r} is not allowed"
+        origin = headers.get("Origin")
+        if origin is not None and urlsplit(origin).hostname not in self._allowed_hosts:
+            return 403, f"Cross-origin requests are not allowed (Origin {origin!r})"
+        token = headers.get(TOKEN_HEADER)
+        if token is None or not hmac.compare_digest(token.encode(), self.token.encode()):
+            return 401, f"Missing or wrong {TOKEN_HEADER}"
+        if post and headers.get_content_type() != "application/json":
+            return 415, "POST bodies must be application/json"
+        return None
+
+    def handle_run(self, body: bytes) -> tuple[int, dict[str, Any]]:
+        """``(HTTP status, response)`` for one ``/run`` request body."""
+        try:
+            request = RunRequest.from_json(body)
+        except (ValueError, TypeError) as exc:
+            return 400, {"error": f"Bad run request: {exc}"}
+        pool = self._pool
+        try:
+            if pool is not None:
+                result = pool.submit(_execute_in_worker, request.to_json()).result()
+            else:
+                result = execute(request, self.feeds)
+        except BrokenProcessPool:
+            if pool is not None:
+                self._replace_pool(pool)
+            with self._lock:
+                self.stats.failures += 1
+            return 500, {"error": "A worker process died during the run; workers restarted"}
+        except (ValueError, TypeError, KeyError, OSError) as exc:
+            # bad parameters, unknown strategy or format, unreadable input
+            with self._lock:
+                self.stats.failures += 1
+            return 400, {"error": f"{type(exc).__name__}: {exc}"}
+        except Exception:
+            with self._lock:
+                self.stats.failures += 1
+            return 500, {"error": traceback.format_exc(limit=5)}
+        with self._lock:
+            self.stats.runs += 1
+            self.stats.data_cache_hits += bool(result["data_cached"])
+        return 200, result
+
+    def health(self) -> dict[str, Any]:
+        with self._lock:
+            stats = asdict(self.stats)
+        info: dict[str, Any] = {
+            "status": "ok",
+            "pid": os.getpid(),
+            "address": self.address,
+            "uptime": time.time() - self._started,
+            "workers": self.workers,
+            **stats,
+        }
+        if self._pool is None:
+            info["feeds"] = self.feeds.info()
+        return info
+
+    def serve_forever(self) -> None:
+        """Serve until ``stop`` (or ``POST /shutdown``), then release everything."""
+        try:
+            self._http.serve_forever()
+        finally:
+            self.close()
+
+    def start(self) -> None:
+        """Serve from a background thread; ``close`` stops it."""
+        self._thread = threading.Thread(target=self._http.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Make the serving loop return (from another thread)."""
+        self._http.shutdown()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._http.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._http.server_close()
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        for path in (self.socket_path, self.token_path if self._token_written else None):
+            if path is not None:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+    def __enter__(self) -> RunServer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _write_token(path: str, token: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), mode=0o700, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        os.fchmod(f.fileno(), 0o600)  # O_CREAT's mode does not apply to an existing file
+        f.write(token)
+
+
+def _claim_socket_path(path: str) -> None:
+    """Remove a stale socket left by a crashed server; refuse if one is still serving."""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"{path} exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(f"A server is already listening on {path}")
@@ -1,7 +1,14 @@
 from .base import BaseStrategy, Strategy
 from .sma_crossover import SMACrossover
 from .mean_reversion import MeanReversion
-from .remote_loader import load_github_strategy, StrategyLoadError
+from .remote_loader import (
+    GitHubSource,
+    StrategyCache,
+    StrategyLoadError,
+    load_github_strategies,
+    load_github_strategies_async,
+    load_github_strategy,
+)
 
 __all__ = [
     "BaseStrategy",
@@ -9,5 +16,9 @@ __all__ = [
     "SMACrossover",
     "MeanReversion",
     "load_github_strategy",
+    "load_github_strategies",
+    "load_github_strategies_async",
+    "GitHubSource",
+    "StrategyCache",
     "StrategyLoadError",
 ]
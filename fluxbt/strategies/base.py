@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from ..core.orders import Order
 
+if TYPE_CHECKING:
+    from ..core.lookback import BarContext
+
 
 class BaseStrategy(ABC):
     """Abstract base class for all FluxBT strategies.
@@ -17,8 +24,31 @@ class BaseStrategy(ABC):
     - params: Dictionary of parameters for reproducibility/reporting.
     - reset(): Clear internal state; called before each run.
     - on_bar(ts, bar): Return list of Orders given the current bar.
+
+    Strategies that declare a ``lookback`` read past bars through ``self.ctx``
+    instead of keeping their own history.
     """
 
+    # Bound by the engine before the first bar for strategies declaring a `lookback`
+    ctx: BarContext | None = None
+
+    @property
+    def lookback(self) -> int | None:
+        """Most bars this strategy reads via ``ctx.window`` (None: it does not use ``ctx``)."""
+        return None
+
+    def bind(self, ctx: BarContext | None) -> None:
+        """Attach the engine's lookback context; called after ``reset``."""
+        self.ctx = ctx
+
+    def _context(self) -> BarContext:
+        if self.ctx is None:
+            raise RuntimeError(
+                f"{type(self).__name__} reads history through ctx.window; run it in an "
+                "engine or bind a RollingBarContext first"
+            )
+        return self.ctx
+
     @property
     @abstractmethod
     def name(self) -> str:  # pragma: no cover - interface
@@ -39,6 +69,33 @@ class BaseStrategy(ABC):
     ) -> list[Order]:  # pragma: no cover - interface
         raise NotImplementedError
 
+    def on_bars(
+        self, ts: pd.DatetimeIndex, block: Mapping[str, npt.NDArray[np.float64]]
+    ) -> list[tuple[int, list[Order]]]:
+        """Optional block protocol: decide on many bars in one call.
+
+        ``block`` maps each OHLCV column to a read-only NumPy view of the bars at
+        ``ts``. Return ``(i, orders)`` for each block position ``i`` where the strategy
+        acts; the engine replays only those bars through broker and portfolio. Blocks
+        arrive in order, so internal state must carry over exactly as with ``on_bar``.
+        During the call ``ctx`` ends at the bar before the block.
+        Used when ``BacktestEngine.block_size`` is set; strategies that do not override
+        it always receive ``on_bar`` calls.
+        """
+        raise NotImplementedError
+
+    def get_state(self) -> dict[str, object] | None:
+        """Opt-in checkpoint hook: picklable internal state, or None if unsupported.
+
+        Strategies returning state must also implement ``set_state`` so a run can be
+        resumed from a ``Checkpoint`` without replaying earlier bars.
+        """
+        return None
+
+    def set_state(self, state: dict[str, object]) -> None:
+        """Restore state produced by ``get_state``; called after ``reset``."""
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints")
+
 
 class Strategy(BaseStrategy):
     """Backward-compatible alias for existing code that imports Strategy."""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import cast
 
 import pandas as pd
 
@@ -19,7 +20,6 @@ class MeanReversion(Strategy):
     cooldown: int = 0
     allow_short: bool = True
 
-    _prices: list[float] = None  # type: ignore[assignment]
     _position: int = 0
     _entry_price: float | None = None
     _cool: int = 0
@@ -41,23 +41,39 @@ class MeanReversion(Strategy):
             "allow_short": self.allow_short,
         }
 
+    @property
+    def lookback(self) -> int:
+        return self.window
+
     def reset(self) -> None:
-        self._prices = []
         self._position = 0
         self._entry_price = None
         self._cool = 0
 
+    def get_state(self) -> dict[str, object] | None:
+        return {
+            "position": self._position,
+            "entry_price": self._entry_price,
+            "cool": self._cool,
+        }
+
+    def set_state(self, state: dict[str, object]) -> None:
+        self._position = cast(int, state["position"])
+        self._entry_price = cast("float | None", state["entry_price"])
+        self._cool = cast(int, state["cool"])
+
     def on_bar(self, ts: pd.Timestamp, bar: dict[str, float]) -> list[Order]:
         price = bar["close"]
-        self._prices.append(price)
+        ctx = self._context()
         orders: list[Order] = []
-        if len(self._prices) < self.window:
+        if len(ctx) < self.window:
             return orders
 
         import statistics
 
-        mu = statistics.mean(self._prices[-self.window :])
-        sigma = statistics.pstdev(self._prices[-self.window :]) or 1e-12
+        prices = ctx.window("close", self.window).tolist()
+        mu = statistics.mean(prices)
+        sigma = statistics.pstdev(prices) or 1e-12
         z = (price - mu) / sigma
 
         if self._cool > 0:
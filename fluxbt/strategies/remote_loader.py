@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.util
+import json
+import os
 import sys
 import tempfile
+import threading
 import types
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Type
-
-import httpx
+from typing import TYPE_CHECKING, Any, Type
 
 from .base import BaseStrategy
 
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_BASE_URL = "https://raw.githubusercontent.com/"
+
 
 @dataclass(frozen=True)
 class GitHubSource:
@@ -18,9 +26,10 @@ class GitHubSource:
     repo: str
     branch: str
     file_path: str
+    base_url: str = DEFAULT_BASE_URL
 
     def raw_url(self) -> str:
-        base = "https://raw.githubusercontent.com/"
+        base = self.base_url if self.base_url.endswith("/") else self.base_url + "/"
         return base + f"{self.owner}/{self.repo}/{self.branch}/{self.file_path}"
 
 
@@ -28,32 +37,200 @@ class StrategyLoadError(Exception):
     pass
 
 
-def fetch_strategy_code(src: GitHubSource, timeout_s: float = 20.0) -> str:
+def default_cache_dir() -> str:
+    """``$FLUXBT_CACHE_DIR/strategies``, falling back to ``~/.cache/fluxbt/strategies``."""
+    root = os.environ.get("FLUXBT_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "fluxbt"
+    )
+    return os.path.join(root, "strategies")
+
+
+def _sha256(data: str) -> str:
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: str, text: str) -> None:
+    # Write-then-rename so concurrent processes never observe a partial file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+@dataclass
+class StrategyCache:
+    """On-disk cache of remote strategy files.
+
+    Source files are content-addressed (``code/<sha256>.py``) and each URL maps to
+    its current content hash and ETag (``index/<sha256(url)>.json``). Because cached
+    modules are imported from a stable path, Python keeps their bytecode in
+    ``code/__pycache__`` across processes.
+    """
+
+    root: str
+
+    def __post_init__(self) -> None:
+        os.makedirs(os.path.join(self.root, "index"), exist_ok=True)
+        os.makedirs(os.path.join(self.root, "code"), exist_ok=True)
+
+    def _index_path(self, url: str) -> str:
+        return os.path.join(self.root, "index", f"{_sha256(url)}.json")
+
+    def code_path(self, digest: str) -> str:
+        return os.path.join(self.root, "code", f"{digest}.py")
+
+    def lookup(self, url: str) -> dict[str, Any] | None:
+        """Index entry (``url``, ``etag``, ``sha256``) for ``url`` if its code is cached."""
+        try:
+            with open(self._index_path(url), encoding="utf-8") as f:
+                entry: dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self.code_path(str(entry.get("sha256")))):
+            return None
+        return entry
+
+    def read(self, digest: str) -> str:
+        with open(self.code_path(digest), encoding="utf-8") as f:
+            return f.read()
+
+    def store(self, url: str, code: str, etag: str | None) -> str:
+        """Save ``code`` for ``url``; returns its content hash."""
+        digest = _sha256(code)
+        path = self.code_path(digest)
+        if not os.path.exists(path):
+            _atomic_write(path, code)
+        entry = {"url": url, "etag": etag, "sha256": digest}
+        _atomic_write(self._index_path(url), json.dumps(entry))
+        return digest
+
+
+@dataclass(frozen=True)
+class FetchedCode:
+    """Strategy source plus its content hash and the file it was stored at (if cached)."""
+
+    code: str
+    sha256: str
+    path: str | None = None
+
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_client(timeout_s: float = 20.0) -> httpx.Client:
+    """Process-wide pooled ``httpx.Client`` (created on first use)."""
+    global _client
+    import httpx  # local import keeps CLI startup fast
+
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(timeout=timeout_s, follow_redirects=True)
+        return _client
+
+
+def close_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+
+
+def _request_headers(entry: dict[str, Any] | None) -> dict[str, str]:
+    if entry and entry.get("etag"):
+        return {"If-None-Match": str(entry["etag"])}
+    return {}
+
+
+def _fetch_error(src: GitHubSource, exc: Exception) -> StrategyLoadError:
+    return StrategyLoadError(f"Failed to fetch strategy from GitHub: {src.raw_url()}\n{exc}")
+
+
+def _handle_response(
+    src: GitHubSource,
+    resp: httpx.Response,
+    cache: StrategyCache | None,
+    entry: dict[str, Any] | None,
+) -> FetchedCode:
+    if resp.status_code == 304 and cache is not None and entry is not None:
+        digest = str(entry["sha256"])
+        return FetchedCode(cache.read(digest), digest, cache.code_path(digest))
     try:
-        resp = httpx.get(src.raw_url(), timeout=timeout_s)
         resp.raise_for_status()
     except Exception as exc:  # noqa: BLE001 - we attach context and rethrow
-        msg = f"Failed to fetch strategy from GitHub: {src.raw_url()}\n{exc}"
-        raise StrategyLoadError(msg) from exc
-    text: str = resp.text
-    return text
+        raise _fetch_error(src, exc) from exc
+    code: str = resp.text
+    if cache is None:
+        return FetchedCode(code, _sha256(code))
+    digest = cache.store(src.raw_url(), code, resp.headers.get("ETag"))
+    return FetchedCode(code, digest, cache.code_path(digest))
+
 
+def fetch_strategy(
+    src: GitHubSource, timeout_s: float = 20.0, cache: StrategyCache | None = None
+) -> FetchedCode:
+    """Fetch ``src`` over the shared client, revalidating a cached copy with its ETag."""
+    entry = cache.lookup(src.raw_url()) if cache is not None else None
+    try:
+        resp = get_client().get(src.raw_url(), headers=_request_headers(entry), timeout=timeout_s)
+    except Exception as exc:  # noqa: BLE001
+        raise _fetch_error(src, exc) from exc
+    return _handle_response(src, resp, cache, entry)
 
-def _load_module_from_code(module_name: str, code: str) -> types.ModuleType:
-    # Use a temp file to give the module a proper __file__ and better tracebacks
-    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as tmp:
-        tmp.write(code)
-        tmp_path = tmp.name
 
-    spec = importlib.util.spec_from_file_location(module_name, tmp_path)
-    if spec is None or spec.loader is None:
-        raise StrategyLoadError("Could not create module spec for strategy code")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
+async def fetch_strategy_async(
+    src: GitHubSource,
+    client: httpx.AsyncClient,
+    timeout_s: float = 20.0,
+    cache: StrategyCache | None = None,
+) -> FetchedCode:
+    entry = cache.lookup(src.raw_url()) if cache is not None else None
     try:
-        spec.loader.exec_module(module)
+        resp = await client.get(src.raw_url(), headers=_request_headers(entry), timeout=timeout_s)
     except Exception as exc:  # noqa: BLE001
-        raise StrategyLoadError(f"Error importing strategy module: {exc}") from exc
+        raise _fetch_error(src, exc) from exc
+    return _handle_response(src, resp, cache, entry)
+
+
+def fetch_strategy_code(
+    src: GitHubSource, timeout_s: float = 20.0, cache: StrategyCache | None = None
+) -> str:
+    return fetch_strategy(src, timeout_s, cache).code
+
+
+def _load_module_from_code(
+    module_name: str, code: str, path: str | None = None
+) -> types.ModuleType:
+    # Modules are named by content hash, so identical code is only executed once
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    tmp_path = None
+    if path is None:
+        # Use a temp file to give the module a proper __file__ and better tracebacks
+        with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as tmp:
+            tmp.write(code)
+            tmp_path = path = tmp.name
+
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise StrategyLoadError("Could not create module spec for strategy code")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception as exc:  # noqa: BLE001
+            del sys.modules[module_name]
+            raise StrategyLoadError(f"Error importing strategy module: {exc}") from exc
+    finally:
+        if tmp_path is not None:
+            os.unlink(tmp_path)
     return module
 
 
@@ -80,25 +257,10 @@ def _find_strategy_class(module: types.ModuleType, class_name: str | None) -> Ty
     return candidates[0]
 
 
-def load_github_strategy(
-    owner: str,
-    repo: str,
-    file_path: str,
-    branch: str = "main",
-    class_name: str | None = None,
-) -> BaseStrategy:
-    """Fetch and load a strategy class from a GitHub repository.
-
-    Parameters
-    ----------
-    owner, repo: GitHub project where the file resides
-    file_path: Path within repository, e.g. "strategies/momentum.py"
-    branch: Branch or tag name
-    class_name: Optional class name; if omitted, auto-detect a single BaseStrategy subclass
-    """
-    src = GitHubSource(owner=owner, repo=repo, branch=branch, file_path=file_path)
-    code = fetch_strategy_code(src)
-    module = _load_module_from_code(module_name="fluxbt_remote_strategy", code=code)
+def _instantiate(fetched: FetchedCode, class_name: str | None) -> BaseStrategy:
+    module = _load_module_from_code(
+        module_name=f"fluxbt_remote_{fetched.sha256[:16]}", code=fetched.code, path=fetched.path
+    )
     cls = _find_strategy_class(module, class_name)
 
     # Validate required interface by instantiation and attribute access
@@ -126,3 +288,84 @@ def load_github_strategy(
     _ = instance.name  # property access
     _ = instance.params  # property access
     return instance
+
+
+def _resolve_cache(use_cache: bool, cache_dir: str | None) -> StrategyCache | None:
+    return StrategyCache(cache_dir or default_cache_dir()) if use_cache else None
+
+
+def load_github_strategy(
+    owner: str,
+    repo: str,
+    file_path: str,
+    branch: str = "main",
+    class_name: str | None = None,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+    base_url: str = DEFAULT_BASE_URL,
+) -> BaseStrategy:
+    """Fetch and load a strategy class from a GitHub repository.
+
+    Parameters
+    ----------
+    owner, repo: GitHub project where the file resides
+    file_path: Path within repository, e.g. "strategies/momentum.py"
+    branch: Branch or tag name
+    class_name: Optional class name; if omitted, auto-detect a single BaseStrategy subclass
+    use_cache, cache_dir: Keep fetched files in ``cache_dir`` (default ``default_cache_dir()``)
+        and revalidate them with ETag/If-None-Match instead of downloading again
+    base_url: Raw-content host, e.g. a GitHub Enterprise or local mirror
+    """
+    src = GitHubSource(
+        owner=owner, repo=repo, branch=branch, file_path=file_path, base_url=base_url
+    )
+    return _instantiate(fetch_strategy(src, cache=_resolve_cache(use_cache, cache_dir)), class_name)
+
+
+async def load_github_strategies_async(
+    sources: Sequence[GitHubSource],
+    class_names: Sequence[str | None] | None = None,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+    max_concurrency: int = 16,
+    timeout_s: float = 20.0,
+) -> list[BaseStrategy]:
+    """Fetch many strategies concurrently over one pooled ``httpx.AsyncClient``.
+
+    Results are returned in the order of ``sources``; the first failure raises
+    ``StrategyLoadError``. Modules are imported after all downloads complete.
+    """
+    import asyncio
+
+    import httpx  # local import keeps CLI startup fast
+
+    names = list(class_names) if class_names is not None else [None] * len(sources)
+    if len(names) != len(sources):
+        raise ValueError("class_names must have the same length as sources")
+    cache = _resolve_cache(use_cache, cache_dir)
+    limit = asyncio.Semaphore(max_concurrency)
+    limits = httpx.Limits(max_connections=max_concurrency)
+
+    async with httpx.AsyncClient(timeout=timeout_s, limits=limits, follow_redirects=True) as client:
+
+        async def one(src: GitHubSource) -> FetchedCode:
+            async with limit:
+                return await fetch_strategy_async(src, client, timeout_s, cache)
+
+        fetched = await asyncio.gather(*(one(src) for src in sources))
+    return [_instantiate(f, name) for f, name in zip(fetched, names, strict=True)]
+
+
+def load_github_strategies(
+    sources: Sequence[GitHubSource],
+    class_names: Sequence[str | None] | None = None,
+    use_cache: bool = True,
+    cache_dir: str | None = None,
+    max_concurrency: int = 16,
+) -> list[BaseStrategy]:
+    """Blocking wrapper around ``load_github_strategies_async``."""
+    import asyncio
+
+    return asyncio.run(
+        load_github_strategies_async(sources, class_names, use_cache, cache_dir, max_concurrency)
+    )
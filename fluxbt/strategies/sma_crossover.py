@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from collections.abc import Mapping
+from typing import cast
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from ..core.indicator_cache import cached
 from ..core.orders import Order, OrderSide
 from .base import Strategy
 
@@ -16,7 +21,6 @@ class SMACrossover(Strategy):
     cooldown: int = 0
     long_only: bool = True
 
-    _prices: list[float] = None  # type: ignore[assignment]
     _cool: int = 0
     _position: int = 0  # -1, 0, 1
 
@@ -34,39 +38,53 @@ class SMACrossover(Strategy):
             "long_only": self.long_only,
         }
 
+    @property
+    def lookback(self) -> int:
+        return max(self.fast, self.slow)
+
     def reset(self) -> None:
-        self._prices = []
         self._cool = 0
         self._position = 0
 
+    def get_state(self) -> dict[str, object] | None:
+        # price history lives in the engine's lookback context (and checkpoint)
+        return {"cool": self._cool, "position": self._position}
+
+    def set_state(self, state: dict[str, object]) -> None:
+        self._cool = cast(int, state["cool"])
+        self._position = cast(int, state["position"])
+
     def on_bar(self, ts: pd.Timestamp, bar: dict[str, float]) -> list[Order]:
-        self._prices.append(bar["close"])
+        ctx = self._context()
         orders: list[Order] = []
-        if len(self._prices) < max(self.fast, self.slow):
+        if len(ctx) < self.lookback:
             return orders
-        fast_sma = sum(self._prices[-self.fast :]) / self.fast
-        slow_sma = sum(self._prices[-self.slow :]) / self.slow
+        # plain left-to-right sums, which `_sma_signs` reproduces for close calls
+        fast_sma = sum(ctx.window("close", self.fast).tolist()) / self.fast
+        slow_sma = sum(ctx.window("close", self.slow).tolist()) / self.slow
 
         if self._cool > 0:
             self._cool -= 1
             return orders
+        return self._signal(ts, fast_sma > slow_sma, fast_sma < slow_sma)
 
-        if fast_sma > slow_sma and self._position <= 0:
+    def _signal(self, ts: pd.Timestamp, above: bool, below: bool) -> list[Order]:
+        """Orders for a bar where the fast SMA is ``above``/``below`` the slow SMA."""
+        orders: list[Order] = []
+        if above and self._position <= 0:
             # go long
             if self._position < 0:
                 # close short first
                 orders.append(Order(id=f"{ts}-close", ts=ts, side="BUY", qty="CLOSE"))
             orders.append(Order(id=f"{ts}-buy", ts=ts, side="BUY", qty=f"PCT:{self.size_pct}"))
             self._position = 1
-        elif fast_sma < slow_sma and (not self.long_only) and self._position >= 0:
+        elif below and (not self.long_only) and self._position >= 0:
             # go short
             if self._position > 0:
                 orders.append(Order(id=f"{ts}-close", ts=ts, side="SELL", qty="CLOSE"))
             orders.append(Order(id=f"{ts}-sell", ts=ts, side="SELL", qty=f"PCT:{self.size_pct}"))
             self._position = -1
-        elif (fast_sma <= slow_sma and self._position == 1) or (
-            fast_sma >= slow_sma and self._position == -1
-        ):
+        elif (not above and self._position == 1) or (not below and self._position == -1):
             # exit to flat
             side: OrderSide = "SELL" if self._position == 1 else "BUY"
             orders.append(Order(id=f"{ts}-exit", ts=ts, side=side, qty="CLOSE"))
@@ -74,3 +92,80 @@ class SMACrossover(Strategy):
             if self.cooldown > 0:
                 self._cool = self.cooldown
         return orders
+
+    def _sma_signs(
+        self, prices: npt.NDArray[np.float64], first: int
+    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        """``fast > slow`` and ``fast < slow`` for windows ending at ``prices[first:]``.
+
+        Rolling means come from a cumulative sum; bars where the two means are within
+        rounding distance are re-evaluated with ``on_bar``'s exact sums, so signals
+        match the per-bar path bit for bit.
+        """
+        base = prices[0]
+        csum = np.concatenate(([0.0], np.cumsum(prices - base)))
+        end = np.arange(first, len(prices)) + 1
+        fast = base + (csum[end] - csum[end - self.fast]) / self.fast
+        slow = base + (csum[end] - csum[end - self.slow]) / self.slow
+        above, below = fast > slow, fast < slow
+        close_call = np.abs(fast - slow) <= 1e-9 * np.maximum(np.abs(slow), 1.0)
+        if close_call.any():
+            values = prices.tolist()
+            for k in np.flatnonzero(close_call):
+                e = int(end[k])
+                f = sum(values[e - self.fast : e]) / self.fast
+                sl = sum(values[e - self.slow : e]) / self.slow
+                above[k], below[k] = f > sl, f < sl
+        return above, below
+
+    def on_bars(
+        self, ts: pd.DatetimeIndex, block: Mapping[str, npt.NDArray[np.float64]]
+    ) -> list[tuple[int, list[Order]]]:
+        ctx = self._context()
+        close = np.asarray(block["close"], dtype=np.float64)
+        n = len(close)
+        window = self.lookback
+        tail = ctx.window("close", window - 1) if window > 1 else np.empty(0)
+        prices = np.concatenate((np.asarray(tail, dtype=np.float64), close))
+        # block position of the first bar with a full window (as counted by on_bar)
+        warm = max(0, window - len(ctx) - 1)
+        actions: list[tuple[int, list[Order]]] = []
+        if warm >= n:
+            return actions
+
+        first = len(tail) + warm
+        # sweeps over sizing/cooldown params reuse the signals of identical price blocks
+        signs = cached(
+            "sma_signs",
+            (self.fast, self.slow, first),
+            prices,
+            lambda: np.stack(self._sma_signs(prices, first)),
+        )
+        above, below = signs[0], signs[1]
+        # Between events nothing changes, so jump straight to the next bar that can
+        # act in the current position: an entry when flat, otherwise a cross back.
+        idx = np.arange(n - warm)
+        events = {
+            0: above | (below & (not self.long_only)),
+            1: ~above,
+            -1: ~below,
+        }
+        nxt = {
+            pos: np.minimum.accumulate(np.where(hit, idx, n)[::-1])[::-1]
+            for pos, hit in events.items()
+        }
+        k = 0
+        while k < n - warm:
+            if self._cool > 0:
+                skip = min(self._cool, n - warm - k)
+                self._cool -= skip
+                k += skip
+                continue
+            j = int(nxt[self._position][k])
+            if j >= n:
+                break
+            orders = self._signal(ts[warm + j], bool(above[j]), bool(below[j]))
+            if orders:
+                actions.append((warm + j, orders))
+            k = j + 1
+        return actions
@@ -0,0 +1,21 @@
+from .spec import STRATEGIES, RunSpec, grid_specs, run_spec
+from .queue import Job, JobQueue
+from .halving import HalvingResult, HalvingRound, SuccessiveHalving
+from .universe import UniverseBacktest, UniverseBacktestResult
+from .worker import default_worker_id, run_worker
+
+__all__ = [
+    "RunSpec",
+    "STRATEGIES",
+    "grid_specs",
+    "run_spec",
+    "Job",
+    "JobQueue",
+    "run_worker",
+    "default_worker_id",
+    "SuccessiveHalving",
+    "HalvingResult",
+    "HalvingRound",
+    "UniverseBacktest",
+    "UniverseBacktestResult",
+]
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Literal
+
+import pandas as pd
+
+from ..core.broker import Broker
+from ..core.budget import RunBudget
+from ..core.engine import BacktestEngine
+from ..core.metrics import METRIC_NAMES
+from ..core.sinks import RingBufferSink
+from ..data.feed import DataFeed
+from ..strategies.base import BaseStrategy
+
+Params = dict[str, object]
+
+# Per-process state for pool workers, set once by `_init_worker` so the bar frame is
+# pickled once per worker rather than once per evaluation
+_worker_state: dict[str, object] = {}
+
+
+@dataclass
+class HalvingRound:
+    horizon: int
+    candidates: list[Params]
+    scores: list[float]
+    kept: int
+
+    @property
+    def bars_simulated(self) -> int:
+        return self.horizon * len(self.candidates)
+
+
+@dataclass
+class HalvingResult:
+    best_params: Params
+    best_score: float
+    rounds: list[HalvingRound] = field(default_factory=list)
+    full_grid_bars: int = 0
+
+    @property
+    def bars_simulated(self) -> int:
+        return sum(r.bars_simulated for r in self.rounds)
+
+    @property
+    def savings(self) -> float:
+        """Fraction of the full grid's bars that pruning avoided simulating."""
+        return 1.0 - self.bars_simulated / self.full_grid_bars if self.full_grid_bars else 0.0
+
+    def summary(self) -> str:
+        lines = [
+            f"round {i}: {len(r.candidates)} candidates x {r.horizon} bars, kept {r.kept}"
+            for i, r in enumerate(self.rounds)
+        ]
+        lines.append(
+            f"simulated {self.bars_simulated:,} bars vs {self.full_grid_bars:,} for the full "
+            f"grid ({self.savings:.1%} saved); best {self.best_params} = {self.best_score:.6g}"
+        )
+        return "\n".join(lines)
+
+
+def _evaluate(
+    df: pd.DataFrame,
+    strategy_cls: type[BaseStrategy],
+    params: Params,
+    horizon: int,
+    broker: Broker,
+    initial_cash: float,
+    objective: str,
+    freq: Literal["D", "H", "MIN"],
+    block_size: int | None,
+    budget: RunBudget | None,
+) -> float:
+    engine = BacktestEngine(
+        feed=DataFeed(df.iloc[:horizon]),
+        broker=broker,
+        strategy=strategy_cls(**params),
+        initial_cash=initial_cash,
+        block_size=block_size,
+        budget=budget,
+        sink=RingBufferSink(maxlen=1),
+    )
+    engine.run()
+    if engine.aborted is not None:
+        return math.nan
+    return float(engine.accumulator.result(freq)[objective])
+
+
+def _init_worker(df: pd.DataFrame) -> None:
+    _worker_state["df"] = df
+
+
+def _evaluate_in_worker(
+    args: tuple[
+        type[BaseStrategy],
+        Params,
+        int,
+        Broker,
+        float,
+        str,
+        Literal["D", "H", "MIN"],
+        int | None,
+        RunBudget | None,
+    ],
+) -> float:
+    df = _worker_state["df"]
+    assert isinstance(df, pd.DataFrame)
+    return _evaluate(df, *args)
+
+
+@dataclass
+class SuccessiveHalving:
+    """Prune a parameter search by evaluating on growing prefixes of the data.
+
+    All candidates first run on a short prefix of ``df``; only the best ``1/eta`` by
+    ``objective`` (a ``compute_metrics`` key) move on to a prefix ``eta`` times longer,
+    until the survivors run on the full data. Horizons are never shorter than
+    ``min_bars``, which should cover the strategy's warm-up. Each round's runs are
+    spread over ``workers`` processes (``1`` runs serially); ``strategy_cls`` must be
+    importable in the workers and accept each candidate as keyword arguments.
+
+    Early rounds rank parameters on less data, so a candidate that only pays off
+    later in the sample can be pruned; raise ``min_bars`` or lower ``eta`` to trade
+    compute for a safer search. With a ``budget``, runs it stops score NaN and so
+    are pruned first.
+    """
+
+    strategy_cls: type[BaseStrategy]
+    df: pd.DataFrame
+    objective: str = "sharpe"
+    maximize: bool = True
+    eta: int = 3
+    min_bars: int = 250
+    freq: Literal["D", "H", "MIN"] = "D"
+    broker: Broker = field(default_factory=Broker)
+    initial_cash: float = 100_000.0
+    block_size: int | None = None
+    workers: int | None = None
+    budget: RunBudget | None = None
+
+    def __post_init__(self) -> None:
+        if self.objective not in METRIC_NAMES:
+            raise ValueError(f"objective must be one of {METRIC_NAMES}")
+        if self.eta < 2:
+            raise ValueError("eta must be >= 2")
+        if self.min_bars <= 0:
+            raise ValueError("min_bars must be > 0")
+
+    def horizons(self, n_candidates: int) -> list[int]:
+        """Bars per round: geometric up to ``len(df)``, ending once at most ``eta`` remain."""
+        n_bars = len(self.df)
+        rounds, remaining = 1, n_candidates
+        while remaining > self.eta:
+            remaining = math.ceil(remaining / self.eta)
+            rounds += 1
+        out = [
+            max(min(self.min_bars, n_bars), n_bars // self.eta ** (rounds - 1 - k))
+            for k in range(rounds)
+        ]
+        return sorted(set(out))
+
+    def _rank_key(self, score: float) -> float:
+        if math.isnan(score):
+            return math.inf
+        return -score if self.maximize else score
+
+    def run(self, candidates: Sequence[Mapping[str, object]]) -> HalvingResult:
+        if not candidates:
+            raise ValueError("no candidates to evaluate")
+        survivors = [dict(c) for c in candidates]
+        horizons = self.horizons(len(survivors))
+        n_workers = self.workers or os.cpu_count() or 1
+        result = HalvingResult({}, math.nan, full_grid_bars=len(survivors) * len(self.df))
+        pool = (
+            ProcessPoolExecutor(n_workers, initializer=_init_worker, initargs=(self.df,))
+            if n_workers > 1
+            else None
+        )
+        try:
+            for i, horizon in enumerate(horizons):
+                scores = self._evaluate_round(pool, survivors, horizon)
+                order = sorted(range(len(survivors)), key=lambda j: self._rank_key(scores[j]))
+                last = i == len(horizons) - 1
+                keep = 1 if last else max(1, math.ceil(len(survivors) / self.eta))
+                result.rounds.append(HalvingRound(horizon, survivors, scores, keep))
+                result.best_params, result.best_score = survivors[order[0]], scores[order[0]]
+                survivors = [survivors[j] for j in order[:keep]]
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return result
+
+    def run_grid(self, grid: Mapping[str, Sequence[object]]) -> HalvingResult:
+        """``run`` over every combination of ``grid`` values."""
+        keys = list(grid)
+        return self.run(
+            [dict(zip(keys, v, strict=True)) for v in itertools.product(*(grid[k] for k in keys))]
+        )
+
+    def _evaluate_round(
+        self, pool: ProcessPoolExecutor | None, candidates: list[Params], horizon: int
+    ) -> list[float]:
+        common = (
+            self.broker,
+            self.initial_cash,
+            self.objective,
+            self.freq,
+            self.block_size,
+            self.budget,
+        )
+        if pool is None or len(candidates) == 1:
+            return [
+                _evaluate(self.df, self.strategy_cls, params, horizon, *common)
+                for params in candidates
+            ]
+        jobs = [(self.strategy_cls, params, horizon, *common) for params in candidates]
+        return list(pool.map(_evaluate_in_worker, jobs))
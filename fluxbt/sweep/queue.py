@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from .spec import STRATEGIES, RunSpec, data_fingerprint
+
+if TYPE_CHECKING:
+    from ..reports.catalog import RunCatalog
+
+JobStatus = Literal["pending", "running", "done", "failed"]
+# SQLite journal modes; the value is interpolated into a PRAGMA, so only these pass
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sweep TEXT NOT NULL,
+    spec TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    worker TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+CREATE INDEX IF NOT EXISTS jobs_sweep ON jobs (sweep, status);
+"""
+
+
+@dataclass
+class Job:
+    id: int
+    sweep: str
+    spec: RunSpec
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    worker: str | None = None
+    result: dict[str, float] | None = None
+    error: str | None = None
+
+
+def _row_to_job(row: sqlite3.Row) -> Job:
+    return Job(
+        id=row["id"],
+        sweep=row["sweep"],
+        spec=RunSpec.from_json(row["spec"]),
+        status=row["status"],
+        attempts=row["attempts"],
+        max_attempts=row["max_attempts"],
+        worker=row["worker"],
+        result=json.loads(row["result"]) if row["result"] is not None else None,
+        error=row["error"],
+    )
+
+
+class JobQueue:
+    """Sweep jobs in a SQLite database shared by a coordinator and any number of workers.
+
+    A worker ``claim``s a job under a lease of ``lease_seconds`` and must ``heartbeat``
+    before it expires. Jobs whose lease runs out (crashed or hung worker) go back to
+    ``pending`` on the next claim until ``max_attempts`` is reached, then ``failed``.
+    Every state change runs in a ``BEGIN IMMEDIATE`` transaction, so two workers can
+    never claim the same job.
+
+    The default WAL journal suits workers on one host. Workers on several hosts sharing
+    the file over a network filesystem need ``journal_mode="DELETE"`` (WAL relies on
+    shared memory) and a filesystem with working POSIX locks. Every connection sets
+    its mode, so all processes sharing a file must pass the same ``journal_mode``.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0, journal_mode: str = "WAL") -> None:
+        mode = journal_mode.upper()
+        if mode not in JOURNAL_MODES:
+            raise ValueError(
+                f"journal_mode must be one of {list(JOURNAL_MODES)}, got {journal_mode!r}"
+            )
+        self.path = path
+        self.journal_mode = mode
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute(f"PRAGMA journal_mode={mode}")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._transaction() as cur:
+            # executescript() would commit on its own; keep schema setup in one transaction
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    cur.execute(statement)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> JobQueue:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        cur = self._conn.cursor()
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            yield cur
+        except BaseException:
+            cur.execute("ROLLBACK")
+            raise
+        cur.execute("COMMIT")
+
+    def submit(
+        self, specs: Iterable[RunSpec], sweep: str = "default", max_attempts: int = 3
+    ) -> list[int]:
+        """Queue ``specs`` under the ``sweep`` name; returns their job ids."""
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        now = time.time()
+        ids: list[int] = []
+        with self._transaction() as cur:
+            for spec in specs:
+                cur.execute(
+                    "INSERT INTO jobs (sweep, spec, max_attempts, updated) VALUES (?, ?, ?, ?)",
+                    (sweep, spec.to_json(), max_attempts, now),
+                )
+                ids.append(int(cur.lastrowid or 0))
+        return ids
+
+    def claim(self, worker: str, lease_seconds: float = 60.0) -> Job | None:
+        """Atomically take the oldest pending job, or None if there is none."""
+        now = time.time()
+        with self._transaction() as cur:
+            self._expire_leases(cur, now)
+            row = cur.execute(
+                "SELECT id FROM jobs WHERE status = 'pending' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            cur.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker = ?,"
+                " lease_expires = ?, error = NULL, updated = ? WHERE id = ?",
+                (worker, now + lease_seconds, now, row["id"]),
+            )
+            claimed = cur.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+        return _row_to_job(claimed)
+
+    @staticmethod
+    def _expire_leases(cur: sqlite3.Cursor, now: float) -> None:
+        cur.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts < max_attempts"
+            " THEN 'pending' ELSE 'failed' END,"
+            " error = 'lease expired (worker ' || COALESCE(worker, '?') || ')',"
+            " worker = NULL, lease_expires = NULL, updated = ?"
+            " WHERE status = 'running' AND lease_expires < ?",
+            (now, now),
+        )
+
+    def heartbeat(self, job_id: int, worker: str, lease_seconds: float = 60.0) -> bool:
+        """Extend the lease; False if ``worker`` no longer owns the job (it expired)."""
+        now = time.time()
+        with self._transaction() as cur:
+            cur.execute(
+                "UPDATE jobs SET lease_expires = ?, updated = ?"
+                " WHERE id = ? AND worker = ? AND status = 'running'",
+                (now + lease_seconds, now, job_id, worker),
+            )
+            return cur.rowcount == 1
+
+    def complete(self, job_id: int, worker: str, result: dict[str, float]) -> bool:
+        """Store ``result`` for a job ``worker`` still owns; False if the lease was lost."""
+        with self._transaction() as cur:
+            cur.execute(
+                "UPDATE jobs SET status = 'done', result = ?, lease_expires = NULL, updated = ?"
+                " WHERE id = ? AND worker = ? AND status = 'running'",
+                (json.dumps(result), time.time(), job_id, worker),
+            )
+            return cur.rowcount == 1
+
+    def fail(self, job_id: int, worker: str, error: str) -> JobStatus | None:
+        """Record an error: the job is retried until ``max_attempts``, then ``failed``.
+
+        Returns the new status, or None if ``worker`` no longer owns the job.
+        """
+        with self._transaction() as cur:
+            cur.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts < max_attempts"
+                " THEN 'pending' ELSE 'failed' END,"
+                " error = ?, worker = NULL, lease_expires = NULL, updated = ?"
+                " WHERE id = ? AND worker = ? AND status = 'running'",
+                (error, time.time(), job_id, worker),
+            )
+            if cur.rowcount != 1:
+                return None
+            row = cur.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        status: JobStatus = row["status"]
+        return status
+
+    def counts(self, sweep: str | None = None) -> dict[str, int]:
+        """Number of jobs per status (all four statuses are always present)."""
+        query = "SELECT status, COUNT(*) AS n FROM jobs"
+        args: tuple[str, ...] = ()
+        if sweep is not None:
+            query, args = query + " WHERE sweep = ?", (sweep,)
+        out = dict.fromkeys(("pending", "running", "done", "failed"), 0)
+        for row in self._conn.execute(query + " GROUP BY status", args):
+            out[row["status"]] = row["n"]
+        return out
+
+    def jobs(self, sweep: str | None = None, status: JobStatus | None = None) -> list[Job]:
+        clauses, args = [], []
+        if sweep is not None:
+            clauses.append("sweep = ?")
+            args.append(sweep)
+        if status is not None:
+            clauses.append("status = ?")
+            args.append(status)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(f"SELECT * FROM jobs{where} ORDER BY id", args).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def is_finished(self, sweep: str | None = None) -> bool:
+        counts = self.counts(sweep)
+        return counts["pending"] == 0 and counts["running"] == 0
+
+    def register_results(self, catalog: RunCatalog, sweep: str | None = None) -> int:
+        """Add finished jobs to a ``RunCatalog`` in one batch; returns the number added.
+
+        Jobs are keyed by queue path and job id, so repeated calls only add new results.
+        """
+        from ..reports.catalog import RunRecord
+
+        fingerprints: dict[str, str] = {}
+        records = []
+        base = os.path.abspath(self.path)
+        for job in self.jobs(sweep, status="done"):
+            data_key = json.dumps(job.spec.data, sort_keys=True)
+            if data_key not in fingerprints:
+                fingerprints[data_key] = data_fingerprint(job.spec)
+            records.append(
+                RunRecord(
+                    # same name as CLI runs register (e.g. "sma_crossover", not "sma")
+                    strategy=STRATEGIES[job.spec.strategy](**job.spec.params).name,
+                    params=dict(job.spec.params),
+                    metrics=job.result or {},
+                    data_fingerprint=fingerprints[data_key],
+                    sweep=job.sweep,
+                    key=f"{base}#{job.id}",
+                )
+            )
+        return len(catalog.register_many(records))
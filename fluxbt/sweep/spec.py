@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import itertools
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import Any, Literal
+
+import pandas as pd
+
+from ..core.broker import Broker
+from ..core.budget import RunBudget
+from ..core.engine import BacktestEngine
+from ..core.sinks import RingBufferSink
+from ..data.feed import DataFeed
+from ..strategies.base import BaseStrategy
+from ..strategies.mean_reversion import MeanReversion
+from ..strategies.sma_crossover import SMACrossover
+
+# Strategies a worker can build from a job; keys match the CLI `--strategy` names
+STRATEGIES: dict[str, type[BaseStrategy]] = {"sma": SMACrossover, "meanrev": MeanReversion}
+
+
+@dataclass
+class RunSpec:
+    """One backtest of a sweep, serializable to JSON so any worker process can run it.
+
+    ``data`` names the input: ``{"source": "csv", "path": ...}`` (the path must be
+    readable by every worker, e.g. on a shared filesystem) or
+    ``{"source": "synthetic", **SyntheticLoader kwargs}``. ``budget`` holds
+    ``RunBudget`` fields for stopping hopeless runs early (see ``RunBudget.from_dict``).
+    """
+
+    strategy: str
+    params: dict[str, object]
+    data: dict[str, object]
+    cash: float = 100_000.0
+    slippage_bps: float = 1.0
+    commission_bps: float = 0.0
+    freq: Literal["D", "H", "MIN"] = "D"
+    block_size: int | None = None
+    budget: dict[str, float | int] | None = None
+    tags: dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, text: str) -> RunSpec:
+        return cls(**json.loads(text))
+
+
+def grid_specs(
+    strategy: str,
+    grid: Mapping[str, Sequence[object]],
+    data: dict[str, object],
+    **common: object,
+) -> list[RunSpec]:
+    """Expand a parameter grid into one ``RunSpec`` per combination."""
+    keys = list(grid)
+    return [
+        RunSpec(strategy, dict(zip(keys, values, strict=True)), data, **common)  # type: ignore[arg-type]
+        for values in itertools.product(*(grid[k] for k in keys))
+    ]
+
+
+def load_data(data: Mapping[str, object]) -> pd.DataFrame:
+    """Load the input described by a ``RunSpec.data`` mapping (uncached)."""
+    from ..data.loader import CSVLoader
+    from ..data.synthetic import SyntheticLoader
+
+    kwargs: dict[str, Any] = dict(data)
+    source = kwargs.pop("source", None)
+    if source == "csv":
+        return CSVLoader(**kwargs).load()
+    if source == "synthetic":
+        return SyntheticLoader(**kwargs).load()
+    raise ValueError(f"Unknown data source {source!r}; expected 'csv' or 'synthetic'")
+
+
+@lru_cache(maxsize=8)
+def _load_data(key: str) -> pd.DataFrame:
+    # keyed by the JSON of `RunSpec.data`, so consecutive jobs of a sweep load once
+    return load_data(json.loads(key))
+
+
+def data_fingerprint(spec: RunSpec) -> str:
+    """``frame_fingerprint`` of the input named by ``spec.data``."""
+    from ..reports.catalog import frame_fingerprint
+
+    return frame_fingerprint(_load_data(json.dumps(spec.data, sort_keys=True)))
+
+
+def run_spec(spec: RunSpec) -> dict[str, float]:
+    """Run the backtest described by ``spec`` and return its metrics.
+
+    With a ``budget``, the metrics cover the bars run and two entries are added:
+    ``aborted`` (1.0 if the budget stopped the run, else 0.0) and ``bars``.
+    """
+    try:
+        strategy_cls = STRATEGIES[spec.strategy]
+    except KeyError:
+        raise ValueError(
+            f"Unknown strategy {spec.strategy!r}; expected one of {sorted(STRATEGIES)}"
+        ) from None
+    df = _load_data(json.dumps(spec.data, sort_keys=True))
+    engine = BacktestEngine(
+        feed=DataFeed(df),
+        broker=Broker(slippage_bps=spec.slippage_bps, commission_bps=spec.commission_bps),
+        strategy=strategy_cls(**spec.params),
+        initial_cash=spec.cash,
+        block_size=spec.block_size,
+        budget=RunBudget.from_dict(spec.budget) if spec.budget is not None else None,
+        # only the metrics are reported back, so keep no more history than needed
+        sink=RingBufferSink(maxlen=1),
+    )
+    engine.run()
+    result = engine.accumulator.result(spec.freq)
+    if spec.budget is not None:
+        result["aborted"] = float(engine.aborted is not None)
+        result["bars"] = float(engine.n_bars)
+    return result
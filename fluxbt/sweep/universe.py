@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections.abc import Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ..core.broker import Broker
+from ..core.engine import BacktestEngine
+from ..core.metrics import compute_metrics, compute_metrics_batch
+from ..data.feed import REQUIRED_COLS, DataFeed
+from ..strategies.base import BaseStrategy
+
+# symbol -> (first row, end row, index tz) of its bars in the shared block
+Layout = dict[str, tuple[int, int, str | None]]
+
+# Per-process state for pool workers, set once by `_init_worker`: the shared block
+# of every symbol's bars, so tasks only carry the symbol and run settings
+_worker_state: dict[str, object] = {}
+
+
+@dataclass
+class _SymbolRun:
+    equity: npt.NDArray[np.float64]
+    fills: int
+
+
+def _run_symbol(
+    df: pd.DataFrame,
+    strategy_cls: type[BaseStrategy],
+    params: dict[str, object],
+    broker: Broker,
+    cash: float,
+    block_size: int | None,
+) -> _SymbolRun:
+    engine = BacktestEngine(
+        feed=DataFeed(df),
+        broker=broker,
+        strategy=strategy_cls(**params),
+        initial_cash=cash,
+        block_size=block_size,
+    )
+    hist = engine.run()
+    return _SymbolRun(hist["equity"].to_numpy(dtype=np.float64), len(engine.fills))
+
+
+def _pack(frames: Mapping[str, pd.DataFrame]) -> tuple[SharedMemory, int, Layout]:
+    """Copy every symbol's OHLCV and timestamps into one shared-memory block."""
+    n_rows = sum(len(df) for df in frames.values())
+    shm = SharedMemory(create=True, size=max(n_rows * (len(REQUIRED_COLS) + 1) * 8, 1))
+    bars, ts = _views(shm, n_rows)
+    layout: Layout = {}
+    row = 0
+    for symbol, df in frames.items():
+        index = pd.DatetimeIndex(df.index)
+        end = row + len(df)
+        bars[row:end] = df[REQUIRED_COLS].to_numpy(dtype=np.float64)
+        ts[row:end] = index.as_unit("ns").asi8  # UTC nanoseconds for tz-aware indexes
+        layout[symbol] = (row, end, str(index.tz) if index.tz is not None else None)
+        row = end
+    del bars, ts  # the block cannot be closed while views exist
+    return shm, n_rows, layout
+
+
+def _views(shm: SharedMemory, n_rows: int) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+    width = len(REQUIRED_COLS)
+    bars: npt.NDArray[np.float64] = np.ndarray((n_rows, width), dtype=np.float64, buffer=shm.buf)
+    ts: npt.NDArray[np.int64] = np.ndarray(
+        (n_rows,), dtype=np.int64, buffer=shm.buf, offset=n_rows * width * 8
+    )
+    return bars, ts
+
+
+def _init_worker(name: str, n_rows: int, layout: Layout) -> None:
+    shm = SharedMemory(name=name)
+    bars, ts = _views(shm, n_rows)
+    _worker_state.update(shm=shm, bars=bars, ts=ts, layout=layout)
+
+
+def _run_in_worker(
+    symbol: str,
+    strategy_cls: type[BaseStrategy],
+    params: dict[str, object],
+    broker: Broker,
+    cash: float,
+    block_size: int | None,
+) -> _SymbolRun:
+    bars, ts, layout = _worker_state["bars"], _worker_state["ts"], _worker_state["layout"]
+    assert isinstance(bars, np.ndarray) and isinstance(ts, np.ndarray)
+    assert isinstance(layout, dict)
+    lo, hi, tz = layout[symbol]
+    index = pd.DatetimeIndex(ts[lo:hi].view("M8[ns]"))
+    if tz is not None:
+        index = index.tz_localize("UTC").tz_convert(tz)
+    # a view of the shared block: no copy of the bars per task
+    df = pd.DataFrame(bars[lo:hi], index=index, columns=REQUIRED_COLS, copy=False)
+    return _run_symbol(df, strategy_cls, params, broker, cash, block_size)
+
+
+@dataclass
+class UniverseBacktestResult:
+    """Per-symbol equity curves and metrics plus their combined portfolio.
+
+    ``equity`` has one column per symbol on the union of all timestamps (NaN outside
+    a symbol's bars); ``metrics`` has one row per symbol with its ``weight`` and
+    number of ``fills``; ``combined`` is the sum of the symbols' sleeves.
+    """
+
+    equity: pd.DataFrame
+    combined: pd.Series
+    metrics: pd.DataFrame
+    combined_metrics: dict[str, float]
+    weights: dict[str, float]
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def write(self, out_dir: str) -> None:
+        """Write ``equity.csv`` (combined first), ``metrics.csv`` and ``universe.json``."""
+        os.makedirs(out_dir, exist_ok=True)
+        curves = pd.concat([self.combined.rename("combined"), self.equity], axis=1)
+        curves.to_csv(os.path.join(out_dir, "equity.csv"), index_label="timestamp")
+        self.metrics.to_csv(os.path.join(out_dir, "metrics.csv"), index_label="symbol")
+        summary = {
+            "combined": self.combined_metrics,
+            "weights": self.weights,
+            "errors": self.errors,
+        }
+        with open(os.path.join(out_dir, "universe.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+@dataclass
+class UniverseBacktest:
+    """Run one strategy over many symbols, an independent ``BacktestEngine`` each.
+
+    Runs are spread over ``workers`` processes (default: CPU count; ``1`` runs
+    serially). The bars of all symbols are copied once into shared memory, which every
+    worker maps, so no frame is pickled per run. Each symbol trades its own sleeve of
+    ``initial_cash * weight``; weights (default: equal) are normalized to sum to 1 and
+    only weighted symbols run. Sleeves are not rebalanced: they hold cash before a
+    symbol's first bar and keep their last value after its last, and ``combined``
+    is their sum. A symbol whose run raises is reported in ``errors`` and its sleeve
+    stays in cash. ``strategy_cls`` must be importable in the workers and accept
+    ``params`` as keyword arguments.
+    """
+
+    strategy_cls: type[BaseStrategy]
+    frames: Mapping[str, pd.DataFrame]
+    params: dict[str, object] = field(default_factory=dict)
+    weights: Mapping[str, float] | None = None
+    broker: Broker = field(default_factory=Broker)
+    initial_cash: float = 100_000.0
+    block_size: int | None = None
+    freq: Literal["D", "H", "MIN"] = "D"
+    workers: int | None = None
+
+    def __post_init__(self) -> None:
+        if not self.frames:
+            raise ValueError("frames is empty")
+        if self.weights is not None:
+            unknown = sorted(set(self.weights) - set(self.frames))
+            if unknown:
+                raise ValueError(f"weights for symbols without data: {unknown}")
+            if any(not w > 0 for w in self.weights.values()):
+                raise ValueError("weights must be > 0")
+
+    def normalized_weights(self) -> dict[str, float]:
+        raw = self.weights if self.weights is not None else dict.fromkeys(self.frames, 1.0)
+        total = math.fsum(raw.values())
+        return {s: w / total for s, w in raw.items()}
+
+    def run(self) -> UniverseBacktestResult:
+        weights = self.normalized_weights()
+        runs, errors = self._run_all(weights)
+        if not runs:
+            details = "; ".join(f"{s}: {e}" for s, e in errors.items())
+            raise RuntimeError(f"Every symbol failed: {details}")
+
+        kept = {s: w for s, w in weights.items() if s in runs}
+        equity = pd.concat(
+            {s: pd.Series(runs[s].equity, index=self.frames[s].index) for s in kept}, axis=1
+        )
+        cash = pd.Series({s: self.initial_cash * w for s, w in kept.items()})
+        idle = self.initial_cash * math.fsum(weights[s] for s in errors)
+        combined = (equity.ffill().fillna(cash).sum(axis=1) + idle).rename("equity")
+
+        metrics = compute_metrics_batch(equity, self.freq)
+        metrics["weight"] = pd.Series(kept)
+        metrics["fills"] = pd.Series({s: runs[s].fills for s in kept})
+        return UniverseBacktestResult(
+            equity=equity,
+            combined=combined,
+            metrics=metrics,
+            combined_metrics=compute_metrics(combined, self.freq),
+            weights=weights,
+            errors=errors,
+        )
+
+    def _run_all(self, weights: dict[str, float]) -> tuple[dict[str, _SymbolRun], dict[str, str]]:
+        common = (self.strategy_cls, self.params, self.broker)
+        n_workers = min(self.workers or os.cpu_count() or 1, len(weights))
+        runs: dict[str, _SymbolRun] = {}
+        errors: dict[str, str] = {}
+        if n_workers <= 1:
+            for s, w in weights.items():
+                try:
+                    cash = self.initial_cash * w
+                    runs[s] = _run_symbol(self.frames[s], *common, cash, self.block_size)
+                except Exception as exc:  # noqa: BLE001 - reported per symbol
+                    errors[s] = f"{type(exc).__name__}: {exc}"
+            return runs, errors
+
+        valid: dict[str, pd.DataFrame] = {}
+        for s in weights:
+            try:  # checked here, as in the serial path, so packing only sees valid frames
+                valid[s] = DataFeed(self.frames[s]).df
+            except (TypeError, ValueError) as exc:
+                errors[s] = f"{type(exc).__name__}: {exc}"
+        if not valid:
+            return runs, errors
+        shm, n_rows, layout = _pack(valid)
+        try:
+            with ProcessPoolExecutor(
+                n_workers, initializer=_init_worker, initargs=(shm.name, n_rows, layout)
+            ) as pool:
+                futures: dict[str, Future[_SymbolRun]] = {
+                    s: pool.submit(
+                        _run_in_worker, s, *common, self.initial_cash * w, self.block_size
+                    )
+                    for s, w in weights.items()
+                    if s in valid
+                }
+                for s, future in futures.items():
+                    try:
+                        runs[s] = future.result()
+                    except Exception as exc:  # noqa: BLE001 - reported per symbol
+                        errors[s] = f"{type(exc).__name__}: {exc}"
+        finally:
+            shm.close()
+            shm.unlink()
+        return runs, errors
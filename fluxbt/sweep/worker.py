@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+import traceback
+from collections.abc import Callable
+
+from .queue import Job, JobQueue
+from .spec import RunSpec, run_spec
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class _Heartbeat(threading.Thread):
+    """Renew a job's lease every ``lease_seconds / 3`` while it runs.
+
+    Uses its own connection: sqlite3 connections must not be shared across threads.
+    """
+
+    def __init__(
+        self, path: str, job: Job, worker: str, lease_seconds: float, journal_mode: str
+    ) -> None:
+        super().__init__(daemon=True)
+        self.path, self.job, self.worker, self.lease_seconds = path, job, worker, lease_seconds
+        self.journal_mode = journal_mode
+        self.lost = False
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        with JobQueue(self.path, journal_mode=self.journal_mode) as queue:
+            while not self._done.wait(self.lease_seconds / 3):
+                if not queue.heartbeat(self.job.id, self.worker, self.lease_seconds):
+                    self.lost = True
+                    return
+
+    def stop(self) -> None:
+        self._done.set()
+        self.join()
+
+
+def run_worker(
+    path: str,
+    worker_id: str | None = None,
+    lease_seconds: float = 60.0,
+    poll_interval: float = 1.0,
+    max_jobs: int | None = None,
+    exit_when_idle: bool = True,
+    execute: Callable[[RunSpec], dict[str, float]] = run_spec,
+    journal_mode: str = "WAL",
+) -> int:
+    """Claim and run jobs from the queue at ``path`` until it is drained.
+
+    With ``exit_when_idle=False`` the worker keeps polling every ``poll_interval``
+    seconds for new jobs instead of returning. A job that raises is recorded with its
+    traceback and retried (by any worker) up to its ``max_attempts``. Returns the
+    number of jobs this worker completed. ``journal_mode`` is passed to ``JobQueue``
+    and must match the other processes using the queue.
+    """
+    worker = worker_id or default_worker_id()
+    done = 0
+    with JobQueue(path, journal_mode=journal_mode) as queue:
+        while max_jobs is None or done < max_jobs:
+            job = queue.claim(worker, lease_seconds)
+            if job is None:
+                if exit_when_idle and queue.is_finished():
+                    break
+                # other workers' jobs may still expire and come back: keep polling
+                time.sleep(poll_interval)
+                continue
+            heartbeat = _Heartbeat(path, job, worker, lease_seconds, queue.journal_mode)
+            heartbeat.start()
+            try:
+                result = execute(job.spec)
+            except Exception:
+                heartbeat.stop()
+                queue.fail(job.id, worker, traceback.format_exc(limit=5))
+                continue
+            heartbeat.stop()
+            if queue.complete(job.id, worker, result):
+                done += 1
+    return done
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.metrics import compute_metrics
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.reports.artifacts import get_artifact_writer, read_artifact
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+
+def _run() -> BacktestEngine:
+    df = SyntheticLoader(n_bars=300, freq="D", tz="America/New_York", seed=2).load()
+    engine = BacktestEngine(
+        feed=DataFeed(df), broker=Broker(), strategy=SMACrossover(fast=5, slow=20)
+    )
+    engine.run()
+    return engine
+
+
+@pytest.mark.parametrize("fmt", ["npy", "npz", "parquet"])
+def test_artifact_roundtrip(tmp_path: Path, fmt: str) -> None:
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    engine = _run()
+    hist = pd.DataFrame(engine.history).set_index("ts")
+    metrics = compute_metrics(hist["equity"], freq="D")
+    get_artifact_writer(fmt).write(str(tmp_path), hist, engine.fills, metrics)
+
+    art = read_artifact(str(tmp_path))
+    pd.testing.assert_frame_equal(art.history, hist, check_names=False, check_freq=False)
+    assert art.metrics == pytest.approx(metrics, nan_ok=True)
+    fills = art.fills
+    assert len(fills) == len(engine.fills) > 0
+    assert fills["order_id"].tolist() == [f.order_id for f in engine.fills]
+    assert fills["ts"].iloc[0] == engine.fills[0].ts
+    equity = art.columns("history", ["equity"])["equity"]
+    assert np.allclose(equity, hist["equity"].to_numpy())
+    if fmt == "npy":
+        assert isinstance(equity, np.memmap)
+
+
+def test_unknown_artifact_format_rejected() -> None:
+    with pytest.raises(ValueError):
+        get_artifact_writer("xlsx")
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import tempfile
+
+from benchmarks.cases import CASES
+from benchmarks.runner import compare
+
+
+def test_cases_run_on_small_input() -> None:
+    with tempfile.TemporaryDirectory() as workdir:
+        for setup in CASES.values():
+            assert setup(100, workdir)() is not None
+
+
+def test_compare_flags_regressions_beyond_threshold() -> None:
+    base = [
+        {
+            "case": "engine_sma",
+            "size": 1000,
+            "status": "ok",
+            "bars_per_sec": 1000.0,
+            "peak_rss_bytes": 100,
+            "alloc_peak_bytes": 10,
+        }
+    ]
+    same = [dict(base[0], bars_per_sec=950.0)]
+    slower = [dict(base[0], bars_per_sec=500.0)]
+    fatter = [dict(base[0], peak_rss_bytes=200)]
+    assert compare(same, base, threshold=0.1) == []
+    assert len(compare(slower, base, threshold=0.1)) == 1
+    assert "peak_rss_bytes" in compare(fatter, base, threshold=0.1)[0]
+    assert compare([dict(base[0], status="timeout")], base, threshold=0.1)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine, implements_on_bars
+from fluxbt.core.metrics import MetricsAccumulator
+from fluxbt.core.sinks import RingBufferSink
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.strategies.base import BaseStrategy
+from fluxbt.strategies.mean_reversion import MeanReversion
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+DF = SyntheticLoader(n_bars=3_000, freq="h", tz="UTC", seed=5).load()
+
+
+def _run(strategy: BaseStrategy, block_size: int | None) -> tuple[BacktestEngine, pd.DataFrame]:
+    engine = BacktestEngine(
+        feed=DataFeed(DF),
+        broker=Broker(commission_bps=2.0),
+        strategy=strategy,
+        block_size=block_size,
+    )
+    return engine, engine.run()
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 256, 10_000])
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"fast": 5, "slow": 20},
+        {"fast": 10, "slow": 30, "long_only": False, "cooldown": 3},
+        {"fast": 30, "slow": 8, "long_only": False},
+    ],
+)
+def test_on_bars_matches_on_bar(block_size: int, params: dict[str, Any]) -> None:
+    per_bar, expected = _run(SMACrossover(**params), None)
+    blocked, hist = _run(SMACrossover(**params), block_size)
+    pd.testing.assert_frame_equal(hist, expected)
+    assert blocked.fills == per_bar.fills and len(per_bar.fills) > 4
+    assert blocked.strategy.get_state() == per_bar.strategy.get_state()
+    assert blocked.accumulator.result("H") == pytest.approx(
+        per_bar.accumulator.result("H"), nan_ok=True
+    )
+
+
+def test_fallback_and_sink() -> None:
+    assert implements_on_bars(SMACrossover()) and not implements_on_bars(MeanReversion())
+    _, expected = _run(MeanReversion(window=15), None)
+    _, fallback = _run(MeanReversion(window=15), 100)
+    pd.testing.assert_frame_equal(fallback, expected)
+
+    _, full = _run(SMACrossover(5, 20), None)
+    sink = RingBufferSink(maxlen=500)
+    engine = BacktestEngine(
+        feed=DataFeed(DF), broker=Broker(commission_bps=2.0), strategy=SMACrossover(5, 20)
+    )
+    engine.sink, engine.block_size = sink, 128
+    tail = engine.run()
+    pd.testing.assert_frame_equal(tail, full.tail(500), check_names=False, check_freq=False)
+
+
+def test_accumulator_update_many_matches_update() -> None:
+    equity = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.01, 1_000)))
+    one, many = MetricsAccumulator(), MetricsAccumulator()
+    dd_one = np.array([one.update(v) for v in equity])
+    dd_many = np.concatenate([many.update_many(chunk) for chunk in np.array_split(equity, 7)])
+    np.testing.assert_array_equal(dd_many, dd_one)
+    assert many.result("D") == pytest.approx(one.result("D"), rel=1e-9)
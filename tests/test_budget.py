@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.budget import RunBudget
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.sinks import RingBufferSink
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.strategies.sma_crossover import SMACrossover
+from fluxbt.sweep import RunSpec, run_spec
+
+DF = SyntheticLoader(n_bars=3_000, freq="D", tz="UTC", seed=11).load()
+MODES: list[dict[str, object]] = [
+    {},
+    {"block_size": 256},
+    {"sink": RingBufferSink(maxlen=10_000), "chunk_size": 100},
+]
+
+
+def _engine(
+    budget: RunBudget | None, mode: dict[str, object], fast: int = 10, slow: int = 50
+) -> BacktestEngine:
+    return BacktestEngine(
+        feed=DataFeed(DF),
+        broker=Broker(),
+        strategy=SMACrossover(fast, slow, 1.0),
+        budget=budget,
+        **mode,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_surviving_runs_are_unchanged(mode: dict[str, object]) -> None:
+    full = _engine(None, mode).run()
+    budget = RunBudget(max_drawdown=0.99, min_equity=1.0, no_trade_bars=500, max_seconds=60)
+    engine = _engine(budget, mode)
+    out = engine.run()
+    assert engine.aborted is None and "aborted" not in out.attrs
+    pd.testing.assert_frame_equal(out, full)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_drawdown_stops_at_first_breach(mode: dict[str, object]) -> None:
+    full = _engine(None, {}).run()
+    stop = int(np.flatnonzero(full["drawdown"].to_numpy() <= -0.05)[0])
+
+    engine = _engine(RunBudget(max_drawdown=0.05), mode)
+    out = engine.run()
+    assert engine.aborted == "max_drawdown" and out.attrs["aborted"] == "max_drawdown"
+    assert len(out) == stop + 1 and engine.n_bars == stop + 1
+    assert engine.last_ts == full.index[stop]
+    np.testing.assert_allclose(out["equity"], full["equity"].iloc[: stop + 1], rtol=1e-12)
+    assert engine.accumulator.max_dd <= -0.05
+    with pytest.raises(ValueError, match="aborted"):
+        engine.checkpoint()
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_no_trade_and_bar_limits(mode: dict[str, object]) -> None:
+    idle = _engine(RunBudget(no_trade_bars=100), mode, fast=5, slow=2_000)
+    assert len(idle.run()) == 100 and idle.aborted == "no_trades"
+
+    capped = _engine(RunBudget(max_bars=700, no_trade_bars=100), mode)
+    assert len(capped.run()) == 700 and capped.aborted == "max_bars"
+
+    poor = _engine(RunBudget(min_equity=99_000.0), mode)
+    out = poor.run()
+    assert poor.aborted == "min_equity" and len(out) > 1
+    assert out["equity"].iloc[-1] <= 99_000.0 < out["equity"].iloc[:-1].min()
+
+
+def test_budget_validation_and_sweep_flag() -> None:
+    with pytest.raises(ValueError):
+        RunBudget(max_drawdown=1.5)
+    assert RunBudget.from_dict({"max_bars": 150.0, "max_drawdown": 0.5}) == RunBudget(
+        max_drawdown=0.5, max_bars=150
+    )
+    with pytest.raises(ValueError, match="Unknown budget fields"):
+        RunBudget.from_dict({"max_dd": 0.5})
+    with pytest.raises(ValueError, match="whole number"):
+        RunBudget.from_dict({"no_trade_bars": 2.5})
+    data: dict[str, object] = {"source": "synthetic", "n_bars": 400, "freq": "D", "seed": 2}
+    spec = RunSpec("sma", {"fast": 5, "slow": 20}, data, budget={"max_bars": 150})
+    result = run_spec(RunSpec.from_json(spec.to_json()))
+    assert result["aborted"] == 1.0 and result["bars"] == 150.0
+    assert "aborted" not in run_spec(RunSpec("sma", {"fast": 5, "slow": 20}, data))
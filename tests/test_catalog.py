@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from fluxbt.cli import app
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.reports.catalog import (
+    QueryError,
+    RunCatalog,
+    RunRecord,
+    frame_fingerprint,
+    parse_where,
+)
+from fluxbt.sweep import JobQueue, grid_specs, run_worker
+
+
+def _records(n: int) -> list[RunRecord]:
+    rng = np.random.default_rng(0)
+    return [
+        RunRecord(
+            strategy="sma_crossover",
+            params={"fast": i % 50, "slow": 100},
+            metrics={
+                "sharpe": float(rng.normal(0.5, 1.0)),
+                "max_dd": float(-rng.uniform(0, 0.5)),
+                "calmar": float(rng.normal()) if i % 10 else float("nan"),
+            },
+            data_fingerprint="abc",
+            run_dir=f"runs/{i}",
+        )
+        for i in range(n)
+    ]
+
+
+def test_query_filters_and_ranks(tmp_path: Path) -> None:
+    records = _records(50_000)
+    with RunCatalog(str(tmp_path / "catalog.db")) as catalog:
+        assert len(catalog.register_many(records)) == 50_000
+        top = catalog.query("sharpe>1.5 and max_dd>-0.2", order_by="calmar", limit=5)
+
+        matching = [
+            r
+            for r in records
+            if r.metrics["sharpe"] > 1.5
+            and r.metrics["max_dd"] > -0.2
+            and not np.isnan(r.metrics["calmar"])
+        ]
+        matching.sort(key=lambda r: -r.metrics["calmar"])
+        assert [r.run_dir for r in top] == [r.run_dir for r in matching[:5]]
+        plan = catalog.explain("sharpe>1.5 and max_dd>-0.2", order_by="calmar", limit=5)
+        assert any(step.startswith("SEARCH runs USING INDEX runs_") for step in plan), plan
+        assert not any(step.startswith("SCAN runs") for step in plan), plan
+
+        by_param = catalog.query("param.fast = 7 and not sharpe < 0", limit=None)
+        assert by_param
+        assert all(r.params["fast"] == 7 and r.metrics["sharpe"] >= 0 for r in by_param)
+        nan_last = catalog.query("param.fast = 10", order_by="calmar", ascending=True, limit=None)
+        assert np.isnan(nan_last[-1].metrics["calmar"])
+
+
+def test_where_parser_rejects_unsafe_input() -> None:
+    sql, args = parse_where("(sharpe >= 1 or strategy = 'sma_crossover') and not calmar < -2")
+    assert sql == "((sharpe >= ? OR strategy = ?) AND NOT calmar < ?)"
+    assert args == [1.0, "sma_crossover", -2.0]
+    for bad in ["sharpe>1; DROP TABLE runs", "password = 1", "sharpe >", "sharpe > calmar"]:
+        with pytest.raises(QueryError):
+            parse_where(bad)
+
+
+def test_sweep_results_are_imported_once(tmp_path: Path) -> None:
+    data: dict[str, object] = {"source": "synthetic", "n_bars": 300, "freq": "D", "seed": 2}
+    queue_path, catalog_path = str(tmp_path / "q.db"), str(tmp_path / "catalog.db")
+    with JobQueue(queue_path) as queue:
+        queue.submit(grid_specs("sma", {"fast": [3, 5], "slow": [20, 30]}, data), sweep="s1")
+    run_worker(queue_path, poll_interval=0.01)
+
+    runner = CliRunner()
+    args = ["runs", "import-sweep", "--queue", queue_path, "--catalog", catalog_path]
+    assert "Registered 4 runs" in runner.invoke(app, args).output
+    assert "Registered 0 runs" in runner.invoke(app, args).output
+
+    result = runner.invoke(
+        app, ["runs", "query", "--catalog", catalog_path, "--where", "param.slow=30"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "2 runs" in result.output and "sma_crossover" in result.output
+
+    fp = frame_fingerprint(SyntheticLoader(n_bars=300, freq="D", seed=2).load())
+    with RunCatalog(catalog_path) as catalog:
+        assert {r.data_fingerprint for r in catalog.query(limit=None)} == {fp}
+
+    bad = runner.invoke(app, ["runs", "query", "--catalog", catalog_path, "--where", "x>1"])
+    assert bad.exit_code != 0
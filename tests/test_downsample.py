@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fluxbt.reports.downsample import downsample
+from fluxbt.reports.plotting import _pyplot, plot_drawdown, plot_equity_curve
+
+
+def _series(n: int) -> pd.Series:
+    idx = pd.date_range("2020-01-01", periods=n, freq="min", tz="UTC")
+    rng = np.random.default_rng(0)
+    return pd.Series(100 + np.cumsum(rng.normal(size=n)), index=idx)
+
+
+def test_downsample_keeps_endpoints_and_extremes() -> None:
+    s = _series(50_000)
+    for method in ("lttb", "minmax"):
+        d = downsample(s, max_points=500, method=method)
+        assert len(d) <= 502
+        assert d.index.is_monotonic_increasing
+        assert d.index[0] == s.index[0] and d.index[-1] == s.index[-1]
+    mm = downsample(s, max_points=500, method="minmax")
+    assert mm.min() == s.min() and mm.max() == s.max()
+    small = _series(100)
+    assert downsample(small, max_points=500) is small
+
+
+def test_saved_plots_are_closed(tmp_path: Path) -> None:
+    plt = _pyplot()
+    before = len(plt.get_fignums())
+    s = _series(20_000)
+    for i in range(3):
+        plot_equity_curve(s, savepath=str(tmp_path / f"eq{i}.png"))
+        plot_drawdown(s / s.cummax() - 1.0, savepath=str(tmp_path / f"dd{i}.png"))
+    assert len(plt.get_fignums()) == before
+    assert (tmp_path / "eq2.png").exists()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.orders import Order
+from fluxbt.core.sinks import NpyFileSink
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.dtypes import COMPACT_POLICY, FLOAT64_POLICY, DtypePolicy
+from fluxbt.reports.artifacts import read_artifact
+from fluxbt.strategies.base import BaseStrategy
+from fluxbt.strategies.mean_reversion import MeanReversion
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+DF = SyntheticLoader(n_bars=5_000, freq="h", seed=8).load()
+
+
+def _run(
+    policy: DtypePolicy, strategy: BaseStrategy, block_size: int | None = None
+) -> tuple[BacktestEngine, pd.DataFrame]:
+    engine = BacktestEngine(
+        feed=DataFeed(DF, dtypes=policy),
+        broker=Broker(commission_bps=1.0),
+        strategy=strategy,
+        block_size=block_size,
+    )
+    return engine, engine.run()
+
+
+def test_compact_storage_dtypes() -> None:
+    compact = SyntheticLoader(n_bars=5_000, freq="h", seed=8, dtypes=COMPACT_POLICY).load()
+    assert set(compact.dtypes) == {np.dtype(np.float32)}
+    assert compact.memory_usage(index=False).sum() * 2 == DF.memory_usage(index=False).sum()
+    pd.testing.assert_frame_equal(DataFeed(DF, dtypes=COMPACT_POLICY).df, compact)
+    assert DataFeed(compact).df.dtypes.eq(np.float64).all()  # default policy widens
+    assert DtypePolicy.from_name("compact") is COMPACT_POLICY
+    with pytest.raises(ValueError, match="Unknown dtype policy"):
+        DtypePolicy.from_name("float16")
+
+
+@pytest.mark.parametrize("block_size", [None, 256])
+@pytest.mark.parametrize(
+    "make", [lambda: SMACrossover(10, 40, long_only=False), lambda: MeanReversion(window=30)]
+)
+def test_metrics_agree_across_policies(
+    block_size: int | None, make: Callable[[], BaseStrategy]
+) -> None:
+    wide, _ = _run(FLOAT64_POLICY, make(), block_size)
+    compact, hist = _run(COMPACT_POLICY, make(), block_size)
+    assert hist.dtypes.to_dict() == {
+        "price": np.float32,
+        "position": np.int32,
+        "cash": np.float64,
+        "equity": np.float64,
+        "drawdown": np.float64,
+    }
+    assert len(compact.fills) == len(wide.fills) > 10
+    assert [f.qty for f in compact.fills] == [f.qty for f in wide.fills]
+    wide_m, compact_m = wide.accumulator.result("H"), compact.accumulator.result("H")
+    assert compact_m == pytest.approx(wide_m, rel=1e-4, abs=1e-9, nan_ok=True)
+
+
+def test_compact_sink_and_fractional_positions(tmp_path: Path) -> None:
+    engine = BacktestEngine(
+        feed=DataFeed(DF),
+        broker=Broker(),
+        strategy=SMACrossover(10, 40),
+        sink=NpyFileSink(str(tmp_path / "run")),
+        dtypes=COMPACT_POLICY,
+    )
+    engine.run()
+    art = read_artifact(str(tmp_path / "run"))
+    assert art.columns("history", ["position"])["position"].dtype == np.int32
+    assert art.columns("fills", ["qty", "commission"])["qty"].dtype == np.int32
+    assert art.history["price"].dtype == np.float32
+
+    class HalfShare(BaseStrategy):
+        name = "half"
+        params: dict[str, object] = {}
+
+        def reset(self) -> None:
+            pass
+
+        def on_bar(self, ts: pd.Timestamp, bar: dict[str, float]) -> list[Order]:
+            return [Order(f"{ts}", ts, "BUY", 0.5)]
+
+    engine = BacktestEngine(
+        feed=DataFeed(DF.iloc[:10], dtypes=COMPACT_POLICY), broker=Broker(), strategy=HalfShare()
+    )
+    with pytest.raises(ValueError, match="whole-share"):
+        engine.run()
@@ -22,3 +22,22 @@ def test_engine_runs_and_equity_updates() -> None:
     assert not hist.empty
     assert "equity" in hist.columns
     assert hist["equity"].iloc[-1] >= hist["equity"].iloc[0]
+
+
+def test_engine_can_run_again_from_scratch() -> None:
+    idx = pd.date_range("2020-01-01", periods=200, freq="D", tz="UTC")
+    price = pd.Series(100 + (pd.Series(range(200)) * 0.1).values, index=idx)
+    df = pd.DataFrame(
+        {"open": price, "high": price, "low": price, "close": price, "volume": 1000.0}
+    )
+    engine = BacktestEngine(
+        feed=DataFeed(df),
+        broker=Broker(slippage_bps=0, commission_bps=0),
+        strategy=SMACrossover(fast=5, slow=20, size_pct=0.5, long_only=True),
+        initial_cash=10000.0,
+    )
+    first = engine.run()
+    first_fills = list(engine.fills)
+    second = engine.run()
+    pd.testing.assert_frame_equal(first, second)
+    assert engine.fills == first_fills
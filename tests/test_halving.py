@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.strategies.mean_reversion import MeanReversion
+from fluxbt.strategies.sma_crossover import SMACrossover
+from fluxbt.sweep import SuccessiveHalving
+
+SMA_GRID: dict[str, list[object]] = {"fast": [3, 5, 10], "slow": [20, 40, 60], "size_pct": [0.5, 1]}
+
+
+def test_prunes_grid_and_picks_full_run_score() -> None:
+    df = SyntheticLoader(n_bars=2_000, freq="D", seed=5).load()
+    search = SuccessiveHalving(SMACrossover, df, min_bars=200, workers=1)
+    result = search.run_grid(SMA_GRID)
+
+    assert [len(r.candidates) for r in result.rounds] == [18, 6, 2]
+    assert result.rounds[-1].horizon == len(df)
+    assert result.full_grid_bars == 18 * len(df)
+    assert result.bars_simulated < result.full_grid_bars / 2
+    assert "saved" in result.summary()
+
+    engine = BacktestEngine(
+        feed=DataFeed(df), broker=Broker(), strategy=search.strategy_cls(**result.best_params)
+    )
+    engine.run()
+    assert result.best_score == pytest.approx(engine.accumulator.result("D")["sharpe"])
+    assert result.best_score == max(s for s in result.rounds[-1].scores if not math.isnan(s))
+
+
+def test_parallel_rounds_match_serial() -> None:
+    df = SyntheticLoader(n_bars=1_200, freq="D", seed=9).load()
+    grid: dict[str, list[object]] = {"window": [10, 20, 40], "entry": [1.0, 1.5, 2.0]}
+    serial = SuccessiveHalving(MeanReversion, df, objective="max_dd", min_bars=150, workers=1)
+    parallel = SuccessiveHalving(MeanReversion, df, objective="max_dd", min_bars=150, workers=2)
+
+    a, b = serial.run_grid(grid), parallel.run_grid(grid)
+    assert a.best_params == b.best_params
+    assert [r.scores for r in a.rounds] == [r.scores for r in b.rounds]
+
+
+def test_rejects_unknown_objective() -> None:
+    df = SyntheticLoader(n_bars=100, freq="D", seed=1).load()
+    with pytest.raises(ValueError, match="objective"):
+        SuccessiveHalving(SMACrossover, df, objective="alpha")
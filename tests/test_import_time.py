@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ("matplotlib", "httpx", "yfinance", "jinja2", "pandas")
+# Generous default so slow CI runners do not flake; before lazy imports this was ~1.4s
+BUDGET_MS = float(os.environ.get("FLUXBT_IMPORT_BUDGET_MS", "500"))
+
+
+def _importtime(*args: str) -> dict[str, int]:
+    """Return {module: cumulative microseconds} from ``python -X importtime``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "COLUMNS": "80"},
+    )
+    timings: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        timings[name.strip()] = int(cumulative.strip())
+    return timings
+
+
+def test_cli_help_does_not_import_heavy_dependencies() -> None:
+    imported = _importtime("-m", "fluxbt.cli", "--help")
+    loaded = sorted(m for m in HEAVY_MODULES if m in imported)
+    assert not loaded, f"CLI startup imported heavy modules: {loaded}"
+
+
+def test_cli_import_time_within_budget() -> None:
+    timings = _importtime("-c", "import fluxbt.cli")
+    total_ms = timings["fluxbt.cli"] / 1000.0
+    assert total_ms < BUDGET_MS, f"import fluxbt.cli took {total_ms:.0f}ms > {BUDGET_MS:.0f}ms"
+
+
+def test_data_loaders_do_not_import_the_engine() -> None:
+    imported = _importtime("-c", "import fluxbt.data.loader")
+    core = sorted(m for m in imported if m.startswith("fluxbt.core"))
+    assert not core, f"fluxbt.data imported core modules: {core}"
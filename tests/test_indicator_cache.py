@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+from functools import partial
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fluxbt.core.indicator_cache import (
+    IndicatorCache,
+    fingerprint,
+    get_indicator_cache,
+    set_indicator_cache,
+)
+from fluxbt.core.utils import safe_rolling_mean, safe_rolling_std
+
+PRICES = pd.Series(np.random.default_rng(1).normal(100, 1, 5_000))
+
+
+@pytest.fixture
+def cache() -> Iterator[IndicatorCache]:
+    previous = get_indicator_cache()
+    fresh = IndicatorCache()
+    set_indicator_cache(fresh)
+    yield fresh
+    set_indicator_cache(previous)
+
+
+def test_rolling_helpers_hit_cache(cache: IndicatorCache) -> None:
+    first = safe_rolling_mean(PRICES, 20)
+    again = safe_rolling_mean(PRICES.copy(), 20)
+    pd.testing.assert_series_equal(first, PRICES.rolling(20, min_periods=20).mean())
+    pd.testing.assert_series_equal(again, first)
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+
+    safe_rolling_std(PRICES, 20)
+    safe_rolling_mean(PRICES, 21)
+    safe_rolling_mean(PRICES + 1e-9, 20)
+    assert (cache.stats.misses, cache.stats.hits) == (4, 1)
+
+    again.iloc[0] = 1.0  # results are private copies
+    assert np.isnan(safe_rolling_mean(PRICES, 20).iloc[0])
+
+
+def test_lru_respects_memory_budget() -> None:
+    cache = IndicatorCache(max_bytes=3 * 8 * 1_000)
+    arrays = [np.full(1_000, float(i)) for i in range(5)]
+    for a in arrays:
+        out = cache.get_or_compute("double", (), a, partial(np.multiply, a, 2))
+        assert not out.flags.writeable
+    assert len(cache) == 3 and cache.nbytes <= cache.max_bytes
+    assert cache.stats.evictions == 2
+    cache.get_or_compute("double", (), arrays[-1], lambda: arrays[-1] * 2)
+    assert cache.stats.hits == 1
+
+
+def _compute_in_worker(disk_dir: str) -> None:
+    cache = IndicatorCache(disk_dir=disk_dir)
+    cache.get_or_compute("rolling_mean", (20,), PRICES.to_numpy(), lambda: np.cumsum(PRICES))
+
+
+def test_disk_tier_shared_between_processes(tmp_path: Path) -> None:
+    proc = mp.get_context("spawn").Process(target=_compute_in_worker, args=(str(tmp_path),))
+    proc.start()
+    proc.join(60)
+    assert proc.exitcode == 0
+
+    cache = IndicatorCache(disk_dir=str(tmp_path))
+    out = cache.get_or_compute(
+        "rolling_mean", (20,), PRICES.to_numpy(), lambda: pytest.fail("recomputed")
+    )
+    assert cache.stats.disk_hits == 1 and isinstance(out, np.memmap)
+    np.testing.assert_array_equal(out, np.cumsum(PRICES))
+
+
+def test_fingerprint_is_content_based() -> None:
+    a = np.arange(10.0)
+    assert fingerprint(a) == fingerprint(a.copy())
+    assert fingerprint(a) != fingerprint(a.astype(np.float32))
+    assert fingerprint(a) != fingerprint(a.reshape(2, 5))
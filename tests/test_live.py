@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.live import LiveEngine, RecordingSink
+from fluxbt.core.orders import Order
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.stream import bar_to_json, replay_feed, socket_bars, tail_csv
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+
+def _feed(n_bars: int = 300) -> DataFeed:
+    return DataFeed(SyntheticLoader(n_bars=n_bars, freq="D", seed=7).load())
+
+
+class _Slow(SMACrossover):
+    def on_bar(self, ts: pd.Timestamp, bar: dict[str, float]) -> list[Order]:
+        time.sleep(0.002)
+        return super().on_bar(ts, bar)
+
+
+def test_replay_matches_backtest() -> None:
+    feed = _feed()
+    expected = BacktestEngine(feed=feed, broker=Broker(), strategy=SMACrossover(5, 20)).run()
+    sink = RecordingSink()
+    engine = LiveEngine(
+        stream=replay_feed(feed), broker=Broker(), strategy=SMACrossover(5, 20), sinks=[sink]
+    )
+    hist = asyncio.run(engine.run())
+    pd.testing.assert_frame_equal(hist, expected)
+    assert len(sink.bars) == len(expected)
+    assert sink.fills == engine.fills and len(sink.orders) >= len(engine.fills) > 0
+    stats = engine.latency.percentiles()
+    assert set(stats) == {"p50", "p90", "p99"} and stats["p50"] <= stats["p99"]
+
+
+def test_offload_keeps_event_loop_responsive() -> None:
+    ticks = 0
+
+    async def heartbeat() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    async def main() -> None:
+        beat = asyncio.create_task(heartbeat())
+        engine = LiveEngine(stream=replay_feed(_feed(50)), broker=Broker(), strategy=_Slow(5, 20))
+        await engine.run()
+        beat.cancel()
+
+    asyncio.run(main())
+    assert ticks > 10
+
+
+def test_drop_oldest_under_backpressure() -> None:
+    async def burst() -> None:
+        engine = LiveEngine(
+            stream=replay_feed(_feed(200)),
+            broker=Broker(),
+            strategy=_Slow(5, 20),
+            queue_size=4,
+            overflow="drop_oldest",
+        )
+        hist = await engine.run()
+        assert engine.dropped > 0
+        assert len(hist) + engine.dropped == 200
+
+    asyncio.run(burst())
+
+
+def test_socket_and_tail_sources(tmp_path: Path) -> None:
+    feed = _feed(30)
+    bars = list(feed.iter_bars())
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        for ts, bar in bars:
+            writer.write(bar_to_json(ts, bar).encode())
+        await writer.drain()
+        writer.close()
+
+    async def main() -> list[pd.Timestamp]:
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return [ts async for ts, _ in socket_bars("127.0.0.1", port)]
+
+    assert asyncio.run(main()) == [ts for ts, _ in bars]
+
+    path = tmp_path / "bars.csv"
+    path.write_text("ts,open,high,low,close,volume\n")
+
+    async def follow() -> list[float]:
+        async def append() -> None:
+            for ts, bar in bars[:5]:
+                await asyncio.sleep(0.01)
+                with open(path, "a") as f:
+                    f.write(f"{ts.isoformat()},{bar['open']},{bar['high']},{bar['low']},")
+                    f.flush()
+                    f.write(f"{bar['close']},{bar['volume']}\n")
+
+        task = asyncio.create_task(append())
+        closes = [b["close"] async for _, b in tail_csv(str(path), 0.005, idle_timeout_s=0.2)]
+        await task
+        return closes
+
+    assert asyncio.run(follow()) == [b["close"] for _, b in bars[:5]]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.lookback import ArrayBarContext, RollingBarContext
+from fluxbt.core.orders import Order
+from fluxbt.data.feed import REQUIRED_COLS, DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.strategies.base import BaseStrategy, Strategy
+from fluxbt.strategies.mean_reversion import MeanReversion
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+DF = SyntheticLoader(n_bars=500, freq="D", tz="UTC", seed=3).load()
+
+
+class _Probe(Strategy):
+    """Records the close window seen on every bar and checks it ends at that bar."""
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.seen: list[list[float]] = []
+
+    @property
+    def name(self) -> str:
+        return "probe"
+
+    @property
+    def params(self) -> dict[str, object]:
+        return {"n": self.n}
+
+    @property
+    def lookback(self) -> int:
+        return self.n
+
+    def reset(self) -> None:
+        self.seen = []
+
+    def get_state(self) -> dict[str, object] | None:
+        return {}
+
+    def set_state(self, state: dict[str, object]) -> None:
+        pass
+
+    def on_bar(self, ts: pd.Timestamp, bar: dict[str, float]) -> list[Order]:
+        window = self._context().window("close", self.n)
+        assert window[-1] == bar["close"]
+        self.seen.append(window.tolist())
+        return []
+
+
+def _expected_windows(n: int) -> list[list[float]]:
+    close = DF["close"].to_numpy()
+    return [close[max(i + 1 - n, 0) : i + 1].tolist() for i in range(len(close))]
+
+
+def test_windows_are_readonly_views_without_lookahead() -> None:
+    close = DF["close"].to_numpy()
+    ctx = ArrayBarContext({"close": close}, max_lookback=10, i=4)
+    window = ctx.window("close", 10)
+    assert window.tolist() == close[:5].tolist() and len(ctx) == 5
+    assert np.shares_memory(window, close)
+    with pytest.raises(ValueError):
+        window[0] = 0.0
+    ctx.i = 99
+    assert ctx.window("close", 3).tolist() == close[97:100].tolist()
+    for n in (0, 11):
+        with pytest.raises(ValueError):
+            ctx.window("close", n)
+
+
+def test_rolling_context_matches_array_context() -> None:
+    cols = {c: DF[c].to_numpy() for c in REQUIRED_COLS}
+    array_ctx = ArrayBarContext(cols, max_lookback=7)
+    rolling = RollingBarContext(max_lookback=7)
+    for i in range(len(DF)):
+        rolling.append({c: float(cols[c][i]) for c in REQUIRED_COLS})
+        array_ctx.i = i
+        for n in (1, 4, 7):
+            assert rolling.window("high", n).tolist() == array_ctx.window("high", n).tolist()
+    assert {c: v.tolist() for c, v in rolling.tail().items()} == {
+        c: v.tolist() for c, v in array_ctx.tail().items()
+    }
+
+
+def test_engine_moves_context_with_each_bar() -> None:
+    probe = _Probe(5)
+    BacktestEngine(feed=DataFeed(DF), broker=Broker(), strategy=probe).run()
+    assert probe.seen == _expected_windows(5)
+
+
+def test_resume_without_earlier_bars_uses_checkpoint_window() -> None:
+    first = BacktestEngine(feed=DataFeed(DF.iloc[:300]), broker=Broker(), strategy=_Probe(8))
+    first.run()
+    ckpt = first.checkpoint()
+    assert ckpt.lookback is not None and len(ckpt.lookback["close"]) == 8
+
+    # the second feed only holds the remaining bars, as when resuming on new data
+    probe = _Probe(8)
+    second = BacktestEngine(feed=DataFeed(DF.iloc[300:]), broker=Broker(), strategy=probe)
+    second.run(resume_from=ckpt)
+    assert probe.seen == _expected_windows(8)[300:]
+
+
+@pytest.mark.parametrize("make", [lambda: SMACrossover(5, 20), lambda: MeanReversion(window=15)])
+def test_strategies_keep_no_price_history(make: Callable[[], BaseStrategy]) -> None:
+    strategy = make()
+    BacktestEngine(feed=DataFeed(DF), broker=Broker(), strategy=strategy).run()
+    assert "prices" not in (strategy.get_state() or {})
+
+    unbound = make()
+    unbound.reset()
+    with pytest.raises(RuntimeError, match="ctx.window"):
+        unbound.on_bar(DF.index[0], {c: float(DF[c].iloc[0]) for c in REQUIRED_COLS})
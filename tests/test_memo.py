@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+from typer.testing import CliRunner
+
+from fluxbt.cli import app
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.risk import VolTargetOverlay
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.reports.memo import RunMemo, run_key
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+DF = SyntheticLoader(n_bars=1_500, freq="D", tz="UTC", seed=4).load()
+
+
+def _engine(fast: int = 10, df: pd.DataFrame = DF, **kw: float) -> BacktestEngine:
+    return BacktestEngine(
+        feed=DataFeed(df),
+        broker=Broker(slippage_bps=kw.get("slippage_bps", 1.0)),
+        strategy=SMACrossover(fast, 50, 1.0),
+        initial_cash=kw.get("cash", 100_000.0),
+    )
+
+
+def test_hit_returns_stored_run(tmp_path: Path) -> None:
+    memo = RunMemo(str(tmp_path / "memo"))
+    first = memo.run(_engine())
+    second = memo.run(_engine())
+    assert not first.hit and second.hit and first.key == second.key
+    pd.testing.assert_frame_equal(second.history, first.history)
+    assert second.fills == first.fills and second.metrics == first.metrics
+    assert (memo.stats.hits, memo.stats.misses) == (1, 1)
+
+    assert not memo.run(_engine(), refresh=True).hit
+    assert not memo.run(_engine(fast=12)).hit
+    assert len(memo) == 2
+
+
+def test_metrics_follow_the_requested_freq(tmp_path: Path) -> None:
+    memo = RunMemo(str(tmp_path / "memo"))
+    daily = memo.run(_engine(), freq="D")
+    minute = memo.run(_engine(), freq="MIN")
+    assert not minute.hit and minute.key != daily.key
+    engine = _engine()
+    engine.run()
+    assert minute.metrics == engine.accumulator.result("MIN")
+    assert minute.metrics["sharpe"] != daily.metrics["sharpe"]
+    assert memo.run(_engine(), freq="MIN").hit
+
+
+def test_key_covers_run_inputs() -> None:
+    base = run_key(_engine())
+    assert run_key(_engine()) == base
+    assert run_key(_engine(slippage_bps=2.0)) != base
+    assert run_key(_engine(cash=50_000.0)) != base
+    shifted = DF.copy()
+    shifted.iloc[-1, shifted.columns.get_loc("close")] += 0.01
+    assert run_key(_engine(df=shifted)) != base
+
+    engine = _engine()
+    engine.risk_overlay = VolTargetOverlay(target_ann_vol=0.1)
+    before = run_key(engine)
+    engine.run()
+    assert run_key(engine) == before != base  # overlay state does not leak into the key
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    memo = RunMemo(str(tmp_path / "memo"))
+    keys = [memo.run(_engine(fast=f)).key for f in (5, 6)]
+    entry_bytes = max(size for _, size, _ in memo.entries())
+    for age, key in enumerate(keys):
+        os.utime(os.path.join(memo.path, key), (1_000 + age, 1_000 + age))
+    assert memo.get(keys[0]) is not None  # now the most recently used
+
+    memo.max_bytes = int(entry_bytes * 2.5)
+    third = memo.run(_engine(fast=7)).key
+    assert {key for key, _, _ in memo.entries()} == {keys[0], third}
+    assert memo.stats.evictions == 1 and memo.nbytes <= memo.max_bytes
+
+
+def test_cli_memo_flag(tmp_path: Path) -> None:
+    csv_path = tmp_path / "bars.csv"
+    DF.iloc[:400].to_csv(csv_path, index_label="timestamp")
+    args = ["run", "--source", "csv", "--csv-path", str(csv_path), "--strategy", "sma"]
+    args += ["--no-register", "--memo", "--memo-dir", str(tmp_path / "memo")]
+    runner = CliRunner()
+    outputs = [runner.invoke(app, [*args, "--out", str(tmp_path / f"r{i}")]) for i in range(2)]
+    assert all(r.exit_code == 0 for r in outputs), outputs[0].output
+    assert "Reusing memoized run" not in outputs[0].output
+    assert "Reusing memoized run" in outputs[1].output
+    refreshed = runner.invoke(app, [*args, "--refresh-memo", "--out", str(tmp_path / "r2")])
+    assert "Reusing memoized run" not in refreshed.output
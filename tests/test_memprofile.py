@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from fluxbt.cli import app
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.memprofile import MEMORY_PROFILE_FILE, MemoryProfiler
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+
+def test_stage_reports_peak_and_allocation_sites() -> None:
+    profiler = MemoryProfiler(top_n=5)
+    kept = []
+    with profiler.stage("alloc"):
+        scratch = np.ones(4_000_000)  # 32 MB, freed before the stage ends
+        kept.append(np.ones(1_000_000))  # 8 MB, still alive afterwards
+        del scratch
+    profiler.stop()
+    assert not tracemalloc.is_tracing()
+
+    (stage,) = profiler.stages
+    assert stage.traced_peak >= 40_000_000
+    assert 8_000_000 <= stage.traced_net < 9_000_000
+    assert stage.top[0].size >= 8_000_000
+    assert any(frame.startswith(__file__) for frame in stage.top[0].traceback)
+    with pytest.raises(ValueError, match="inside stage"):
+        with profiler.stage("outer"), profiler.stage("inner"):
+            pass
+    profiler.stop()
+
+
+def test_engine_run_is_profiled(tmp_path: Path) -> None:
+    profiler = MemoryProfiler()
+    engine = BacktestEngine(
+        feed=DataFeed(SyntheticLoader(n_bars=2_000, freq="D", seed=1).load()),
+        broker=Broker(),
+        strategy=SMACrossover(10, 50),
+        profiler=profiler,
+    )
+    engine.run()
+    profiler.stop()
+    assert [s.name for s in profiler.stages] == ["engine"]
+    assert profiler.stages[0].traced_peak > 0 and profiler.stages[0].top
+
+    report = json.loads(Path(profiler.write(str(tmp_path))).read_text())
+    assert report["stages"][0]["name"] == "engine"
+    assert {"location", "size", "count"} <= set(report["stages"][0]["top"][0])
+
+
+def test_cli_profile_memory_writes_report(tmp_path: Path) -> None:
+    csv_path = tmp_path / "bars.csv"
+    SyntheticLoader(n_bars=300, freq="D", seed=2).load().to_csv(csv_path, index_label="timestamp")
+    out = tmp_path / "run"
+    args = ["run", "--source", "csv", "--csv-path", str(csv_path), "--strategy", "sma"]
+    result = CliRunner().invoke(
+        app,
+        [*args, "--no-register", "--profile-memory", "--profile-frames", "1", "--out", str(out)],
+    )
+    assert result.exit_code == 0, result.output
+    assert "Memory profile saved to" in result.output
+    report = json.loads((out / MEMORY_PROFILE_FILE).read_text())
+    assert [s["name"] for s in report["stages"]] == ["load", "engine", "metrics", "report"]
+    assert not tracemalloc.is_tracing()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from fluxbt.core.metrics import compute_metrics
+from fluxbt.core.metrics import compute_metrics, compute_metrics_batch
 
 
 def test_metrics_basic() -> None:
@@ -14,3 +16,21 @@ def test_metrics_basic() -> None:
     assert m["total_return"] > 0
     assert m["sharpe"] > 0
     assert m["max_dd"] <= 0
+
+
+def test_batch_metrics_match_per_column() -> None:
+    idx = pd.date_range("2020-01-01", periods=300, freq="D", tz="UTC")
+    rng = np.random.default_rng(4)
+    steps = rng.normal(0.0003, 0.01, (300, 4))
+    panel = pd.DataFrame(100 * np.exp(np.cumsum(steps, axis=0)), index=idx, columns=list("abcd"))
+    panel.iloc[:60, 1] = np.nan  # starts late
+    panel.iloc[240:, 2] = np.nan  # ends early
+    panel.iloc[100:120, 3] = np.nan  # gap
+    panel["flat"] = 100.0
+    panel["empty"] = np.nan
+
+    batch = compute_metrics_batch(panel, "D")
+    assert list(batch.index) == list(panel.columns)
+    for col in panel.columns:
+        expected = compute_metrics(panel[col], "D")
+        assert batch.loc[col].to_dict() == pytest.approx(expected, rel=1e-9, nan_ok=True)
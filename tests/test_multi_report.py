@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.metrics import compute_metrics
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.reports.multi_report import RunSummary, generate_multi_run_report
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+
+def _sweep() -> list[RunSummary]:
+    df = SyntheticLoader(n_bars=300, freq="D", seed=5).load()
+    runs = []
+    for fast in (5, 10):
+        for slow in (20, 40):
+            strat = SMACrossover(fast=fast, slow=slow)
+            hist = BacktestEngine(feed=DataFeed(df), broker=Broker(), strategy=strat).run()
+            equity: pd.Series = hist["equity"]
+            runs.append(
+                RunSummary(
+                    name=f"sma_{fast}_{slow}",
+                    params=strat.params,
+                    metrics=compute_metrics(equity, freq="D"),
+                    equity=equity,
+                )
+            )
+    return runs
+
+
+def test_multi_run_report_with_per_run_charts(tmp_path: Path) -> None:
+    runs = _sweep()
+    path = generate_multi_run_report(runs, out_dir=str(tmp_path), workers=2, top_n=3)
+    assert path is not None
+    html = Path(path).read_text(encoding="utf-8")
+    for run in runs:
+        assert run.name in html
+    assert (tmp_path / "top_equity.png").exists()
+    assert (tmp_path / "heatmap.png").exists()
+    assert len(list((tmp_path / "runs").glob("*.png"))) == len(runs)
+
+
+def test_multi_run_report_embeds_sparklines_for_large_sweeps(tmp_path: Path) -> None:
+    runs = _sweep()
+    path = generate_multi_run_report(runs, out_dir=str(tmp_path), png_per_run_limit=2)
+    assert path is not None
+    html = Path(path).read_text(encoding="utf-8")
+    assert html.count("<polyline") == len(runs)
+    assert not (tmp_path / "runs").exists()
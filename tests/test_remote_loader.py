@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from fluxbt.strategies import BaseStrategy
+from fluxbt.strategies.remote_loader import (
+    GitHubSource,
+    StrategyLoadError,
+    close_client,
+    load_github_strategies,
+    load_github_strategy,
+)
+
+STRATEGY = """
+from fluxbt.strategies import BaseStrategy
+
+
+class {name}(BaseStrategy):
+    @property
+    def name(self) -> str:
+        return "{name}"
+
+    @property
+    def params(self) -> dict:
+        return {{}}
+
+    def reset(self) -> None:
+        pass
+
+    def on_bar(self, ts, bar):
+        return []
+"""
+
+
+class _Server(ThreadingHTTPServer):
+    files: dict[str, str]
+    hits: list[tuple[str, int]]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        body = self.server.files.get(self.path)
+        if body is None:
+            self.server.hits.append((self.path, 404))
+            self.send_error(404)
+            return
+        etag = '"' + hashlib.sha1(body.encode()).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.hits.append((self.path, 304))
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.server.hits.append((self.path, 200))
+        data = body.encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    srv = _Server(("127.0.0.1", 0), _Handler)
+    srv.files = {f"/o/r/main/s{i}.py": STRATEGY.format(name=f"Remote{i}") for i in range(4)}
+    srv.hits = []
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    close_client()
+
+
+def _base(srv: _Server) -> str:
+    return f"http://127.0.0.1:{srv.server_address[1]}/"
+
+
+def test_cache_revalidates_with_etag(server: _Server, tmp_path: Path) -> None:
+    def load() -> BaseStrategy:
+        return load_github_strategy(
+            "o", "r", "s0.py", cache_dir=str(tmp_path), base_url=_base(server)
+        )
+
+    first, second = load(), load()
+    assert first.name == second.name == "Remote0"
+    assert [code for _, code in server.hits] == [200, 304]
+    # identical content is imported once, from the content-addressed file
+    assert type(first) is type(second)
+    assert type(first).__module__.startswith("fluxbt_remote_")
+    assert list((tmp_path / "code").glob("*.py"))
+
+    server.files["/o/r/main/s0.py"] = STRATEGY.format(name="Changed")
+    third = load()
+    assert third.name == "Changed"
+    assert server.hits[-1][1] == 200
+
+
+def test_missing_file_raises(server: _Server, tmp_path: Path) -> None:
+    with pytest.raises(StrategyLoadError, match="Failed to fetch"):
+        load_github_strategy("o", "r", "nope.py", cache_dir=str(tmp_path), base_url=_base(server))
+
+
+def test_concurrent_batch_load(server: _Server, tmp_path: Path) -> None:
+    sources = [GitHubSource("o", "r", "main", f"s{i}.py", base_url=_base(server)) for i in range(4)]
+    strategies = load_github_strategies(sources, cache_dir=str(tmp_path))
+    assert [s.name for s in strategies] == [f"Remote{i}" for i in range(4)]
+    load_github_strategies(sources, cache_dir=str(tmp_path))
+    assert sorted(code for _, code in server.hits) == [200] * 4 + [304] * 4
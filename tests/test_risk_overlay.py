@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.orders import Order
+from fluxbt.core.risk import RollingVolatility, VolTargetOverlay
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+DF = SyntheticLoader(n_bars=2_000, freq="D", tz="UTC", seed=3).load()
+
+
+def test_rolling_volatility_matches_pandas() -> None:
+    close = DF["close"]
+    expected = close.pct_change().rolling(20).std(ddof=0).to_numpy()
+    vol = RollingVolatility(20)
+    got = []
+    for price in close:
+        vol.update(float(price))
+        got.append(vol.std if vol.count == 20 else np.nan)
+    np.testing.assert_allclose(got, expected, rtol=1e-9, equal_nan=True)
+
+    batched = RollingVolatility(20)
+    for chunk in np.array_split(close.to_numpy(), 13):
+        batched.update_many(chunk)
+    assert batched.std == pytest.approx(vol.std, rel=1e-12)
+
+
+def test_vol_target_rescales_and_caps_pct_orders() -> None:
+    ts = pd.Timestamp("2024-01-01", tz="UTC")
+    orders = [Order("a", ts, "BUY", "PCT:0.5"), Order("b", ts, "SELL", "CLOSE")]
+    overlay = VolTargetOverlay(target_ann_vol=0.10, window=5, freq="D", max_fraction=0.6)
+    overlay.update_many(np.array([100.0, 101.0, 100.0]))
+    assert overlay.apply(orders) == orders  # not warmed up yet
+
+    # ~0.5% daily moves are ~8% annualized: scale up, then hit the 0.6 cap
+    overlay.update_many(100 * np.cumprod(np.resize([1.005, 0.995], 10)))
+    scale = overlay.scale()
+    assert scale is not None and scale > 1
+    sized = overlay.apply(orders)
+    assert sized[0].qty == "PCT:0.6" and sized[1] == orders[1]
+
+    overlay.update_many(100 * np.cumprod(np.resize([1.05, 0.95], 10)))
+    (buy,) = overlay.apply(orders[:1])
+    assert isinstance(buy.qty, str)
+    assert float(buy.qty[4:]) == pytest.approx(0.5 * (overlay.scale() or 0))
+
+
+def _engine(block_size: int | None, df: pd.DataFrame = DF) -> BacktestEngine:
+    return BacktestEngine(
+        feed=DataFeed(df),
+        broker=Broker(commission_bps=1.0),
+        strategy=SMACrossover(5, 20, long_only=False),
+        block_size=block_size,
+        risk_overlay=VolTargetOverlay(target_ann_vol=0.15, window=30, max_fraction=1.5),
+    )
+
+
+def test_overlay_in_engine_block_and_resume() -> None:
+    plain = BacktestEngine(
+        feed=DataFeed(DF),
+        broker=Broker(commission_bps=1.0),
+        strategy=SMACrossover(5, 20, long_only=False),
+    )
+    plain.run()
+    per_bar = _engine(None)
+    expected = per_bar.run()
+    assert [f.qty for f in per_bar.fills] != [f.qty for f in plain.fills]
+
+    blocked = _engine(64)
+    pd.testing.assert_frame_equal(blocked.run(), expected)
+    assert blocked.fills == per_bar.fills
+
+    first = _engine(None, DF.iloc[:1_200])
+    head = first.run()
+    tail = _engine(64).run(resume_from=first.checkpoint())
+    pd.testing.assert_frame_equal(pd.concat([head, tail]), expected)
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import signal
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from fluxbt.cli import app
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.metrics import compute_metrics
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.loader import CSVLoader
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.reports.artifacts import read_artifact
+from fluxbt.serve import FeedCache, RunRequest, RunServer, ServeClient, ServeError
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+DF = SyntheticLoader(n_bars=400, freq="D", tz="UTC", seed=17).load()
+
+
+def _csv(tmp_path: Path) -> str:
+    path = tmp_path / "bars.csv"
+    DF.to_csv(path, index_label="timestamp")
+    return str(path)
+
+
+def _request(csv_path: str, out: Path, **params: object) -> RunRequest:
+    spec = {
+        "strategy": "sma",
+        "params": {"fast": 5, "slow": 20, **params},
+        "data": {"source": "csv", "path": csv_path},
+        "commission_bps": 1.0,
+    }
+    return RunRequest(spec=spec, out=str(out), register=False)
+
+
+def test_feed_cache_reuses_and_revalidates(tmp_path: Path) -> None:
+    csv_path = _csv(tmp_path)
+    cache = FeedCache(max_entries=2)
+    data = {"source": "csv", "path": csv_path}
+    feed, fingerprint, cached = cache.get(data)
+    assert not cached and len(feed.df) == len(DF)
+    again, _, cached = cache.get(data)
+    assert cached and again is feed
+
+    DF.iloc[:300].to_csv(csv_path, index_label="timestamp")  # edited input is reloaded
+    shorter, new_fingerprint, cached = cache.get(data)
+    assert not cached and len(shorter.df) == 300 and new_fingerprint != fingerprint
+
+    cache.get(data, "compact")
+    cache.get({"source": "synthetic", "n_bars": 50, "seed": 1})
+    assert len(cache) == 2 and cache.stats.evictions == 1
+    assert cache.info()["hits"] == 1 and cache.nbytes > 0
+
+
+def _inline(tmp_path: Path) -> RunServer:
+    return RunServer(port=0, workers=0, token_path=str(tmp_path / "serve.token"))
+
+
+def test_inline_server_matches_local_run(tmp_path: Path) -> None:
+    csv_path = _csv(tmp_path)
+    with _inline(tmp_path) as server:
+        server.start()
+        client = ServeClient(server.address, token_path=server.token_path)
+        first = client.run(_request(csv_path, tmp_path / "a"))
+        second = client.run(_request(csv_path, tmp_path / "b", fast=8))
+        health = client.health()
+
+    engine = BacktestEngine(
+        feed=DataFeed(CSVLoader(csv_path).load()),
+        broker=Broker(commission_bps=1.0),
+        strategy=SMACrossover(5, 20),
+    )
+    hist = engine.run()
+    assert first["metrics"] == pytest.approx(compute_metrics(hist["equity"], "D"), nan_ok=True)
+    assert first["fills"] == len(engine.fills) and first["bars"] == len(DF)
+    assert not first["data_cached"] and second["data_cached"]
+    assert first["worker"] == os.getpid()
+    assert len(read_artifact(first["out"]).history) == len(DF)
+    assert health["runs"] == 2 and health["data_cache_hits"] == 1
+    assert health["feeds"]["entries"] == 1
+
+
+def test_bad_requests_are_reported(tmp_path: Path) -> None:
+    with _inline(tmp_path) as server:
+        server.start()
+        client = ServeClient(server.address, token=server.token)
+        bad = _request(_csv(tmp_path), tmp_path / "out")
+        bad.spec["strategy"] = "nope"
+        with pytest.raises(ServeError, match="Unknown strategy"):
+            client.run(bad)
+        with pytest.raises(ServeError, match="No such file|not found|does not exist"):
+            client.run(_request(str(tmp_path / "missing.csv"), tmp_path / "out"))
+        assert client.health()["failures"] == 2
+    with pytest.raises(ServeError, match="No fluxbt server"):
+        ServeClient(server.address, timeout=1.0).health()
+
+
+def test_unix_socket_worker_pool_and_cli(tmp_path: Path) -> None:
+    csv_path = _csv(tmp_path)
+    socket_path = str(tmp_path / "fluxbt.sock")
+    with RunServer(socket_path=socket_path, workers=1) as server:
+        server.start()
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+        with pytest.raises(OSError, match="already listening"):
+            RunServer(socket_path=socket_path, workers=0)
+
+        args = ["run-client", "--source", "csv", "--csv-path", csv_path, "--strategy", "sma"]
+        args += ["--fast", "5", "--slow", "20", "--no-register", "--server", server.address]
+        runner = CliRunner()
+        outputs = [runner.invoke(app, [*args, "--out", str(tmp_path / f"r{i}")]) for i in range(2)]
+        assert all(r.exit_code == 0 for r in outputs), outputs[0].output
+        assert "Metrics:" in outputs[0].output and "(data loaded)" in outputs[0].output
+        assert "(data cached)" in outputs[1].output
+        assert len(read_artifact(str(tmp_path / "r1")).history) == len(DF)
+
+        # a worker that dies fails its run; the pool is replaced for the next one
+        client = ServeClient(server.address)
+        pid = client.run(_request(csv_path, tmp_path / "r2"))["worker"]
+        os.kill(pid, signal.SIGKILL)
+        with pytest.raises(ServeError, match="worker process died"):
+            client.run(_request(csv_path, tmp_path / "r3"))
+        assert client.run(_request(csv_path, tmp_path / "r4"))["worker"] != pid
+
+        assert os.stat(server.token_path).st_mode & 0o777 == 0o600
+        client.shutdown()
+    assert not os.path.exists(socket_path) and not os.path.exists(server.token_path)
+
+
+def _post(
+    server: RunServer, body: str, headers: dict[str, str], path: str = "/run"
+) -> tuple[int, str]:
+    conn = http.client.HTTPConnection("127.0.0.1", int(server.address.rsplit(":", 1)[1]))
+    try:
+        conn.request("POST", path, body=body, headers=headers)
+        response = conn.getresponse()
+        return response.status, response.read().decode()
+    finally:
+        conn.close()
+
+
+def test_socket_path_must_not_clobber_other_files(tmp_path: Path) -> None:
+    notes = tmp_path / "notes.txt"
+    notes.write_text("keep me")
+    with pytest.raises(OSError, match="not a socket"):
+        RunServer(socket_path=str(notes), workers=0, token_path=str(tmp_path / "serve.token"))
+    assert notes.read_text() == "keep me"
+
+
+def test_requests_need_token_local_origin_and_json(tmp_path: Path) -> None:
+    out = tmp_path / "out"
+    body = _request(_csv(tmp_path), out).to_json()
+    with _inline(tmp_path) as server:
+        server.start()
+        assert os.stat(server.token_path).st_mode & 0o777 == 0o600
+        token = {"X-Fluxbt-Token": server.token}
+        json_type = {"Content-Type": "application/json"}
+        # what a web page can send: a "simple" cross-origin POST, without the token
+        evil = {"Content-Type": "text/plain", "Origin": "http://evil.example"}
+        assert _post(server, body, evil)[0] == 403
+        assert _post(server, body, {**evil, **token})[0] == 403
+        assert _post(server, body, {**json_type, **token, "Host": "evil.example:80"})[0] == 403
+        assert _post(server, body, json_type)[0] == 401
+        assert _post(server, body, {**json_type, "X-Fluxbt-Token": "guess"})[0] == 401
+        assert _post(server, body, {"Content-Type": "text/plain", **token})[0] == 415
+        assert _post(server, "{}", {**evil, **token}, "/shutdown")[0] == 403
+        assert not out.exists() and server.stats.runs == 0
+        with pytest.raises(ServeError, match="Missing or wrong"):
+            ServeClient(server.address, token_path=str(tmp_path / "missing")).health()
+
+        # a one-bar run has NaN metrics, which must go out as JSON null
+        one_bar = _request(_csv(tmp_path), out)
+        one_bar.spec["budget"] = {"max_bars": 1}
+        local = {**json_type, **token, "Origin": server.address}
+        status, text = _post(server, one_bar.to_json(), local)
+        assert status == 200 and "NaN" not in text
+        assert json.loads(text)["metrics"]["sharpe"] is None
+        metrics = ServeClient(server.address, token=server.token).run(one_bar)["metrics"]
+        assert metrics["sharpe"] != metrics["sharpe"]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.core.metrics import MetricsAccumulator, compute_metrics
+from fluxbt.core.portfolio import Portfolio
+from fluxbt.core.sinks import CallbackSink, HistorySink, NpyFileSink, RingBufferSink
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.reports.artifacts import read_artifact
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+
+def _engine(sink: HistorySink | None = None, chunk_size: int = 64) -> BacktestEngine:
+    df = SyntheticLoader(n_bars=500, freq="D", tz="America/New_York", seed=4).load()
+    return BacktestEngine(
+        feed=DataFeed(df),
+        broker=Broker(),
+        strategy=SMACrossover(fast=5, slow=20),
+        sink=sink,
+        chunk_size=chunk_size,
+    )
+
+
+def _full() -> tuple[pd.DataFrame, BacktestEngine]:
+    engine = _engine()
+    return engine.run(), engine
+
+
+def test_drawdown_matches_series() -> None:
+    hist, _ = _full()
+    expected = Portfolio.drawdown_series(hist["equity"])
+    pd.testing.assert_series_equal(hist["drawdown"], expected, check_names=False)
+
+
+def test_ring_buffer_keeps_tail() -> None:
+    hist, engine = _full()
+    sink = RingBufferSink(maxlen=100)
+    tail = _engine(sink, chunk_size=37).run()
+    pd.testing.assert_frame_equal(tail, hist.tail(100), check_names=False, check_freq=False)
+    assert list(sink.fills) == engine.fills[-100:]
+
+
+def test_npy_file_sink_roundtrip(tmp_path: Path) -> None:
+    hist, engine = _full()
+    sink = NpyFileSink(str(tmp_path))
+    streamed = _engine(sink).run()
+    pd.testing.assert_frame_equal(streamed, hist, check_names=False, check_freq=False)
+
+    art = read_artifact(str(tmp_path))
+    assert art.format == "npy"
+    fills = art.fills
+    assert list(fills["order_id"]) == [f.order_id for f in engine.fills]
+    assert fills["price"].tolist() == [f.price for f in engine.fills]
+
+
+def test_callback_sink_receives_every_row() -> None:
+    hist, engine = _full()
+    chunks: list[pd.DataFrame] = []
+    fills: list[object] = []
+    streaming = _engine(CallbackSink(chunks.append, fills.extend), chunk_size=50)
+    assert streaming.run().empty
+    assert [len(c) for c in chunks[:2]] == [50, 50]
+    pd.testing.assert_frame_equal(pd.concat(chunks), hist, check_names=False, check_freq=False)
+    assert fills == engine.fills
+    assert streaming.fills == []
+
+
+def test_accumulator_matches_compute_metrics() -> None:
+    hist, engine = _full()
+    expected = compute_metrics(hist["equity"], freq="D", rf=0.02)
+    assert engine.accumulator.result("D", rf=0.02) == pytest.approx(expected, rel=1e-9, nan_ok=True)
+    assert MetricsAccumulator().result("D")["sharpe"] != MetricsAccumulator().result("D")["sharpe"]
+
+
+def test_zero_equity_does_not_break_the_accumulator() -> None:
+    df = SyntheticLoader(n_bars=200, freq="D", tz="UTC", seed=4).load()
+    for block_size in (None, 32):
+        engine = BacktestEngine(
+            feed=DataFeed(df),
+            broker=Broker(),
+            strategy=SMACrossover(5, 20),
+            initial_cash=0.0,
+            block_size=block_size,
+        )
+        hist = engine.run()
+        assert len(hist) == len(df) and (hist["drawdown"] == 0.0).all()
+        metrics = engine.accumulator.result("D")
+        assert math.isnan(metrics["total_return"]) and math.isnan(metrics["cagr"])
+
+    # returns out of a zero equity are left out of the return moments, in both paths
+    equity = np.array([100.0, 0.0, 0.0, 50.0, 55.0, -10.0])
+    one, many = MetricsAccumulator(), MetricsAccumulator()
+    for v in equity:
+        one.update(v)
+    many.update_many(equity)
+    assert one.n_rets == many.n_rets == 4
+    assert many.result("D") == pytest.approx(one.result("D"), rel=1e-9, nan_ok=True)
+    assert math.isnan(one.result("D")["cagr"])  # negative ratio: NaN, not complex
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from fluxbt.cli import app
+from fluxbt.sweep import JobQueue, RunSpec, grid_specs, run_spec, run_worker
+
+DATA: dict[str, object] = {"source": "synthetic", "n_bars": 500, "freq": "D", "seed": 4}
+
+
+def _specs() -> list[RunSpec]:
+    return grid_specs("sma", {"fast": [3, 5, 8], "slow": [20, 40], "cooldown": [0, 2]}, DATA)
+
+
+def _worker(path: str, name: str) -> None:
+    run_worker(path, worker_id=name, lease_seconds=5.0, poll_interval=0.05)
+
+
+def test_workers_drain_queue_in_parallel(tmp_path: Path) -> None:
+    path = str(tmp_path / "queue.db")
+    specs = _specs()
+    with JobQueue(path) as queue:
+        ids = queue.submit(specs, sweep="grid")
+
+    ctx = mp.get_context("spawn")
+    procs = [ctx.Process(target=_worker, args=(path, f"w{i}")) for i in range(3)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(120)
+        assert p.exitcode == 0
+
+    with JobQueue(path) as queue:
+        assert queue.counts("grid") == {"pending": 0, "running": 0, "done": 12, "failed": 0}
+        jobs = queue.jobs("grid")
+    assert [j.id for j in jobs] == ids
+    assert all(j.attempts == 1 for j in jobs)
+    for job, spec in zip(jobs, specs, strict=True):
+        assert job.spec == spec
+        assert job.result == pytest.approx(run_spec(spec), nan_ok=True)
+
+
+def test_expired_lease_is_retried_then_failed(tmp_path: Path) -> None:
+    path = str(tmp_path / "queue.db")
+    with JobQueue(path) as queue:
+        (job_id,) = queue.submit(_specs()[:1], max_attempts=2)
+        crashed = queue.claim("crashed", lease_seconds=0.05)
+        assert crashed is not None and queue.claim("other") is None
+        time.sleep(0.1)
+
+        retry = queue.claim("w2", lease_seconds=0.05)
+        assert retry is not None and (retry.id, retry.attempts) == (job_id, 2)
+        assert not queue.complete(job_id, "crashed", {"sharpe": 1.0})  # lost its lease
+        time.sleep(0.1)
+        assert queue.claim("w3") is None
+        (failed,) = queue.jobs(status="failed")
+        assert "lease expired (worker w2)" in (failed.error or "")
+
+
+def test_errors_are_recorded_and_retried(tmp_path: Path) -> None:
+    path = str(tmp_path / "queue.db")
+    bad = RunSpec("sma", {"fast": 5, "slow": 20, "nope": 1}, DATA)
+    with JobQueue(path) as queue:
+        queue.submit([bad, *_specs()[:1]], max_attempts=2)
+    assert run_worker(path, worker_id="w", poll_interval=0.01) == 1
+    with JobQueue(path) as queue:
+        (failed,) = queue.jobs(status="failed")
+    assert failed.attempts == 2 and "nope" in (failed.error or "")
+
+
+def test_claims_are_exclusive_across_connections(tmp_path: Path) -> None:
+    path = str(tmp_path / "queue.db")
+    queues = [JobQueue(path) for _ in range(4)]
+    queues[0].submit(_specs())
+    claimed = [j.id for q in queues * 4 if (j := q.claim(f"w{id(q)}")) is not None]
+    assert sorted(claimed) == list(range(1, 13))
+    rows = sqlite3.connect(path).execute("SELECT COUNT(*) FROM jobs WHERE status = 'running'")
+    assert rows.fetchone()[0] == 12
+    for q in queues:
+        q.close()
+
+
+def test_cli_submit_worker_status(tmp_path: Path) -> None:
+    path = str(tmp_path / "queue.db")
+    runner = CliRunner()
+    args = ["sweep-submit", "--queue", path, "--strategy", "meanrev"]
+    args += ["--param", "window=10,20", "--param", "entry=1.5,2.0", "--synthetic-bars", "300"]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert "Queued 4 jobs" in result.output
+    result = runner.invoke(app, ["worker", "--queue", path, "--poll", "0.01"])
+    assert "Completed 4 jobs" in result.output
+    result = runner.invoke(app, ["sweep-status", "--queue", path])
+    assert "done: 4" in result.output and "'window': 10" in result.output
+
+
+def test_cli_keeps_the_chosen_journal_mode(tmp_path: Path) -> None:
+    path = str(tmp_path / "queue.db")
+    runner = CliRunner()
+    mode = ["--journal-mode", "delete"]
+    args = ["sweep-submit", "--queue", path, "--strategy", "sma", "--synthetic-bars", "200"]
+    assert runner.invoke(app, [*args, "--param", "fast=3,5", *mode]).exit_code == 0
+    result = runner.invoke(app, ["worker", "--queue", path, "--poll", "0.01", *mode])
+    assert "Completed 2 jobs" in result.output
+    assert runner.invoke(app, ["sweep-status", "--queue", path, *mode]).exit_code == 0
+    catalog = str(tmp_path / "catalog.db")
+    args = ["runs", "import-sweep", "--queue", path, "--catalog", catalog, *mode]
+    assert "Registered 2 runs" in runner.invoke(app, args).output
+    mode_now = sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode_now == "delete"
+
+    result = runner.invoke(app, ["worker", "--queue", path, "--journal-mode", "wal; DROP"])
+    assert result.exit_code != 0 and "journal mode must be one of" in result.output
+    with pytest.raises(ValueError, match="journal_mode"):
+        JobQueue(path, journal_mode="wal; DROP TABLE jobs")
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.loader import BinaryLoader
+from fluxbt.data.synthetic import SyntheticLoader
+
+
+def test_synthetic_ohlcv_is_consistent_and_seedable() -> None:
+    for model in ("gbm", "jump", "regime"):
+        df = SyntheticLoader(n_bars=2_000, model=model, freq="5min", seed=7).load()
+        DataFeed(df)  # validates index and columns
+        assert len(df) == 2_000
+        assert str(df.index.tz) == "UTC"
+        assert (df["high"] >= df[["open", "close"]].max(axis=1)).all()
+        assert (df["low"] <= df[["open", "close"]].min(axis=1)).all()
+        assert (df["volume"] > 0).all()
+        assert (df["open"].iloc[1:].values == df["close"].iloc[:-1].values).all()
+
+    a = SyntheticLoader(n_bars=1_000, model="regime", seed=1, chunk_size=333).load()
+    b = SyntheticLoader(n_bars=1_000, model="regime", seed=1).load()
+    assert (a.index == b.index).all()
+    assert np.allclose(a.to_numpy(), b.to_numpy())
+
+
+def test_synthetic_write_roundtrips_through_binary_loader(tmp_path: Path) -> None:
+    path = str(tmp_path)
+    gen = SyntheticLoader(n_bars=1_500, freq="B", tz="America/New_York", seed=3, chunk_size=400)
+    gen.write(path)
+    loaded = BinaryLoader(path).load()
+    expected = gen.load()
+    assert (loaded.index == expected.index).all()
+    assert str(loaded.index.tz) == "America/New_York"
+    assert np.allclose(loaded.to_numpy(), expected.to_numpy())
+
+
+def test_periods_per_year_needs_fixed_length_or_business_frequency() -> None:
+    assert len(SyntheticLoader(n_bars=3, freq="D", seed=1).load()) == 3
+    assert len(SyntheticLoader(n_bars=3, freq="B", seed=1).load()) == 3
+    with pytest.raises(ValueError, match="pass periods_per_year"):
+        SyntheticLoader(n_bars=3, freq="ME", seed=1).load()
+    assert len(SyntheticLoader(n_bars=3, freq="ME", seed=1, periods_per_year=12).load()) == 3
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import pytest
+
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.ticks import TickBarAggregator, TickBarLoader, aggregate_ticks
+from fluxbt.strategies.sma_crossover import SMACrossover
+
+
+def _ticks(n: int = 20_000, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    gaps = rng.exponential(2.0, n).cumsum()  # seconds, with some empty minutes
+    gaps[n // 2 :] += 600
+    return pd.DataFrame(
+        {
+            "ts": pd.Timestamp("2024-01-02 09:30", tz="UTC") + pd.to_timedelta(gaps, unit="s"),
+            "price": 100 + rng.normal(0, 0.05, n).cumsum(),
+            "qty": rng.integers(1, 50, n).astype(float),
+        }
+    )
+
+
+def _chunks(ticks: pd.DataFrame, size: int) -> list[pd.DataFrame]:
+    return [ticks.iloc[i : i + size] for i in range(0, len(ticks), size)]
+
+
+def _aggregate(ticks: pd.DataFrame, kind: str, size: str | float, chunk: int) -> pd.DataFrame:
+    agg = TickBarAggregator(kind, size)  # type: ignore[arg-type]
+    return pd.concat(list(aggregate_ticks(_chunks(ticks, chunk), agg)))
+
+
+def _naive_threshold_bars(
+    ticks: pd.DataFrame, measure: npt.NDArray[np.float64], size: float
+) -> pd.DataFrame:
+    rows, bar, cum = [], None, 0.0
+    for (ts, price, qty), m in zip(ticks.itertuples(index=False), measure, strict=True):
+        if bar is None:
+            bar = {"ts": ts, "open": price, "high": price, "low": price, "volume": 0.0}
+        bar.update(ts=ts, high=max(bar["high"], price), low=min(bar["low"], price), close=price)
+        bar["volume"] += qty
+        target = (np.floor(cum / size) + 1) * size
+        cum += m
+        if cum >= target:
+            rows.append(bar)
+            bar = None
+    if bar is not None:
+        rows.append(bar)
+    df = pd.DataFrame(rows).set_index("ts")
+    df.index = pd.DatetimeIndex(df.index, name="ts").as_unit("ns")
+    return df[["open", "high", "low", "close", "volume"]]
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 999, 100_000])
+def test_time_bars_match_resample_for_any_chunking(chunk: int) -> None:
+    ticks = _ticks(2_000 if chunk < 100 else 20_000)
+    bars = _aggregate(ticks, "time", "1min", chunk)
+    s = ticks.set_index("ts")
+    grouped = s.resample("1min", closed="left", label="right", origin="epoch")
+    expected = grouped["price"].ohlc().assign(volume=grouped["qty"].sum()).dropna()
+    expected.index = expected.index.as_unit("ns").rename("ts")
+    pd.testing.assert_frame_equal(bars, expected, check_freq=False)
+    assert bars.index.max() > s.index.max()  # stamped at interval end
+
+
+@pytest.mark.parametrize("kind,size", [("volume", 500.0), ("dollar", 75_000.0)])
+@pytest.mark.parametrize("chunk", [3, 1_000])
+def test_threshold_bars_match_naive_loop(kind: str, size: float, chunk: int) -> None:
+    ticks = _ticks(1_500 if chunk < 100 else 5_000, seed=1)
+    bars = _aggregate(ticks, kind, size, chunk)
+    measure = ticks["qty"].to_numpy()
+    if kind == "dollar":
+        measure = measure * ticks["price"].to_numpy()
+    pd.testing.assert_frame_equal(bars, _naive_threshold_bars(ticks, measure, size))
+
+
+def test_loader_feeds_engines_with_bounded_chunks(tmp_path: Path) -> None:
+    path = tmp_path / "ticks.csv"
+    ticks = _ticks()
+    ticks.to_csv(path, index=False)
+    loader = TickBarLoader(str(path), kind="time", size="1min", chunk_size=4_096)
+    bars = loader.load()
+    pd.testing.assert_frame_equal(bars, _aggregate(ticks, "time", "1min", 20_000))
+    assert len(list(loader.iter_chunks())) >= len(ticks) // 4_096
+
+    engine = BacktestEngine(feed=DataFeed(bars), broker=Broker(), strategy=SMACrossover(5, 20))
+    assert len(engine.run()) == len(bars)
+
+    async def collect() -> list[pd.Timestamp]:
+        return [ts async for ts, _ in loader.stream()]
+
+    assert asyncio.run(collect()) == list(bars.index)
+
+    with pytest.raises(ValueError, match="sorted"):
+        TickBarAggregator().update([2, 1], [1.0, 1.0], [1.0, 1.0])
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from fluxbt.data.loader import CSVLoader
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.data.universe import UniverseLoader
+
+
+def _write_csvs(directory: Path, n: int) -> None:
+    for i in range(n):
+        df = SyntheticLoader(n_bars=100 + i, freq="D", seed=i).load()
+        df.columns = ["Open", "High", "Low", "Close", "Volume"]
+        df.rename_axis("date").to_csv(directory / f"SYM{i:02d}.csv")
+    (directory / "BROKEN.csv").write_text("date,price\n2024-01-01,1.0\n")
+
+
+def test_csv_directory_loads_with_per_symbol_errors(tmp_path: Path) -> None:
+    _write_csvs(tmp_path, 12)
+    result = UniverseLoader.from_csv(str(tmp_path), max_workers=4).load()
+
+    assert list(result.errors) == ["BROKEN"]
+    assert "Missing required columns" in result.errors["BROKEN"]
+    assert list(result.frames) == [f"SYM{i:02d}" for i in range(12)]
+    expected = CSVLoader(str(tmp_path / "SYM03.csv")).load()
+    pd.testing.assert_frame_equal(result.frames["SYM03"], expected)
+
+    close = result.panel("close")
+    assert close.shape == (111, 12) and close["SYM00"].isna().sum() == 11
+    assert result.panel("close", join="inner").shape == (100, 12)
+    assert result.panel().columns.nlevels == 2
+    with pytest.raises(ValueError, match="BROKEN"):
+        result.raise_errors()
+
+    glob_result = UniverseLoader.from_csv(str(tmp_path / "SYM0*.csv")).load()
+    assert len(glob_result.frames) == 10 and not glob_result.errors
+
+
+def test_pluggable_fetch_runs_concurrently() -> None:
+    def fetch(symbol: str) -> pd.DataFrame:
+        time.sleep(0.05)
+        if symbol == "BAD":
+            raise ConnectionError("timed out")
+        df = SyntheticLoader(n_bars=50, freq="D", tz="America/New_York", seed=1).load()
+        return df.rename(columns={"close": "Adj Close", "volume": "v"})
+
+    symbols = [f"T{i}" for i in range(39)] + ["BAD"]
+    start = time.perf_counter()
+    result = UniverseLoader(symbols, fetch=fetch, max_workers=20).load()
+    assert time.perf_counter() - start < 20 * 0.05
+    assert result.errors == {"BAD": "ConnectionError: timed out"}
+    frame = result.frames["T0"]
+    assert list(frame.columns) == ["open", "high", "low", "close", "volume"]
+    assert str(frame.index.tz) == "UTC"
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from fluxbt.cli import app
+from fluxbt.core.broker import Broker
+from fluxbt.core.engine import BacktestEngine
+from fluxbt.data.feed import DataFeed
+from fluxbt.data.synthetic import SyntheticLoader
+from fluxbt.strategies.sma_crossover import SMACrossover
+from fluxbt.sweep import UniverseBacktest
+
+# different lengths, so the symbols cover different periods of the union index
+FRAMES = {
+    f"S{i}": SyntheticLoader(n_bars=200 + 40 * i, freq="D", tz="UTC", seed=i).load()
+    for i in range(5)
+}
+PARAMS: dict[str, object] = {"fast": 5, "slow": 20}
+
+
+def test_parallel_run_matches_serial_and_single_engines() -> None:
+    weights = {"S0": 1.0, "S1": 1.0, "S2": 2.0, "S4": 4.0}
+    serial = UniverseBacktest(SMACrossover, FRAMES, PARAMS, weights=weights, workers=1).run()
+    parallel = UniverseBacktest(SMACrossover, FRAMES, PARAMS, weights=weights, workers=2).run()
+    pd.testing.assert_frame_equal(parallel.equity, serial.equity)
+    pd.testing.assert_frame_equal(parallel.metrics, serial.metrics)
+
+    assert parallel.weights == {"S0": 0.125, "S1": 0.125, "S2": 0.25, "S4": 0.5}
+    assert list(parallel.equity.columns) == list(weights)
+    engine = BacktestEngine(
+        feed=DataFeed(FRAMES["S2"]),
+        broker=Broker(),
+        strategy=SMACrossover(5, 20),
+        initial_cash=25_000.0,
+    )
+    hist = engine.run()
+    np.testing.assert_array_equal(
+        parallel.equity["S2"].dropna().to_numpy(), hist["equity"].to_numpy()
+    )
+    assert parallel.metrics.loc["S2", "fills"] == len(engine.fills)
+
+    # sleeves hold cash before their first bar and their last value after their last
+    assert parallel.combined.iloc[0] == pytest.approx(100_000.0)
+    last = {s: parallel.equity[s].dropna().iloc[-1] for s in weights}
+    assert parallel.combined.iloc[-1] == pytest.approx(sum(last.values()))
+    assert len(parallel.combined) == len(FRAMES["S4"])
+
+
+def test_failed_symbol_stays_in_cash(tmp_path: Path) -> None:
+    frames = {**FRAMES, "BAD": FRAMES["S0"].drop(columns="volume")}
+    result = UniverseBacktest(SMACrossover, frames, PARAMS, workers=2).run()
+    assert list(result.errors) == ["BAD"] and "volume" in result.errors["BAD"]
+    assert "BAD" not in result.equity.columns
+    assert result.combined.iloc[0] == pytest.approx(100_000.0)
+
+    result.write(str(tmp_path))
+    curves = pd.read_csv(tmp_path / "equity.csv", index_col="timestamp")
+    assert list(curves.columns) == ["combined", *FRAMES]
+    assert len(pd.read_csv(tmp_path / "metrics.csv")) == len(FRAMES)
+    summary = json.loads((tmp_path / "universe.json").read_text())
+    assert summary["weights"]["BAD"] == pytest.approx(1 / 6)
+
+    with pytest.raises(ValueError, match="without data"):
+        UniverseBacktest(SMACrossover, FRAMES, weights={"NOPE": 1.0})
+
+
+def test_cli_universe(tmp_path: Path) -> None:
+    data = tmp_path / "data"
+    data.mkdir()
+    for symbol, df in FRAMES.items():
+        df.to_csv(data / f"{symbol}.csv", index_label="timestamp")
+    args = ["universe", "--strategy", "sma", "--param", "fast=5", "--param", "slow=20"]
+    args += ["--csv-dir", str(data), "--weight", "S0=3", "--weight", "S1=1"]
+    args += ["--workers", "2", "--top", "2", "--out", str(tmp_path / "out")]
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert "Portfolio of 2 symbols:" in result.output and "weight=0.7500" in result.output
+    assert (tmp_path / "out" / "metrics.csv").exists()
+
+    bad = CliRunner().invoke(app, [*args[:5], "--param", "fast=5,10", "--csv-dir", str(data)])
+    assert bad.exit_code != 0 and "one value" in bad.output